@@ -0,0 +1,407 @@
+"""
+EduBoost Sharded Accuracy Evaluation
+Model-quality checks over millions of rows, split across a process pool
+
+The cohort is cut into fixed-size shards. A worker loads one shard at a
+time, scores it with the rule-based system or the exported .ebm model and
+returns only counts: a confusion matrix per module plus per-bin calibration
+sums, with the seconds it spent in each stage. The parent adds the partials
+up and derives accuracy, precision, recall, F1 and specificity from the
+merged counts, so the numbers do not depend on how many workers ran.
+
+Synthetic shards are generated from (seed, shard index) and get a uniformly
+drawn module each, so a run is reproducible for a given --shard-rows.
+Database shards are rowid ranges of student_performance, with the recorded
+failed_module outcome as the ground truth.
+
+Usage:
+    python accuracy_eval.py --rows 5000000
+    python accuracy_eval.py --rows 2000000 --scorer model --workers 4
+    python accuracy_eval.py --source database --db eduboost.db
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+import feature_transform
+from synthetic_cohort import ACCURACY_PROFILES, MODULES, generate_accuracy_samples
+
+DEFAULT_SHARD_ROWS = 250_000
+DEFAULT_BINS = 10
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model',
+                                  'eduboost_ultra_accuracy_model.ebm')
+
+# Rule points at or above this are predicted at risk; confidence is points / RULE_SCORE_SCALE
+RULE_THRESHOLD = 3.0
+RULE_SCORE_SCALE = 6.0
+
+# Same cut-off as app.MODEL_RISK_THRESHOLD
+MODEL_THRESHOLD = 0.5
+
+# student_performance columns in feature_transform.BASE_FEATURES order
+PERFORMANCE_COLUMNS = (
+    'module_difficulty', 'current_gpa', 'avg_assessment_score',
+    'assignments_late', 'num_submission_attempts', 'login_frequency'
+)
+
+Shard = namedtuple('Shard', 'index start stop')
+
+# Settings and loaded model of the current worker process (see _init_worker)
+_worker = {}
+
+
+# =============================================================================
+# SCORING
+# =============================================================================
+
+def _ladder(conditions, points):
+    """Points of the first matching if/elif branch, 0 when none matches"""
+    return np.select(conditions, points, default=0.0)
+
+
+def rule_based_predictions(columns):
+    """Vectorized optimized rule-based system of final_accuracy_analysis.py.
+
+    Returns (int8 predictions, confidence in [0, 1]) for the basic feature
+    columns (a DataFrame or a dict of arrays).
+    """
+    difficulty = np.asarray(columns['Module_Difficulty'], dtype=np.float64)
+    gpa = np.asarray(columns['Current_GPA'], dtype=np.float64)
+    assessment = np.asarray(columns['Avg_Assessment_Score'], dtype=np.float64)
+    late = np.asarray(columns['Assignments_Late'], dtype=np.float64)
+    attempts = np.asarray(columns['Num_Submission_Attempts'], dtype=np.float64)
+    logins = np.asarray(columns['Login_Frequency'], dtype=np.float64)
+
+    risk_score = (
+        _ladder([gpa < 2.0, gpa < 2.5, gpa < 3.0], [3.5, 2.5, 1.0])
+        + _ladder([assessment < 50, assessment < 60, assessment < 70], [3.0, 2.0, 1.0])
+        + _ladder([late >= 4, late >= 2, late >= 1], [2.5, 1.5, 0.5])
+        + _ladder([logins < 8, logins < 12, logins < 18], [2.0, 1.0, 0.5])
+        # Interaction effects
+        + np.where((difficulty > 4) & (gpa < 2.8), 1.5, 0.0)
+        + np.where((late > 2) & (gpa < 2.5), 1.0, 0.0)
+        # Submission efficiency
+        + np.where(attempts > 3, 0.5, 0.0)
+    )
+    predictions = (risk_score >= RULE_THRESHOLD).astype(np.int8)
+    return predictions, np.minimum(risk_score / RULE_SCORE_SCALE, 1.0)
+
+
+def _score(columns):
+    """(predictions, P(at risk)) for one shard with the configured scorer"""
+    if _worker['scorer'] == 'rules':
+        return rule_based_predictions(columns)
+
+    from inference_service import positive_probabilities
+    probabilities = positive_probabilities(_worker['model'], feature_transform.transform(columns))
+    return (probabilities >= _worker['threshold']).astype(np.int8), probabilities
+
+
+# =============================================================================
+# SHARDS
+# =============================================================================
+
+def _synthetic_shard(shard):
+    """Columns, labels, module codes and skipped-row count of a synthetic shard"""
+    size = shard.stop - shard.start
+    seed = _worker['seed']
+    columns, labels = generate_accuracy_samples(size, _worker['profile'], seed=[seed, shard.index])
+    modules = np.random.default_rng([seed, shard.index, 1]).integers(len(_worker['modules']), size=size)
+    return columns, labels, modules, 0
+
+
+def _database_shard(shard):
+    """Columns, labels, module codes and skipped-row count of the student_performance rows in a rowid range.
+
+    Rows without a recorded outcome have no ground truth and are left out;
+    rows with a NULL feature cannot be scored and are counted as skipped.
+    """
+    with sqlite3.connect(f"file:{_worker['db_path']}?mode=ro", uri=True) as conn:
+        rows = conn.execute(f'''
+            SELECT module_name, failed_module, {', '.join(PERFORMANCE_COLUMNS)}
+            FROM student_performance
+            WHERE rowid >= ? AND rowid < ? AND failed_module IS NOT NULL
+        ''', (shard.start, shard.stop)).fetchall()
+
+    if not rows:
+        return None
+    values = list(zip(*rows))
+    codes = {name: code for code, name in enumerate(_worker['modules'])}
+    columns = {name: np.asarray(values[2 + i], dtype=np.float64)
+               for i, name in enumerate(feature_transform.BASE_FEATURES)}
+    labels = np.asarray(values[1], dtype=np.int8)
+    modules = np.fromiter((codes[name] for name in values[0]), dtype=np.int64, count=len(rows))
+
+    # NULL features arrive as NaN; keep them out of the scores and calibration bins
+    complete = np.logical_and.reduce([np.isfinite(column) for column in columns.values()])
+    skipped = len(rows) - int(complete.sum())
+    if skipped:
+        columns = {name: column[complete] for name, column in columns.items()}
+        labels, modules = labels[complete], modules[complete]
+    return columns, labels, modules, skipped
+
+
+def _init_worker(settings):
+    """Keep the run settings (and the memory-mapped model) for every shard of this process"""
+    _worker.clear()
+    _worker.update(settings)
+    if settings['scorer'] == 'model':
+        import model_artifact
+        _worker['model'] = model_artifact.load_artifact(settings['model_path'])
+
+
+def evaluate_shard(shard) -> Dict:
+    """Partial counts and stage timings of one shard"""
+    timings = {}
+    started = time.perf_counter()
+    loaded = _synthetic_shard(shard) if _worker['source'] == 'synthetic' else _database_shard(shard)
+    timings['load'] = time.perf_counter() - started
+
+    module_count, bins = len(_worker['modules']), _worker['bins']
+    if loaded is None:
+        return empty_partial(module_count, bins, timings)
+    columns, labels, modules, skipped = loaded
+    if not len(labels):
+        return dict(empty_partial(module_count, bins, timings), skipped_rows=skipped)
+
+    started = time.perf_counter()
+    predictions, probabilities = _score(columns)
+    timings['score'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    # Cell = module * 4 + label * 2 + prediction, i.e. [tn, fp, fn, tp] per module
+    cells = modules * 4 + labels.astype(np.int64) * 2 + predictions
+    bin_index = np.minimum((probabilities * bins).astype(np.int64), bins - 1)
+    partial = {
+        'rows': len(labels),
+        'skipped_rows': skipped,
+        'confusion': np.bincount(cells, minlength=module_count * 4).reshape(module_count, 4),
+        'bin_rows': np.bincount(bin_index, minlength=bins),
+        'bin_probability': np.bincount(bin_index, weights=probabilities, minlength=bins),
+        'bin_positives': np.bincount(bin_index, weights=labels, minlength=bins),
+        'timings': timings
+    }
+    timings['reduce'] = time.perf_counter() - started
+    return partial
+
+
+def empty_partial(module_count, bins, timings=None) -> Dict:
+    return {
+        'rows': 0,
+        'skipped_rows': 0,
+        'confusion': np.zeros((module_count, 4), dtype=np.int64),
+        'bin_rows': np.zeros(bins, dtype=np.int64),
+        'bin_probability': np.zeros(bins),
+        'bin_positives': np.zeros(bins),
+        'timings': dict(timings or {})
+    }
+
+
+def merge_partials(partials: Iterable[Dict], module_count, bins) -> Dict:
+    """Sum shard partials; stage timings become total worker seconds per stage"""
+    merged = empty_partial(module_count, bins)
+    for partial in partials:
+        for key in ('rows', 'skipped_rows', 'confusion', 'bin_rows', 'bin_probability', 'bin_positives'):
+            merged[key] = merged[key] + partial[key]
+        for stage, seconds in partial['timings'].items():
+            merged['timings'][stage] = merged['timings'].get(stage, 0.0) + seconds
+    return merged
+
+
+# =============================================================================
+# METRICS
+# =============================================================================
+
+def classification_metrics(tn, fp, fn, tp) -> Dict:
+    """The metrics of final_accuracy_analysis.py from one confusion matrix"""
+    tn, fp, fn, tp = int(tn), int(fp), int(fn), int(tp)
+    total = tn + fp + fn + tp
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0
+    return {
+        'samples': total,
+        'accuracy': (tp + tn) / total if total else 0,
+        'precision': precision,
+        'recall': recall,
+        'specificity': tn / (tn + fp) if (tn + fp) > 0 else 0,
+        'f1_score': 2 * (precision * recall) / (precision + recall) if (precision + recall) > 0 else 0,
+        'risk_rate': (tp + fn) / total * 100 if total else 0,
+        'confusion_matrix': [[tn, fp], [fn, tp]]
+    }
+
+
+def calibration_table(merged) -> List[Dict]:
+    """Mean predicted probability vs observed at-risk rate per probability bin"""
+    bins = len(merged['bin_rows'])
+    table = []
+    for i, count in enumerate(merged['bin_rows'].tolist()):
+        table.append({
+            'lower': i / bins,
+            'upper': (i + 1) / bins,
+            'samples': count,
+            'mean_predicted': merged['bin_probability'][i] / count if count else None,
+            'observed_rate': merged['bin_positives'][i] / count if count else None
+        })
+    return table
+
+
+def summarize(merged, modules: List[str]) -> Dict:
+    overall = classification_metrics(*merged['confusion'].sum(axis=0))
+    calibration = calibration_table(merged)
+    total = max(merged['rows'], 1)
+    overall['expected_calibration_error'] = sum(
+        row['samples'] / total * abs(row['mean_predicted'] - row['observed_rate'])
+        for row in calibration if row['samples']
+    )
+    overall['calibration'] = calibration
+    overall['modules'] = {
+        name: classification_metrics(*counts)
+        for name, counts in zip(modules, merged['confusion'].tolist()) if sum(counts)
+    }
+    return overall
+
+
+# =============================================================================
+# RUN
+# =============================================================================
+
+def plan_shards(settings, rows, shard_rows) -> List[Shard]:
+    """Synthetic shards cover [0, rows); database shards cover the table's rowid range"""
+    if settings['source'] == 'synthetic':
+        return [Shard(i, start, min(start + shard_rows, rows))
+                for i, start in enumerate(range(0, rows, shard_rows))]
+
+    with sqlite3.connect(f"file:{settings['db_path']}?mode=ro", uri=True) as conn:
+        low, high = conn.execute('SELECT MIN(rowid), MAX(rowid) FROM student_performance').fetchone()
+    if low is None:
+        return []
+    return [Shard(i, start, start + shard_rows) for i, start in enumerate(range(low, high + 1, shard_rows))]
+
+
+def database_modules(db_path) -> List[str]:
+    with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as conn:
+        return [row[0] for row in conn.execute(
+            'SELECT DISTINCT module_name FROM student_performance ORDER BY module_name')]
+
+
+def evaluate(settings, rows=1_000_000, shard_rows=DEFAULT_SHARD_ROWS, workers=None) -> Dict:
+    """Evaluate the configured scorer over all shards and return the merged results.
+
+    `settings` holds source ('synthetic' or 'database'), scorer ('rules' or
+    'model'), modules, bins and the source/scorer options (profile, seed,
+    db_path, model_path, threshold). workers=1 runs in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    timings = {}
+
+    started = time.perf_counter()
+    shards = plan_shards(settings, rows, shard_rows)
+    timings['plan'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if workers == 1 or len(shards) <= 1:
+        _init_worker(settings)
+        partials = map(evaluate_shard, shards)
+        merged = merge_partials(partials, len(settings['modules']), settings['bins'])
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards)), initializer=_init_worker,
+                                 initargs=(settings,)) as executor:
+            partials = executor.map(evaluate_shard, shards)
+            merged = merge_partials(partials, len(settings['modules']), settings['bins'])
+    timings['evaluate'] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = summarize(merged, settings['modules'])
+    timings['summarize'] = time.perf_counter() - started
+
+    wall_seconds = sum(timings.values())
+    results.update({
+        'timestamp': datetime.now().isoformat(),
+        'source': settings['source'],
+        'scorer': settings['scorer'],
+        'shards': len(shards),
+        'shard_rows': shard_rows,
+        'skipped_rows': merged['skipped_rows'],
+        'workers': workers,
+        'timings_seconds': {
+            'wall': timings,
+            'worker_total': merged['timings']
+        },
+        'rows_per_second': merged['rows'] / wall_seconds if wall_seconds else None
+    })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sharded, multi-process accuracy evaluation')
+    parser.add_argument('--source', choices=('synthetic', 'database'), default='synthetic', help='Cohort to evaluate')
+    parser.add_argument('--rows', type=int, default=1_000_000, help='Synthetic cohort size')
+    parser.add_argument('--profile', choices=ACCURACY_PROFILES, default='realistic', help='Synthetic data profile')
+    parser.add_argument('--seed', type=int, default=42, help='Synthetic data seed')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'eduboost.db'),
+                        help='Database for --source database (opened read-only)')
+    parser.add_argument('--scorer', choices=('rules', 'model'), default='rules', help='Rule-based system or .ebm model')
+    parser.add_argument('--model', default=DEFAULT_MODEL_PATH, help='Model artifact for --scorer model')
+    parser.add_argument('--threshold', type=float, default=MODEL_THRESHOLD, help='Model probability cut-off')
+    parser.add_argument('--shard-rows', type=int, default=DEFAULT_SHARD_ROWS, help='Rows per shard')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--bins', type=int, default=DEFAULT_BINS, help='Calibration bins')
+    parser.add_argument('--output', default='sharded_accuracy_results.json', help='Results JSON path')
+    args = parser.parse_args(argv)
+
+    settings = {
+        'source': args.source,
+        'scorer': args.scorer,
+        'profile': args.profile,
+        'seed': args.seed,
+        'db_path': args.db,
+        'model_path': args.model,
+        'threshold': args.threshold,
+        'bins': args.bins,
+        'modules': database_modules(args.db) if args.source == 'database' else list(MODULES)
+    }
+
+    print("=" * 60)
+    print("EduBoost Sharded Accuracy Evaluation")
+    print("=" * 60)
+    results = evaluate(settings, args.rows, args.shard_rows, args.workers)
+    if not results['samples']:
+        print("⚠️ No rows to evaluate")
+        return 1
+
+    wall = results['timings_seconds']['wall']
+    print(f"📊 {results['samples']:,} rows ({results['source']}, scored by {results['scorer']}) "
+          f"in {results['shards']} shards on {results['workers']} workers")
+    print(f"   Accuracy {results['accuracy']:.3f} | Precision {results['precision']:.3f} | "
+          f"Recall {results['recall']:.3f} | F1 {results['f1_score']:.3f} | "
+          f"Specificity {results['specificity']:.3f}")
+    if results['skipped_rows']:
+        print(f"⚠️ {results['skipped_rows']:,} rows with NULL features were skipped")
+    print(f"   Expected calibration error: {results['expected_calibration_error']:.3f}")
+    print("📚 Accuracy by module:")
+    for name, metrics in results['modules'].items():
+        print(f"   {name[:40]:40s} {metrics['accuracy']:.3f} ({metrics['samples']:,} rows)")
+    print(f"⏱️ plan {wall['plan']:.2f}s | evaluate {wall['evaluate']:.2f}s | summarize {wall['summarize']:.3f}s "
+          f"({results['rows_per_second']:,.0f} rows/s)")
+    print("   Worker seconds: " + ' | '.join(
+        f"{stage} {seconds:.2f}s" for stage, seconds in results['timings_seconds']['worker_total'].items()))
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"💾 Results saved to '{args.output}'")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,23 +11,35 @@ Database Schema: Enhanced student performance tracking with 14 core fields
 AI Models: Performance analysis, goal generation, resource recommendation
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Blueprint, Flask, Response, current_app, has_app_context, request, jsonify
 from flask_cors import CORS
-import pandas as pd
-import pickle
 import os
 import numpy as np
 from datetime import datetime, timedelta
+from functools import cached_property
 import random
 import json
 import sqlite3
 from typing import Dict, List, Optional
-import uuid
-import requests
 import sys
-
-# Add the edu health model directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'edu health model'))
+import threading
+from db_pool import get_pool
+from migrations import apply_migrations, schema_version
+import risk_engine
+import performance_ingest
+import synthetic_cohort
+import goal_store
+import feedback_ingest
+import resource_index
+import resource_search
+import feature_transform
+import model_artifact
+from inference_service import InferenceService
+from job_queue import JobQueue
+from model_registry import model_registry, ModelNotAvailableError
+from resource_catalog import RECOMMENDATION_CATEGORIES, ResourceCatalog
+from resource_client import get_resource_client, ResourceFetchError
+from student_cache import StudentCache
 
 # Utility function to get the database path
 def get_db_path():
@@ -35,123 +47,48 @@ def get_db_path():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(script_dir, 'eduboost.db')
 
-try:
+def get_db_pool():
+    """Get the connection pool of the current app's database (migrated on first use)"""
+    return current_services().db_pool
+
+ULTRA_ACCURACY_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'model', 'eduboost_ultra_accuracy_model.pkl')
+
+HEALTH_MODEL_DIR = os.path.join(os.path.dirname(__file__), '..', 'edu health model')
+HEALTH_MODEL_PATH = os.path.join(HEALTH_MODEL_DIR, 'eduboost_health_recommendation_model.pkl')
+
+def load_health_model(path):
+    """Import the health model package (kept outside this directory) and load the pickle"""
+    if HEALTH_MODEL_DIR not in sys.path:
+        sys.path.append(HEALTH_MODEL_DIR)
     from eduboost_health_model import EduBoostHealthModel
-    HEALTH_MODEL_AVAILABLE = True
-except ImportError as e:
-    print(f"Warning: Health model not available: {e}")
-    HEALTH_MODEL_AVAILABLE = False
+    return EduBoostHealthModel(model_path=path, verbose=False)
+
+# Loaded once per process on first use (or at startup with warm-up), reloaded when the file changes
+model_registry.register('ultra_accuracy', *model_artifact.model_source(ULTRA_ACCURACY_MODEL_PATH))
+model_registry.register('health', HEALTH_MODEL_PATH, load_health_model)
 
-# Initialize Flask app
-app = Flask(__name__)
+def load_risk_model():
+    """The trained at-risk model, or None to use the rule-based system"""
+    try:
+        return model_registry.get('ultra_accuracy')
+    except ModelNotAvailableError:
+        return None
 
-# Configure CORS to allow requests from Next.js frontend
-CORS(app, origins=["http://localhost:3000", "http://192.168.24.69:3000"], supports_credentials=True)
+# Settings accepted by create_app(config)
+DEFAULT_CONFIG = {
+    'DATABASE_PATH': get_db_path(),
+    'CORS_ORIGINS': ["http://localhost:3000", "http://192.168.24.69:3000"]
+}
 
 # =============================================================================
 # DATABASE SETUP AND MODELS
 # =============================================================================
 
-def initialize_database():
-    """Initialize SQLite database with enhanced schema"""
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
-    
-    # Student Performance Table (Enhanced with 14 fields)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS student_performance (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id TEXT NOT NULL,
-            module_name TEXT NOT NULL,
-            module_difficulty REAL,
-            current_gpa REAL,
-            avg_assessment_score INTEGER,
-            assignments_late INTEGER,
-            num_submission_attempts INTEGER,
-            login_frequency INTEGER,
-            attendance_rate REAL,
-            lab_completion_rate REAL,
-            participation_score INTEGER,
-            failed_module INTEGER,
-            semester TEXT,
-            risk_score REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Lecturer Feedback Table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS lecturer_feedback (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id TEXT NOT NULL,
-            module_name TEXT NOT NULL,
-            lecturer_id TEXT NOT NULL,
-            feedback_text TEXT,
-            weak_areas TEXT, -- JSON string
-            strength_areas TEXT, -- JSON string
-            recommended_actions TEXT, -- JSON string
-            urgency_level INTEGER CHECK (urgency_level BETWEEN 1 AND 5),
-            improvement_timeline TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Student Goals Table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS student_goals (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            goal_id TEXT UNIQUE NOT NULL,
-            student_id TEXT NOT NULL,
-            module_name TEXT,
-            goal_title TEXT NOT NULL,
-            goal_description TEXT,
-            goal_type TEXT, -- "skill_improvement", "assignment_completion", "resource_study"
-            priority_level TEXT, -- "high", "medium", "low"
-            target_completion_date DATE,
-            current_progress INTEGER DEFAULT 0, -- 0-100%
-            is_completed BOOLEAN DEFAULT FALSE,
-            generated_by TEXT DEFAULT 'ai', -- "ai", "lecturer", "student"
-            success_criteria TEXT, -- JSON string
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Learning Resources Table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS learning_resources (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            module_name TEXT NOT NULL,
-            resource_type TEXT, -- "book", "online", "video", "practice", "tutorial"
-            resource_title TEXT NOT NULL,
-            resource_url TEXT,
-            resource_author TEXT,
-            difficulty_level INTEGER CHECK (difficulty_level BETWEEN 1 AND 5),
-            topic_tags TEXT, -- JSON string
-            rating REAL,
-            estimated_hours INTEGER,
-            description TEXT,
-            is_free BOOLEAN DEFAULT TRUE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Goal Resources Mapping
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS goal_resources (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            goal_id TEXT NOT NULL,
-            resource_id INTEGER,
-            relevance_score REAL,
-            recommended_by TEXT DEFAULT 'ai',
-            FOREIGN KEY (resource_id) REFERENCES learning_resources (id)
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
-    print("✅ Database initialized successfully")
+def initialize_database(pool):
+    """Initialize SQLite database by applying pending schema migrations"""
+    with pool.connection() as conn:
+        apply_migrations(conn)
+        print(f"✅ Database initialized successfully (schema v{schema_version(conn)})")
 
 # =============================================================================
 # ENHANCED AI SYSTEM
@@ -161,7 +98,6 @@ class EnhancedEduBoostAI:
     """Enhanced AI system for comprehensive educational support"""
     
     def __init__(self):
-        self.model = None
         self.modules_list = [
             "Introduction to Computer Science",
             "Mathematics for Computing", 
@@ -174,51 +110,35 @@ class EnhancedEduBoostAI:
             "Electronics and Computer System Architecture",
             "Database Management"
         ]
-        self.load_model()
         self.initialize_resources()
     
-    def load_model(self):
-        """Load the machine learning model"""
-        try:
-            # Get the directory where this script is located
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            model_path = os.path.join(script_dir, 'model', 'eduboost_ultra_accuracy_model.pkl')
-            with open(model_path, 'rb') as f:
-                self.model = pickle.load(f)
-            print("✅ Enhanced ML model loaded successfully")
-        except Exception as e:
-            print(f"⚠️ Model loading failed: {e}")
-            print("Using enhanced rule-based prediction system")
-            self.model = None
+    @property
+    def model(self):
+        """The trained ML model (unpickled on first use), or None to use the rule-based system"""
+        return load_risk_model()
     
     def initialize_resources(self):
         """Initialize comprehensive resource database"""
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        # Check if resources already exist
-        cursor.execute("SELECT COUNT(*) FROM learning_resources")
-        count = cursor.fetchone()[0]
-        
-        if count == 0:
-            resources = self.get_comprehensive_resources()
-            for resource in resources:
-                cursor.execute('''
+        with get_db_pool().transaction() as cursor:
+            # Check if resources already exist
+            cursor.execute("SELECT COUNT(*) FROM learning_resources")
+            count = cursor.fetchone()[0]
+            
+            if count == 0:
+                resources = self.get_comprehensive_resources()
+                cursor.executemany('''
                     INSERT INTO learning_resources 
                     (module_name, resource_type, resource_title, resource_url, resource_author,
                      difficulty_level, topic_tags, rating, estimated_hours, description, is_free)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                ''', [(
                     resource['module_name'], resource['resource_type'], resource['resource_title'],
                     resource['resource_url'], resource['resource_author'], resource['difficulty_level'],
                     json.dumps(resource['topic_tags']), resource['rating'], resource['estimated_hours'],
                     resource['description'], resource['is_free']
-                ))
-            
-            conn.commit()
-            print("✅ Resource database initialized")
-        
-        conn.close()
+                ) for resource in resources])
+                
+                print("✅ Resource database initialized")
     
     def get_comprehensive_resources(self):
         """Get comprehensive learning resources for all modules"""
@@ -330,7 +250,7 @@ class EnhancedEduBoostAI:
         
         return resources
     
-    def analyze_comprehensive_performance(self, performance_data):
+    def analyze_comprehensive_performance(self, performance_data, module_risks=None):
         """Enhanced performance analysis with 14-field data"""
         analysis = {
             'overall_risk_level': 'low',
@@ -346,8 +266,11 @@ class EnhancedEduBoostAI:
         total_risk = 0
         module_count = len(performance_data)
         
-        for module_data in performance_data:
-            module_risk = self.calculate_module_risk(module_data)
+        # Score every module in one vectorized pass (unless already scored by the caller)
+        if module_risks is None:
+            module_risks = self.calculate_module_risks(performance_data)
+        
+        for module_data, module_risk in zip(performance_data, module_risks):
             total_risk += module_risk['risk_score']
             
             if module_risk['risk_level'] == 'high':
@@ -382,82 +305,15 @@ class EnhancedEduBoostAI:
     
     def calculate_module_risk(self, module_data):
         """Calculate comprehensive risk score for a module"""
-        risk_factors = []
-        risk_score = 0
-        
-        # Academic performance factors
-        if module_data['avg_assessment_score'] < 40:
-            risk_factors.append('Very Low Assessment Scores')
-            risk_score += 0.3
-        elif module_data['avg_assessment_score'] < 50:
-            risk_factors.append('Low Assessment Scores')
-            risk_score += 0.2
-        elif module_data['avg_assessment_score'] < 60:
-            risk_factors.append('Below Average Assessment Scores')
-            risk_score += 0.1
-        
-        # GPA factors
-        if module_data['current_gpa'] < 2.0:
-            risk_factors.append('Very Low GPA')
-            risk_score += 0.25
-        elif module_data['current_gpa'] < 2.5:
-            risk_factors.append('Low GPA')
-            risk_score += 0.15
-        
-        # Behavioral factors
-        if module_data['attendance_rate'] < 60:
-            risk_factors.append('Poor Attendance')
-            risk_score += 0.2
-        elif module_data['attendance_rate'] < 75:
-            risk_factors.append('Low Attendance')
-            risk_score += 0.1
-        
-        if module_data['lab_completion_rate'] < 50:
-            risk_factors.append('Poor Lab Completion')
-            risk_score += 0.15
-        
-        if module_data['participation_score'] < 40:
-            risk_factors.append('Low Participation')
-            risk_score += 0.1
-        
-        # Submission patterns
-        if module_data['assignments_late'] >= 3:
-            risk_factors.append('Frequent Late Submissions')
-            risk_score += 0.15
-        elif module_data['assignments_late'] >= 1:
-            risk_factors.append('Some Late Submissions')
-            risk_score += 0.05
-        
-        if module_data['num_submission_attempts'] > 3:
-            risk_factors.append('Multiple Submission Attempts')
-            risk_score += 0.1
-        
-        # Engagement factors
-        if module_data['login_frequency'] < 5:
-            risk_factors.append('Very Low Engagement')
-            risk_score += 0.15
-        elif module_data['login_frequency'] < 10:
-            risk_factors.append('Low Engagement')
-            risk_score += 0.1
-        
-        # Failed module history
-        if module_data['failed_module'] > 0:
-            risk_factors.append('Previous Module Failure')
-            risk_score += 0.2
-        
-        # Determine risk level
-        if risk_score > 0.6:
-            risk_level = 'high'
-        elif risk_score > 0.3:
-            risk_level = 'medium'
-        else:
-            risk_level = 'low'
+        return self.calculate_module_risks([module_data])[0]
+    
+    def calculate_module_risks(self, performance_data):
+        """Calculate module risk for a list of modules in one vectorized pass"""
+        if not performance_data:
+            return []
         
-        return {
-            'risk_score': min(risk_score, 1.0),
-            'risk_level': risk_level,
-            'risk_factors': risk_factors
-        }
+        columns = risk_engine.columns_from_records(performance_data)
+        return risk_engine.module_risk_records(risk_engine.assess_module_risk(columns))
     
     def generate_module_specific_suggestions(self, module_data, module_risk):
         """Generate specific improvement suggestions based on module and risk factors"""
@@ -509,9 +365,12 @@ class EnhancedEduBoostAI:
         
         return suggestions
     
-    def generate_intelligent_goals(self, student_id, performance_data, lecturer_feedback=None):
-        """Generate AI-powered personalized goals"""
-        analysis = self.analyze_comprehensive_performance(performance_data)
+    def generate_intelligent_goals(self, student_id, performance_data, lecturer_feedback=None, student_analysis=None,
+                                   max_goals=goal_store.MAX_GOALS):
+        """Generate AI-powered personalized goals (max_goals=None returns every candidate)"""
+        if student_analysis is None:
+            student_analysis = StudentAnalysis(self, performance_data)
+        analysis = student_analysis.comprehensive
         goals = []
         
         # Priority 1: Address failing modules (High Priority)
@@ -522,7 +381,6 @@ class EnhancedEduBoostAI:
             if module_name == 'Database Management':
                 goals.extend([
                     {
-                        'goal_id': str(uuid.uuid4()),
                         'student_id': student_id,
                         'module_name': module_name,
                         'goal_title': 'Master SQL Query Writing',
@@ -538,7 +396,6 @@ class EnhancedEduBoostAI:
                         ])
                     },
                     {
-                        'goal_id': str(uuid.uuid4()),
                         'student_id': student_id,
                         'module_name': module_name,
                         'goal_title': 'Understand Database Normalization',
@@ -557,7 +414,6 @@ class EnhancedEduBoostAI:
             
             elif module_name == 'Programming Fundamentals':
                 goals.append({
-                    'goal_id': str(uuid.uuid4()),
                     'student_id': student_id,
                     'module_name': module_name,
                     'goal_title': 'Improve Problem-Solving Skills',
@@ -576,7 +432,6 @@ class EnhancedEduBoostAI:
         # Priority 2: At-risk modules (Medium Priority)
         for at_risk_module in analysis['at_risk_modules']:
             goals.append({
-                'goal_id': str(uuid.uuid4()),
                 'student_id': student_id,
                 'module_name': at_risk_module,
                 'goal_title': f'Strengthen {at_risk_module} Foundation',
@@ -595,7 +450,6 @@ class EnhancedEduBoostAI:
         # Priority 3: General improvement goals (Low Priority)
         if analysis['overall_risk_level'] in ['medium', 'high']:
             goals.append({
-                'goal_id': str(uuid.uuid4()),
                 'student_id': student_id,
                 'module_name': 'General',
                 'goal_title': 'Improve Study Habits',
@@ -618,7 +472,6 @@ class EnhancedEduBoostAI:
                     weak_areas = json.loads(feedback['weak_areas']) if isinstance(feedback['weak_areas'], str) else feedback['weak_areas']
                     for weak_area in weak_areas:
                         goals.append({
-                            'goal_id': str(uuid.uuid4()),
                             'student_id': student_id,
                             'module_name': feedback['module_name'],
                             'goal_title': f'Improve {weak_area}',
@@ -630,14 +483,14 @@ class EnhancedEduBoostAI:
                             'success_criteria': json.dumps(json.loads(feedback['recommended_actions']) if isinstance(feedback['recommended_actions'], str) else feedback['recommended_actions'])
                         })
         
-        return goals[:6]  # Limit to 6 goals maximum
+        # Stable ids, so a regenerated goal keeps the progress recorded against it
+        for goal in goals:
+            goal['goal_id'] = goal_store.goal_id_for(student_id, goal['module_name'], goal['goal_title'])
+        
+        return goals[:max_goals]  # Limit to 6 goals maximum by default
     
     def get_personalized_resources(self, student_profile, goals):
         """Get personalized learning resources from Firebase based on goals and performance"""
-        print("🚀 get_personalized_resources function called!")
-        import sys
-        sys.stdout.flush()
-        
         recommendations = {
             'books': [],
             'online_courses': [],
@@ -645,90 +498,65 @@ class EnhancedEduBoostAI:
             'video_tutorials': []
         }
         
+        # Get modules from goals
+        goal_modules = list(set([goal['module_name'] for goal in goals if goal['module_name'] != 'General']))
+        
+        if not goal_modules:
+            # If no specific modules, get general recommendations
+            goal_modules = ['Database Management', 'Computer Networks', 'Software Engineering']
+        
+        # Get student ID from profile
+        student_id = student_profile.get('student_id', 'default')
+        
         try:
-            # Get modules from goals
-            goal_modules = list(set([goal['module_name'] for goal in goals if goal['module_name'] != 'General']))
-            
-            if not goal_modules:
-                # If no specific modules, get general recommendations
-                goal_modules = ['Database Management', 'Computer Networks', 'Software Engineering']
-            
-            # Get student ID from profile
-            student_id = student_profile.get('student_id', 'default')
-            
-            # Make request to Firebase API for personalized recommendations
-            firebase_api_url = 'http://localhost:3000/api/resources'
-            params = {
-                'studentId': student_id,
-                'modules': ','.join(goal_modules),
-                'difficultyLevel': 'intermediate'  # Can be made dynamic based on student performance
-            }
-            
-            print(f"🔥 Making Firebase API call to: {firebase_api_url}")
-            print(f"📋 Params: {params}")
-            import sys
-            sys.stdout.flush()
-            
-            response = requests.get(firebase_api_url, params=params, timeout=10)
-            
-            print(f"📊 Firebase API Response Status: {response.status_code}")
-            print(f"📄 Firebase API Response: {response.text[:500]}...")
-            sys.stdout.flush()
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('success'):
-                    firebase_data = data.get('data', {})
-                    
-                    # Map Firebase data to expected format
-                    books = firebase_data.get('books', [])
-                    online_resources = firebase_data.get('online_resources', [])
-                    
-                    # Convert Firebase format to expected format
-                    for book in books[:5]:  # Limit to 5
-                        recommendations['books'].append({
-                            'id': book.get('id', ''),
-                            'module_name': book.get('module_name', ''),
-                            'resource_type': book.get('resource_type', 'book'),
-                            'resource_title': book.get('resource_title', ''),
-                            'resource_url': book.get('resource_url', ''),
-                            'resource_author': book.get('resource_author', ''),
-                            'difficulty_level': book.get('difficulty_level', 2),
-                            'topic_tags': book.get('topic_tags', []),
-                            'rating': book.get('rating', 4.0),
-                            'estimated_hours': book.get('estimated_hours', 20),
-                            'description': book.get('description', ''),
-                            'is_free': book.get('is_free', False)
-                        })
-                    
-                    for resource in online_resources[:5]:  # Limit to 5
-                        recommendations['online_courses'].append({
-                            'id': resource.get('id', ''),
-                            'module_name': resource.get('module_name', ''),
-                            'resource_type': resource.get('resource_type', 'online'),
-                            'resource_title': resource.get('resource_title', ''),
-                            'resource_url': resource.get('resource_url', ''),
-                            'resource_author': resource.get('resource_author', ''),
-                            'difficulty_level': resource.get('difficulty_level', 2),
-                            'topic_tags': resource.get('topic_tags', []),
-                            'rating': resource.get('rating', 4.0),
-                            'estimated_hours': resource.get('estimated_hours', 15),
-                            'description': resource.get('description', ''),
-                            'is_free': resource.get('is_free', True)
-                        })
-                else:
-                    print(f"Firebase API error: {data.get('error', 'Unknown error')}")
-                    # Fall back to hardcoded data if Firebase fails
-                    return self._get_fallback_resources(goal_modules)
-            else:
-                print(f"Firebase API request failed with status {response.status_code}")
-                # Fall back to hardcoded data if Firebase fails
-                return self._get_fallback_resources(goal_modules)
-                
-        except requests.exceptions.RequestException as e:
-            print(f"Error connecting to Firebase API: {e}")
+            # Pooled, coalesced request to the Firebase-backed resources API (fails fast when the breaker is open)
+            firebase_data = get_resource_client().get_resources(
+                student_id,
+                goal_modules,
+                difficulty_level='intermediate'  # Can be made dynamic based on student performance
+            )
+        except ResourceFetchError as e:
+            print(f"Firebase resources unavailable, using fallback: {e}")
             # Fall back to hardcoded data if Firebase fails
             return self._get_fallback_resources(goal_modules)
+        
+        try:
+            # Map Firebase data to expected format
+            books = firebase_data.get('books', [])
+            online_resources = firebase_data.get('online_resources', [])
+            
+            # Convert Firebase format to expected format
+            for book in books[:5]:  # Limit to 5
+                recommendations['books'].append({
+                    'id': book.get('id', ''),
+                    'module_name': book.get('module_name', ''),
+                    'resource_type': book.get('resource_type', 'book'),
+                    'resource_title': book.get('resource_title', ''),
+                    'resource_url': book.get('resource_url', ''),
+                    'resource_author': book.get('resource_author', ''),
+                    'difficulty_level': book.get('difficulty_level', 2),
+                    'topic_tags': book.get('topic_tags', []),
+                    'rating': book.get('rating', 4.0),
+                    'estimated_hours': book.get('estimated_hours', 20),
+                    'description': book.get('description', ''),
+                    'is_free': book.get('is_free', False)
+                })
+            
+            for resource in online_resources[:5]:  # Limit to 5
+                recommendations['online_courses'].append({
+                    'id': resource.get('id', ''),
+                    'module_name': resource.get('module_name', ''),
+                    'resource_type': resource.get('resource_type', 'online'),
+                    'resource_title': resource.get('resource_title', ''),
+                    'resource_url': resource.get('resource_url', ''),
+                    'resource_author': resource.get('resource_author', ''),
+                    'difficulty_level': resource.get('difficulty_level', 2),
+                    'topic_tags': resource.get('topic_tags', []),
+                    'rating': resource.get('rating', 4.0),
+                    'estimated_hours': resource.get('estimated_hours', 15),
+                    'description': resource.get('description', ''),
+                    'is_free': resource.get('is_free', True)
+                })
         except Exception as e:
             print(f"Unexpected error in get_personalized_resources: {e}")
             # Fall back to hardcoded data if Firebase fails
@@ -737,211 +565,136 @@ class EnhancedEduBoostAI:
         return recommendations
     
     def _get_fallback_resources(self, goal_modules):
-        """Fallback method with hardcoded resources if Firebase is unavailable"""
-        fallback_books = [
-            {
-                'id': 'book_1',
-                'module_name': 'Database Management',
-                'resource_type': 'book',
-                'resource_title': 'Database System Concepts',
-                'resource_url': 'https://www.db-book.com/',
-                'resource_author': 'Silberschatz, Korth, Sudarshan',
-                'difficulty_level': 3,
-                'topic_tags': ['Database Theory', 'SQL', 'Normalization'],
-                'rating': 4.7,
-                'estimated_hours': 40,
-                'description': 'Comprehensive database textbook covering all concepts',
-                'is_free': False
-            },
-            {
-                'id': 'book_2',
-                'module_name': 'Computer Networks',
-                'resource_type': 'book',
-                'resource_title': 'Computer Networking: A Top-Down Approach',
-                'resource_url': 'https://gaia.cs.umass.edu/kurose_ross/index.php',
-                'resource_author': 'James Kurose, Keith Ross',
-                'difficulty_level': 2,
-                'topic_tags': ['Networking', 'Protocols', 'Internet'],
-                'rating': 4.6,
-                'estimated_hours': 35,
-                'description': 'Top-down approach to computer networking',
-                'is_free': False
-            }
-        ]
-        
-        fallback_online = [
-            {
-                'id': 'online_1',
-                'module_name': 'Database Management',
-                'resource_type': 'online',
-                'resource_title': 'W3Schools SQL Tutorial',
-                'resource_url': 'https://www.w3schools.com/sql/',
-                'resource_author': 'W3Schools',
-                'difficulty_level': 1,
-                'topic_tags': ['SQL', 'Queries', 'Database Design'],
-                'rating': 4.5,
-                'estimated_hours': 10,
-                'description': 'Comprehensive SQL tutorial with interactive examples',
-                'is_free': True
-            },
-            {
-                'id': 'online_2',
-                'module_name': 'Software Engineering',
-                'resource_type': 'online',
-                'resource_title': 'freeCodeCamp',
-                'resource_url': 'https://www.freecodecamp.org/',
-                'resource_author': 'freeCodeCamp',
-                'difficulty_level': 1,
-                'topic_tags': ['Web Development', 'Programming', 'Projects'],
-                'rating': 4.7,
-                'estimated_hours': 100,
-                'description': 'Free coding bootcamp with hands-on projects',
-                'is_free': True
-            }
-        ]
-        
+        """Top-rated resources from the local catalog if Firebase is unavailable"""
+        catalog = current_services().catalog.snapshot()
         return {
-            'books': [book for book in fallback_books if book['module_name'] in goal_modules],
-            'online_courses': [resource for resource in fallback_online if resource['module_name'] in goal_modules],
-            'practice_platforms': [],
-            'video_tutorials': []
+            category: catalog.top(goal_modules, resource_types=resource_types, limit=5)
+            for category, resource_types in RECOMMENDATION_CATEGORIES.items()
         }
 
+class StudentAnalysis:
+    """One analysis pass over a student's performance data, shared by every consumer.
+    
+    Per-module risk, the comprehensive analysis, aggregate risk and weak-module
+    lists are computed on first access and memoized, so the goals, planner and
+    wellness helpers of a request never re-score the same modules.
+    """
+    
+    def __init__(self, ai, performance_data):
+        self.ai = ai
+        self.performance_data = performance_data
+    
+    @cached_property
+    def module_risks(self):
+        """calculate_module_risk result for every module, in input order"""
+        return self.ai.calculate_module_risks(self.performance_data)
+    
+    @cached_property
+    def comprehensive(self):
+        """analyze_comprehensive_performance result built from the memoized module risks"""
+        return self.ai.analyze_comprehensive_performance(self.performance_data, module_risks=self.module_risks)
+    
+    @cached_property
+    def average_risk(self):
+        """Mean capped module risk score"""
+        total_risk = 0
+        for risk in self.module_risks:
+            total_risk += risk['risk_score']
+        return total_risk / len(self.module_risks) if self.module_risks else 0
+    
+    @cached_property
+    def weak_modules(self):
+        """Modules with a high or medium risk level"""
+        return [
+            module_data['module_name']
+            for module_data, risk in zip(self.performance_data, self.module_risks)
+            if risk['risk_level'] in ['high', 'medium']
+        ]
+    
+    @property
+    def risk_level(self):
+        avg_risk = self.average_risk
+        return 'high' if avg_risk > 0.6 else 'medium' if avg_risk > 0.3 else 'low'
+
 # =============================================================================
-# SAMPLE DATA GENERATORS
+# STUDENT DATA ACCESS
 # =============================================================================
 
-def generate_enhanced_student_data(student_id):
-    """Generate comprehensive student performance data with 14 fields"""
-    performance_data = []
-    random.seed(hash(student_id) % 1000)  # Consistent data per student
+# Request-path queries; test_query_plans.py audits their plans
+STUDENT_PERFORMANCE_SQL = '''
+    SELECT {fields}, updated_at
+    FROM student_performance
+    WHERE student_id = ?
+    ORDER BY module_name
+'''.format(fields=', '.join(synthetic_cohort.RECORD_FIELDS))
+
+STUDENT_FEEDBACK_SQL = '''
+    SELECT student_id, module_name, lecturer_id, feedback_text, weak_areas, strength_areas,
+           recommended_actions, COALESCE(urgency_level, 3), improvement_timeline
+    FROM lecturer_feedback
+    WHERE student_id = ?
+    ORDER BY module_name, created_at
+'''
+
+UPDATE_GOAL_PROGRESS_SQL = '''
+    UPDATE student_goals
+    SET current_progress = ?, is_completed = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE goal_id = ?
+'''
+
+GOAL_OWNER_SQL = 'SELECT student_id FROM student_goals WHERE goal_id = ?'
+
+def load_student_performance(student_id):
+    """Stored performance rows for a student (latest per module), else synthetic data"""
+    with get_db_pool().connection() as conn:
+        rows = conn.execute(STUDENT_PERFORMANCE_SQL, (student_id,)).fetchall()
     
-    modules = [
-        "Introduction to Computer Science",
-        "Mathematics for Computing", 
-        "Programming Fundamentals",
-        "Object Oriented Programming",
-        "Computer Networks",
-        "Operating System",
-        "Introduction to Machine Learning",
-        "Web Development",
-        "Electronics and Computer System Architecture",
-        "Database Management"
-    ]
+    if not rows:
+        return generate_enhanced_student_data(student_id)
     
-    # Generate base student profile
-    base_ability = random.normalvariate(0, 1)  # Student's general academic ability
-    current_gpa = max(0.0, min(4.0, 2.5 + base_ability * 0.8))
-    current_semester = random.choice(['Fall2024', 'Spring2025', 'Summer2025'])
+    # Keep the most recently updated semester of each module
+    latest = {}
+    for row in rows:
+        record = dict(zip(synthetic_cohort.RECORD_FIELDS, row[:-1]))
+        current = latest.get(record['module_name'])
+        if current is None or row[-1] >= current[0]:
+            latest[record['module_name']] = (row[-1], record)
     
-    for module in modules:
-        # Module-specific difficulty
-        module_difficulty = random.uniform(2.0, 4.5)
-        
-        # Correlated performance metrics
-        base_score = max(0, min(100, 60 + base_ability * 20 + random.normalvariate(0, 15)))
-        avg_assessment_score = int(base_score)
-        
-        # Behavioral metrics correlated with performance
-        attendance_rate = max(30, min(100, base_score + random.normalvariate(10, 15)))
-        lab_completion_rate = max(0, min(100, base_score + random.normalvariate(5, 20)))
-        participation_score = max(0, min(100, base_score + random.normalvariate(-5, 15)))
-        
-        # Submission patterns
-        if base_score < 50:
-            assignments_late = np.random.poisson(3)
-            num_submission_attempts = np.random.poisson(2.5) + 1
-        else:
-            assignments_late = np.random.poisson(0.8)
-            num_submission_attempts = np.random.poisson(1.2) + 1
-        
-        # Engagement metrics
-        login_frequency = max(1, int(10 + base_ability * 8 + random.normalvariate(0, 5)))
-        
-        # Risk indicators
-        failed_module = 1 if (base_score < 40 and random.random() < 0.7) else 0
-        
-        # Calculate risk score
-        risk_score = calculate_risk_score({
-            'avg_assessment_score': avg_assessment_score,
-            'current_gpa': current_gpa,
-            'attendance_rate': attendance_rate,
-            'lab_completion_rate': lab_completion_rate,
-            'assignments_late': assignments_late,
-            'participation_score': participation_score,
-            'login_frequency': login_frequency,
-            'failed_module': failed_module
-        })
-        
-        module_data = {
-            'student_id': student_id,
-            'module_name': module,
-            'module_difficulty': round(module_difficulty, 2),
-            'current_gpa': round(current_gpa, 2),
-            'avg_assessment_score': avg_assessment_score,
-            'assignments_late': min(assignments_late, 10),
-            'num_submission_attempts': min(num_submission_attempts, 8),
-            'login_frequency': login_frequency,
-            'attendance_rate': round(attendance_rate, 2),
-            'lab_completion_rate': round(lab_completion_rate, 2),
-            'participation_score': int(participation_score),
-            'failed_module': failed_module,
-            'semester': current_semester,
-            'risk_score': round(risk_score, 3)
-        }
-        
-        performance_data.append(module_data)
+    module_order = {module: index for index, module in enumerate(synthetic_cohort.MODULES)}
+    return [record for _, record in sorted(
+        latest.values(),
+        key=lambda item: (module_order.get(item[1]['module_name'], len(module_order)), item[1]['module_name'])
+    )]
+
+def load_student_feedback(student_id):
+    """Stored lecturer feedback for a student, else the sample feedback"""
+    with get_db_pool().connection() as conn:
+        rows = conn.execute(STUDENT_FEEDBACK_SQL, (student_id,)).fetchall()
+    
+    if not rows:
+        return generate_sample_lecturer_feedback(student_id)
     
-    return performance_data
+    fields = ['student_id', 'module_name', 'lecturer_id', 'feedback_text', 'weak_areas', 'strength_areas',
+              'recommended_actions', 'urgency_level', 'improvement_timeline']
+    return [dict(zip(fields, row)) for row in rows]
+
+def load_student_inputs(student_id):
+    """Performance data and lecturer feedback for a student"""
+    return load_student_performance(student_id), load_student_feedback(student_id)
+
+# =============================================================================
+# SAMPLE DATA GENERATORS
+# =============================================================================
+
+def generate_enhanced_student_data(student_id):
+    """Generate comprehensive student performance data with 14 fields"""
+    # Deterministic per student id and safe to call from concurrent requests
+    return synthetic_cohort.generate_student_records(student_id)
 
 def calculate_risk_score(data):
     """Calculate comprehensive risk score"""
-    risk = 0
-    
-    # Academic factors (40% weight)
-    if data['avg_assessment_score'] < 40:
-        risk += 0.25
-    elif data['avg_assessment_score'] < 50:
-        risk += 0.15
-    elif data['avg_assessment_score'] < 60:
-        risk += 0.10
-    
-    if data['current_gpa'] < 2.0:
-        risk += 0.15
-    elif data['current_gpa'] < 2.5:
-        risk += 0.10
-    
-    # Behavioral factors (35% weight)
-    if data['attendance_rate'] < 60:
-        risk += 0.15
-    elif data['attendance_rate'] < 75:
-        risk += 0.10
-    
-    if data['lab_completion_rate'] < 50:
-        risk += 0.10
-    elif data['lab_completion_rate'] < 70:
-        risk += 0.05
-    
-    if data['participation_score'] < 40:
-        risk += 0.10
-    
-    # Submission patterns (15% weight)
-    if data['assignments_late'] >= 3:
-        risk += 0.10
-    elif data['assignments_late'] >= 1:
-        risk += 0.05
-    
-    # Engagement (10% weight)
-    if data['login_frequency'] < 5:
-        risk += 0.10
-    elif data['login_frequency'] < 10:
-        risk += 0.05
-    
-    # Failed module history (bonus factor)
-    if data['failed_module'] > 0:
-        risk += 0.15
-    
-    return min(risk, 1.0)
+    columns = {field: data[field] for field in risk_engine.RISK_SCORE_FIELDS}
+    return float(risk_engine.calculate_risk_scores(columns)) or 0
 
 def generate_sample_lecturer_feedback(student_id):
     """Generate sample lecturer feedback"""
@@ -979,17 +732,117 @@ def generate_sample_lecturer_feedback(student_id):
     return feedback_data
 
 # =============================================================================
-# GLOBAL VARIABLES
+# SERVICES
 # =============================================================================
 
-# Initialize the AI system immediately
-eduboost_ai = EnhancedEduBoostAI()
+class Services:
+    """Services of one Flask app, each created on first use instead of at import.
+
+    create_app() stores them in app.extensions['eduboost'] so two apps on
+    different databases never share state. Code that runs outside a request
+    (seeding, job handlers) is run inside the owning app's context, which is
+    how get_db_pool() and the other helpers find the right instance.
+    """
+    
+    def __init__(self, flask_app, db_path):
+        self.app = flask_app
+        self.db_path = db_path
+        self.cache = StudentCache()
+        self._lock = threading.RLock()
+        self._db_pool = None
+        self._ai = None
+        self._catalog = None
+        self._jobs = None
+        self._inference = None
+    
+    def in_app_context(self, handler):
+        """Wrap a job handler so it runs against this app's services"""
+        def run(payload):
+            with self.app.app_context():
+                return handler(payload)
+        return run
+    
+    @property
+    def db_pool(self):
+        """Connection pool; the schema is migrated the first time it is requested"""
+        if self._db_pool is None:
+            with self._lock:
+                if self._db_pool is None:
+                    pool = get_pool(self.db_path)
+                    initialize_database(pool)
+                    self._db_pool = pool
+        return self._db_pool
+    
+    @property
+    def ai(self):
+        """AI system (seeds the resource table on first use)"""
+        if self._ai is None:
+            with self._lock:
+                if self._ai is None:
+                    with self.app.app_context():
+                        self._ai = EnhancedEduBoostAI()
+        return self._ai
+    
+    @property
+    def catalog(self):
+        """In-memory learning_resources index (built after the AI system seeds the table)"""
+        if self._catalog is None:
+            with self._lock:
+                if self._catalog is None:
+                    self.ai
+                    self._catalog = ResourceCatalog(self.db_pool)
+        return self._catalog
+    
+    @property
+    def jobs(self):
+        """Background job queue (workers start on first enqueue or via start())"""
+        if self._jobs is None:
+            with self._lock:
+                if self._jobs is None:
+                    jobs = JobQueue(self.db_pool)
+                    jobs.register('regenerate_goals', self.in_app_context(run_goal_regeneration_job))
+                    self._jobs = jobs
+        return self._jobs
+    
+    @property
+    def inference(self):
+        """Micro-batching scorer for the at-risk model (batcher thread starts on first prediction)"""
+        if self._inference is None:
+            with self._lock:
+                if self._inference is None:
+                    self._inference = InferenceService(load_risk_model)
+        return self._inference
+    
+    def warm_up(self):
+        """Create every service and load the models now (servers call this before taking traffic)"""
+        self.db_pool
+        self.ai
+        self.catalog.snapshot()
+        self.jobs
+        self.inference
+        return model_registry.warm_up()
+
+def current_services():
+    """Services of the app handling the request (or running the job), else the default app's"""
+    if has_app_context():
+        return current_app.extensions['eduboost']
+    return services
+
+def __getattr__(name):
+    """Lazy module attributes kept for scripts that do `from app import eduboost_ai`"""
+    if name == 'eduboost_ai':
+        return current_services().ai
+    if name == 'background_jobs':
+        return current_services().jobs
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # =============================================================================
 # API ENDPOINTS
 # =============================================================================
 
-@app.route('/', methods=['GET'])
+api = Blueprint('eduboost', __name__)
+
+@api.route('/', methods=['GET'])
 def health_check():
     """Health check endpoint with system information"""
     return jsonify({
@@ -1006,9 +859,21 @@ def health_check():
             'GET /api/students/<id>/goals - AI-generated personalized goals',
             'GET /api/students/<id>/planner - Personalized study planner',
             'POST /api/lecturer/feedback - Submit lecturer feedback',
+            'POST /api/lecturer/feedback/bulk - Submit many feedback records (JSON array or NDJSON)',
             'POST /api/goals/<goal_id>/progress - Update goal progress',
+            'POST /api/performance/bulk - Bulk CSV/NDJSON performance upload (upsert)',
+            'GET /api/resources/search?q= - Full-text resource search (type, difficulty, is_free filters; cursor paging)',
             'GET /api/modules - List all available modules',
-            'POST /predict - Legacy ML prediction'
+            'GET /api/system/db-pool - Database connection pool statistics',
+            'GET /api/system/models - Cached model load statistics',
+            'GET /api/system/inference - Model inference batch-size and queue-latency histograms',
+            'GET /api/system/resource-client - Resource API client statistics',
+            'GET /api/system/cache - Student computation cache statistics',
+            'GET /api/system/resource-catalog - In-memory resource catalog statistics',
+            'GET /api/system/jobs - Background job queue statistics',
+            'GET /api/jobs/<job_id> - Background job status',
+            'POST /predict - Legacy ML prediction',
+            'POST /predict/batch - Vectorized batch prediction (JSON or NDJSON stream)'
         ],
         'database_features': [
             '14-field student performance tracking',
@@ -1018,188 +883,278 @@ def health_check():
         ]
     })
 
-@app.route('/api/students/<student_id>/performance', methods=['GET'])
+@api.route('/api/students/<student_id>/performance', methods=['GET'])
 def get_enhanced_student_performance(student_id):
     """Get comprehensive student performance analysis with 14-field data"""
     try:
-        # Generate enhanced performance data
-        performance_data = generate_enhanced_student_data(student_id)
-        
-        # Get lecturer feedback
-        lecturer_feedback = generate_sample_lecturer_feedback(student_id)
-        
-        # AI analysis with enhanced system
-        analysis = eduboost_ai.analyze_comprehensive_performance(performance_data)
+        payload = current_services().cache.get_or_compute(
+            'performance', student_id, lambda: build_student_performance(student_id), version=student_data_version(student_id)
+        )
         
-        # Prepare response
-        response = {
+        return jsonify({
             'student_id': student_id,
-            'performance_data': performance_data,
-            'analysis': analysis,
-            'lecturer_feedback': lecturer_feedback,
-            'summary': {
-                'total_modules': len(performance_data),
-                'failing_modules': len(analysis['failing_modules']),
-                'at_risk_modules': len(analysis['at_risk_modules']),
-                'strong_modules': len(analysis['strong_modules']),
-                'overall_gpa': round(np.mean([m['current_gpa'] for m in performance_data]), 2),
-                'average_attendance': round(np.mean([m['attendance_rate'] for m in performance_data]), 2),
-                'average_lab_completion': round(np.mean([m['lab_completion_rate'] for m in performance_data]), 2),
-                'risk_level': analysis['overall_risk_level']
-            },
+            **payload,
             'last_updated': datetime.now().isoformat()
-        }
-        
-        return jsonify(response)
+        })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/students/<student_id>/goals', methods=['GET'])
+def student_data_version(student_id):
+    """Cache version of a student's results, read from the database so every worker sees writes"""
+    with get_db_pool().connection() as conn:
+        return goal_store.data_version(conn, student_id)
+
+def build_student_performance(student_id):
+    """Compute the cacheable part of the performance response"""
+    # Stored (or synthetic) performance data and lecturer feedback
+    performance_data, lecturer_feedback = load_student_inputs(student_id)
+    
+    # AI analysis with enhanced system
+    analysis = StudentAnalysis(current_services().ai, performance_data).comprehensive
+    
+    return {
+        'performance_data': performance_data,
+        'analysis': analysis,
+        'lecturer_feedback': lecturer_feedback,
+        'summary': {
+            'total_modules': len(performance_data),
+            'failing_modules': len(analysis['failing_modules']),
+            'at_risk_modules': len(analysis['at_risk_modules']),
+            'strong_modules': len(analysis['strong_modules']),
+            'overall_gpa': round(np.mean([m['current_gpa'] for m in performance_data]), 2),
+            'average_attendance': round(np.mean([m['attendance_rate'] for m in performance_data]), 2),
+            'average_lab_completion': round(np.mean([m['lab_completion_rate'] for m in performance_data]), 2),
+            'risk_level': analysis['overall_risk_level']
+        }
+    }
+
+@api.route('/api/students/<student_id>/goals', methods=['GET'])
 def get_ai_generated_goals(student_id):
     """Get AI-generated personalized learning goals"""
     try:
-        # Get student performance data
-        performance_data = generate_enhanced_student_data(student_id)
-        lecturer_feedback = generate_sample_lecturer_feedback(student_id)
-        
-        # Generate intelligent goals
-        goals = eduboost_ai.generate_intelligent_goals(student_id, performance_data, lecturer_feedback)
-        
-        # Calculate completion statistics
-        total_goals = len(goals)
-        completed_goals = sum(1 for goal in goals if goal.get('current_progress', 0) >= 100)
-        
-        completion_stats = {
-            'total_goals': total_goals,
-            'completed_goals': completed_goals,
-            'in_progress_goals': total_goals - completed_goals,
-            'completion_rate': round((completed_goals / total_goals) * 100, 1) if total_goals > 0 else 0,
-            'high_priority_goals': len([g for g in goals if g['priority_level'] == 'high']),
-            'medium_priority_goals': len([g for g in goals if g['priority_level'] == 'medium']),
-            'low_priority_goals': len([g for g in goals if g['priority_level'] == 'low'])
-        }
-        
-        # Add estimated completion times
-        for goal in goals:
-            target_date = datetime.strptime(goal['target_completion_date'], '%Y-%m-%d')
-            days_remaining = (target_date - datetime.now()).days
-            goal['days_remaining'] = max(0, days_remaining)
-            goal['success_criteria'] = json.loads(goal['success_criteria']) if isinstance(goal['success_criteria'], str) else goal['success_criteria']
+        payload = current_services().cache.get_or_compute(
+            'goals', student_id, lambda: build_student_goals(student_id), version=student_data_version(student_id)
+        )
         
         return jsonify({
             'student_id': student_id,
-            'goals': goals,
-            'completion_stats': completion_stats,
-            'recommendations': {
-                'focus_areas': [goal['module_name'] for goal in goals if goal['priority_level'] == 'high'],
-                'suggested_daily_study_hours': min(8, len(goals) * 1.5),
-                'estimated_completion_weeks': max(2, len([g for g in goals if g['priority_level'] == 'high']) * 2)
-            },
+            **payload,
             'generated_at': datetime.now().isoformat()
         })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/students/<student_id>/planner', methods=['GET'])
+def build_student_goals(student_id):
+    """Compute the cacheable part of the goals response"""
+    goals, _ = refresh_student_goals(student_id)
+    
+    # Calculate completion statistics
+    total_goals = len(goals)
+    completed_goals = sum(1 for goal in goals if goal.get('current_progress', 0) >= 100)
+    
+    completion_stats = {
+        'total_goals': total_goals,
+        'completed_goals': completed_goals,
+        'in_progress_goals': total_goals - completed_goals,
+        'completion_rate': round((completed_goals / total_goals) * 100, 1) if total_goals > 0 else 0,
+        'high_priority_goals': len([g for g in goals if g['priority_level'] == 'high']),
+        'medium_priority_goals': len([g for g in goals if g['priority_level'] == 'medium']),
+        'low_priority_goals': len([g for g in goals if g['priority_level'] == 'low'])
+    }
+    
+    # Add estimated completion times
+    for goal in goals:
+        target_date = datetime.strptime(goal['target_completion_date'], '%Y-%m-%d')
+        days_remaining = (target_date - datetime.now()).days
+        goal['days_remaining'] = max(0, days_remaining)
+        goal['success_criteria'] = json.loads(goal['success_criteria']) if isinstance(goal['success_criteria'], str) else goal['success_criteria']
+    
+    return {
+        'goals': goals,
+        'completion_stats': completion_stats,
+        'recommendations': {
+            'focus_areas': [goal['module_name'] for goal in goals if goal['priority_level'] == 'high'],
+            'suggested_daily_study_hours': min(8, len(goals) * 1.5),
+            'estimated_completion_weeks': max(2, len([g for g in goals if g['priority_level'] == 'high']) * 2)
+        }
+    }
+
+def refresh_student_goals(student_id):
+    """Return (persisted goals, regenerated modules), regenerating changed modules first"""
+    # Persisted goals and whether they are still current, in one indexed query
+    with get_db_pool().connection() as conn:
+        is_current, inputs_version, goals = goal_store.read_goals(conn, student_id)
+    
+    if is_current:
+        return goals, []
+    
+    # First visit, or performance/feedback changed: regenerate the affected modules
+    performance_data, lecturer_feedback = load_student_inputs(student_id)
+    student_analysis = StudentAnalysis(current_services().ai, performance_data)
+    return regenerate_student_goals(student_id, inputs_version, performance_data, lecturer_feedback, student_analysis)
+
+def regenerate_student_goals(student_id, inputs_version, performance_data, lecturer_feedback, student_analysis):
+    """Persist goals generated from inputs loaded after `inputs_version` was read; returns (goals, regenerated modules)"""
+    candidates = current_services().ai.generate_intelligent_goals(
+        student_id, performance_data, lecturer_feedback,
+        student_analysis=student_analysis, max_goals=None
+    )
+    digests = goal_store.input_digests(
+        performance_data, lecturer_feedback, student_analysis.comprehensive['overall_risk_level']
+    )
+    synced = goal_store.sync_goals(get_db_pool(), student_id, candidates, digests, inputs_version)
+    
+    # Re-rank the regenerated goals' resources now so planner requests only read them
+    regenerated = set(synced['regenerated_modules'])
+    resource_index.goal_resources(
+        get_db_pool(), current_services().catalog.snapshot(), student_id, synced['goals'], lambda: lecturer_feedback,
+        stale_goal_ids=[goal['goal_id'] for goal in synced['goals'] if goal['module_name'] in regenerated]
+    )
+    return synced['goals'], synced['regenerated_modules']
+
+def run_goal_regeneration_job(payload):
+    """Background job: bring a student's persisted goals up to date"""
+    goals, regenerated_modules = refresh_student_goals(payload['student_id'])
+    return {
+        'student_id': payload['student_id'],
+        'regenerated_modules': regenerated_modules,
+        'goal_count': len(goals)
+    }
+
+def enqueue_goal_regeneration(cursor, student_id):
+    """Queue a goal refresh in the caller's transaction; bursts for one student merge into one job"""
+    return current_services().jobs.enqueue(
+        cursor, 'regenerate_goals', {'student_id': student_id},
+        dedupe_key=f'regenerate_goals:{student_id}'
+    )
+
+@api.route('/api/students/<student_id>/planner', methods=['GET'])
 def get_personalized_planner(student_id):
     """Get comprehensive personalized study planner with resources"""
     try:
-        # Get student data and goals
-        performance_data = generate_enhanced_student_data(student_id)
-        goals = eduboost_ai.generate_intelligent_goals(student_id, performance_data)
-        
-        # Generate personalized resources
-        resources = eduboost_ai.get_personalized_resources({'student_id': student_id}, goals)
-        
-        # Create weekly study plan
-        weak_modules = []
-        total_risk = 0
-        for module_data in performance_data:
-            risk = eduboost_ai.calculate_module_risk(module_data)
-            total_risk += risk['risk_score']
-            if risk['risk_level'] in ['high', 'medium']:
-                weak_modules.append(module_data['module_name'])
-        
-        avg_risk = total_risk / len(performance_data)
-        recommended_hours = min(40, max(15, len(weak_modules) * 4 + int(avg_risk * 10)))
-        
-        study_plan = {
-            'weekly_schedule': generate_weekly_schedule(weak_modules, recommended_hours),
-            'recommended_hours': recommended_hours,
-            'focus_modules': weak_modules[:3],  # Top 3 priority modules
-            'study_techniques': [
-                'Pomodoro Technique (25 min study, 5 min break)',
-                'Active recall and spaced repetition',
-                'Practice problems before theory review',
-                'Form study groups for difficult concepts',
-                'Use flashcards for memorization topics'
-            ],
-            'physical_plan': generate_physical_plan(avg_risk),
-            'emotional_plan': generate_emotional_plan(avg_risk),
-            'mini_goals': generate_mini_goals(weak_modules)
-        }
+        # The planner also depends on the resource catalog
+        version = (student_data_version(student_id), current_services().catalog.snapshot().version)
+        payload = current_services().cache.get_or_compute(
+            'planner', student_id, lambda: build_student_planner(student_id), version=version
+        )
         
         return jsonify({
             'student_id': student_id,
-            'study_plan': study_plan,
-            'book_recommendations': resources['books'],
-            'online_resources': resources['online_courses'],
-            'practice_platforms': resources['practice_platforms'],
-            'video_tutorials': resources['video_tutorials'],
-            'personalization_factors': {
-                'risk_level': 'high' if avg_risk > 0.6 else 'medium' if avg_risk > 0.3 else 'low',
-                'weak_module_count': len(weak_modules),
-                'study_intensity': 'high' if recommended_hours > 30 else 'medium' if recommended_hours > 20 else 'normal'
-            },
+            **payload,
             'generated_at': datetime.now().isoformat()
         })
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/lecturer/feedback', methods=['POST'])
+def build_student_planner(student_id):
+    """Compute the cacheable part of the planner response"""
+    # Persisted goal state first: inputs loaded after it can safely regenerate stale goals
+    with get_db_pool().connection() as conn:
+        goal_state = goal_store.read_goals(conn, student_id)
+    
+    # Get student data and analyze it once for the whole planner
+    performance_data, lecturer_feedback = load_student_inputs(student_id)
+    student_analysis = StudentAnalysis(current_services().ai, performance_data)
+    goals = current_services().ai.generate_intelligent_goals(student_id, performance_data, student_analysis=student_analysis)
+    
+    # Generate personalized resources
+    resources = current_services().ai.get_personalized_resources({'student_id': student_id}, goals)
+    is_current, inputs_version, persisted_goals = goal_state
+    if not is_current:
+        persisted_goals, _ = regenerate_student_goals(
+            student_id, inputs_version, performance_data, lecturer_feedback, student_analysis
+        )
+    goal_resources = build_goal_resources(student_id, persisted_goals, lecturer_feedback)
+    
+    # Create weekly study plan
+    weak_modules = student_analysis.weak_modules
+    avg_risk = student_analysis.average_risk
+    recommended_hours = min(40, max(15, len(weak_modules) * 4 + int(avg_risk * 10)))
+    
+    study_plan = {
+        'weekly_schedule': generate_weekly_schedule(weak_modules, recommended_hours),
+        'recommended_hours': recommended_hours,
+        'focus_modules': weak_modules[:3],  # Top 3 priority modules
+        'study_techniques': [
+            'Pomodoro Technique (25 min study, 5 min break)',
+            'Active recall and spaced repetition',
+            'Practice problems before theory review',
+            'Form study groups for difficult concepts',
+            'Use flashcards for memorization topics'
+        ],
+        'physical_plan': generate_physical_plan(avg_risk),
+        'emotional_plan': generate_emotional_plan(avg_risk),
+        'mini_goals': generate_mini_goals(weak_modules)
+    }
+    
+    return {
+        'study_plan': study_plan,
+        'book_recommendations': resources['books'],
+        'online_resources': resources['online_courses'],
+        'practice_platforms': resources['practice_platforms'],
+        'video_tutorials': resources['video_tutorials'],
+        'goal_resources': goal_resources,
+        'personalization_factors': {
+            'risk_level': student_analysis.risk_level,
+            'weak_module_count': len(weak_modules),
+            'study_intensity': 'high' if recommended_hours > 30 else 'medium' if recommended_hours > 20 else 'normal'
+        }
+    }
+
+def build_goal_resources(student_id, goals, lecturer_feedback):
+    """Each persisted goal with its best-matching resources, read from goal_resources"""
+    catalog = current_services().catalog.snapshot()
+    ranked = resource_index.goal_resources(
+        get_db_pool(), catalog, student_id, goals, lambda: lecturer_feedback
+    )
+    
+    goal_resources = []
+    for goal in goals:
+        resources = []
+        for resource_id, relevance in ranked.get(goal['goal_id'], []):
+            row = catalog.row_by_id.get(resource_id)
+            if row is not None:
+                resources.append(dict(catalog.record(row), relevance_score=relevance))
+        goal_resources.append({
+            'goal_id': goal['goal_id'],
+            'goal_title': goal['goal_title'],
+            'module_name': goal['module_name'],
+            'resources': resources
+        })
+    return goal_resources
+
+@api.route('/api/lecturer/feedback', methods=['POST'])
 def submit_enhanced_lecturer_feedback():
     """Submit comprehensive lecturer feedback"""
     try:
-        data = request.json
+        data = request.get_json(silent=True)
         
-        # Validate required fields
-        required_fields = ['student_id', 'module_name', 'lecturer_id', 'feedback_text']
-        if not all(field in data for field in required_fields):
-            return jsonify({'error': 'Missing required fields', 'required': required_fields}), 400
+        # Same validation as every record of the bulk endpoint
+        errors = feedback_ingest.validate_feedback(data)
+        if errors:
+            return jsonify({
+                'error': 'Invalid feedback record',
+                'required': list(feedback_ingest.REQUIRED_FIELDS),
+                'errors': errors
+            }), 400
         
         # Store feedback in database
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO lecturer_feedback 
-            (student_id, module_name, lecturer_id, feedback_text, weak_areas, 
-             strength_areas, recommended_actions, urgency_level, improvement_timeline)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            data['student_id'],
-            data['module_name'],
-            data['lecturer_id'],
-            data['feedback_text'],
-            json.dumps(data.get('weak_areas', [])),
-            json.dumps(data.get('strength_areas', [])),
-            json.dumps(data.get('recommended_actions', [])),
-            data.get('urgency_level', 3),
-            data.get('improvement_timeline', '2 weeks')
-        ))
-        
-        feedback_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with get_db_pool().transaction() as cursor:
+            feedback_id, = feedback_ingest.insert_feedback(cursor, [feedback_ingest.feedback_row(data)])
+            
+            goal_store.mark_inputs_changed(cursor, [data['student_id']])
+            job_id = enqueue_goal_regeneration(cursor, data['student_id'])
         
-        # Trigger goal regeneration for the student
-        # In a real system, this would be done asynchronously
+        # The write moved the student's data version; free this worker's stale entries now
+        current_services().cache.invalidate(data['student_id'])
         
         return jsonify({
             'feedback_id': feedback_id,
+            'job_id': job_id,
+            'job_status_url': f'/api/jobs/{job_id}',
             'status': 'success',
             'message': 'Lecturer feedback submitted successfully',
             'next_steps': [
@@ -1212,7 +1167,52 @@ def submit_enhanced_lecturer_feedback():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/goals/<goal_id>/progress', methods=['POST'])
+@api.route('/api/lecturer/feedback/bulk', methods=['POST'])
+def submit_bulk_lecturer_feedback():
+    """Submit many lecturer feedback records (JSON array or NDJSON) in one transaction"""
+    try:
+        try:
+            records = feedback_ingest.read_records(request.stream, request.content_type)
+        except feedback_ingest.FeedbackTooLargeError as e:
+            return jsonify({'error': str(e)}), 413
+        except feedback_ingest.FeedbackFormatError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        rows, positions, errors = feedback_ingest.validate_records(records)
+        if not rows:
+            return jsonify({
+                'error': 'No valid feedback records',
+                'records_received': len(records),
+                'errors': errors
+            }), 400
+        
+        # One write transaction for every valid record plus the goal regeneration jobs
+        student_ids = sorted({row[0] for row in rows})
+        with get_db_pool().transaction(immediate=True) as cursor:
+            feedback_ids = feedback_ingest.insert_feedback(cursor, rows)
+            goal_store.mark_inputs_changed(cursor, student_ids)
+            job_ids = {student_id: enqueue_goal_regeneration(cursor, student_id) for student_id in student_ids}
+        
+        for student_id in student_ids:
+            current_services().cache.invalidate(student_id)
+        
+        return jsonify({
+            'status': 'success' if not errors else 'partial',
+            'records_received': len(records),
+            'records_written': len(rows),
+            'records_rejected': len(errors),
+            'students': len(student_ids),
+            'results': [
+                {'index': index, 'feedback_id': feedback_id, 'student_id': row[0], 'job_id': job_ids[row[0]]}
+                for index, feedback_id, row in zip(positions, feedback_ids, rows)
+            ],
+            'errors': errors
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/goals/<goal_id>/progress', methods=['POST'])
 def update_goal_progress(goal_id):
     """Update progress for a specific goal"""
     try:
@@ -1225,27 +1225,23 @@ def update_goal_progress(goal_id):
             return jsonify({'error': 'Progress must be between 0 and 100'}), 400
         
         # Update goal in database
-        conn = sqlite3.connect(get_db_path())
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE student_goals 
-            SET current_progress = ?, is_completed = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE goal_id = ?
-        ''', (new_progress, new_progress >= 100, goal_id))
-        
-        if cursor.rowcount == 0:
-            conn.close()
-            return jsonify({'error': 'Goal not found'}), 404
-        
-        # Record progress update
-        cursor.execute('''
-            INSERT INTO student_progress (goal_id, progress_update, notes, updated_by)
-            VALUES (?, ?, ?, ?)
-        ''', (goal_id, new_progress, notes, 'student'))
+        with get_db_pool().transaction() as cursor:
+            cursor.execute(UPDATE_GOAL_PROGRESS_SQL, (new_progress, new_progress >= 100, goal_id))
+            
+            if cursor.rowcount == 0:
+                return jsonify({'error': 'Goal not found'}), 404
+            
+            # Record progress update
+            cursor.execute('''
+                INSERT INTO student_progress (goal_id, progress_update, notes, updated_by)
+                VALUES (?, ?, ?, ?)
+            ''', (goal_id, new_progress, notes, 'student'))
+            
+            cursor.execute(GOAL_OWNER_SQL, (goal_id,))
+            student_id = cursor.fetchone()[0]
+            goal_store.mark_progress_changed(cursor, student_id)
         
-        conn.commit()
-        conn.close()
+        current_services().cache.invalidate(student_id)
         
         return jsonify({
             'goal_id': goal_id,
@@ -1258,7 +1254,110 @@ def update_goal_progress(goal_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/modules', methods=['GET'])
+@api.route('/api/performance/bulk', methods=['POST'])
+def bulk_ingest_performance():
+    """Stream CSV or NDJSON performance records into student_performance (upsert)"""
+    try:
+        fmt = request.args.get('format') or performance_ingest.detect_format(request.content_type)
+        batch_size = request.args.get('batch_size', performance_ingest.DEFAULT_BATCH_SIZE, type=int)
+        if (request.content_length or 0) > performance_ingest.MAX_BULK_BYTES:
+            return jsonify({
+                'error': f'Request body is larger than {performance_ingest.MAX_BULK_BYTES} bytes'
+            }), 413
+        
+        try:
+            # ingest_stream clamps batch_size to MAX_BATCH_SIZE; the body is cap-checked as it streams
+            result = performance_ingest.ingest_stream(
+                get_db_pool(),
+                performance_ingest.text_lines(request.stream, performance_ingest.MAX_BULK_BYTES),
+                fmt=fmt,
+                batch_size=batch_size
+            )
+        except performance_ingest.IngestFormatError as e:
+            # Batches before the bad input stay committed; report them
+            partial = e.result or {}
+            for student_id in partial.pop('student_ids', ()):
+                current_services().cache.invalidate(student_id)
+            status = 413 if isinstance(e, performance_ingest.IngestTooLargeError) else 400
+            return jsonify({'error': str(e), 'status': 'failed', **partial}), status
+        
+        # Cached analyses of every loaded student are stale now
+        for student_id in result.pop('student_ids'):
+            current_services().cache.invalidate(student_id)
+        
+        result['status'] = 'success' if result['rows_rejected'] == 0 else 'partial'
+        return jsonify(result)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/resources/search', methods=['GET'])
+def search_learning_resources():
+    """Full-text search over learning resources (BM25 ranked, keyset paginated)"""
+    try:
+        params = resource_search.parse_search_args(request.args)
+        with get_db_pool().connection() as conn:
+            page = resource_search.search(conn, **params)
+        
+        return jsonify({
+            'query': params['text'],
+            **page,
+            'count': len(page['results'])
+        })
+        
+    except resource_search.SearchQueryError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/jobs/<int:job_id>', methods=['GET'])
+def get_job_status(job_id):
+    """Poll the status and result of a background job"""
+    try:
+        job = current_services().jobs.get(job_id)
+        if job is None:
+            return jsonify({'error': 'Job not found'}), 404
+        return jsonify(job)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/system/db-pool', methods=['GET'])
+def get_db_pool_stats():
+    """Get connection pool hit/miss and wait-time statistics"""
+    return jsonify(get_db_pool().stats())
+
+@api.route('/api/system/models', methods=['GET'])
+def get_model_stats():
+    """Get load time, reload count and memory footprint of cached models"""
+    return jsonify(model_registry.stats())
+
+@api.route('/api/system/inference', methods=['GET'])
+def get_inference_stats():
+    """Get model inference batch-size and queue-latency histograms"""
+    return jsonify(current_services().inference.stats())
+
+@api.route('/api/system/resource-client', methods=['GET'])
+def get_resource_client_stats():
+    """Get resource API call, coalescing and circuit breaker statistics"""
+    return jsonify(get_resource_client().stats())
+
+@api.route('/api/system/resource-catalog', methods=['GET'])
+def get_resource_catalog_stats():
+    """Get in-memory resource catalog version, size and rebuild statistics"""
+    return jsonify(current_services().catalog.stats())
+
+@api.route('/api/system/cache', methods=['GET'])
+def get_student_cache_stats():
+    """Get student cache hit/miss/eviction counters and memory use"""
+    return jsonify(current_services().cache.stats())
+
+@api.route('/api/system/jobs', methods=['GET'])
+def get_job_queue_stats():
+    """Get background job counters and queue depth by status"""
+    return jsonify(current_services().jobs.stats())
+
+@api.route('/api/modules', methods=['GET'])
 def get_available_modules():
     """Get list of all available modules"""
     modules = [
@@ -1324,16 +1423,10 @@ def get_available_modules():
         }
     })
 
-@app.route('/api/health/predict', methods=['POST'])
+@api.route('/api/health/predict', methods=['POST'])
 def predict_health():
     """Health prediction endpoint using the actual EduBoost Health Model"""
     try:
-        if not HEALTH_MODEL_AVAILABLE:
-            return jsonify({
-                'error': 'Health model not available',
-                'message': 'The health prediction model could not be loaded'
-            }), 500
-        
         data = request.get_json(force=True)
         
         # Validate required fields
@@ -1351,9 +1444,14 @@ def predict_health():
         procrastination_level = data['procrastination_level']
         sleep_hours = data['sleep_hours']
         
-        # Initialize the health model (loads automatically in constructor)
-        model_path = os.path.join(os.path.dirname(__file__), '..', 'edu health model', 'eduboost_health_recommendation_model.pkl')
-        health_model = EduBoostHealthModel(model_path=model_path, verbose=True)
+        # Get the process-wide cached health model
+        try:
+            health_model = model_registry.get('health')
+        except ModelNotAvailableError as e:
+            return jsonify({
+                'error': 'Health model not available',
+                'message': str(e)
+            }), 500
         
         # Make prediction
         result = health_model.predict(
@@ -1375,7 +1473,7 @@ def predict_health():
             'message': str(e)
         }), 500
 
-@app.route('/predict', methods=['POST'])
+@api.route('/predict', methods=['POST'])
 def legacy_predict():
     """Legacy ML prediction endpoint for backward compatibility"""
     try:
@@ -1400,6 +1498,11 @@ def legacy_predict():
             value = data[field]
             return value[0] if isinstance(value, list) else value
         
+        try:
+            columns = legacy_batch_columns({field: extract_value(field) for field in basic_columns})
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
         module_difficulty = extract_value('Module_Difficulty')
         current_gpa = extract_value('Current_GPA')
         avg_score = extract_value('Avg_Assessment_Score')
@@ -1419,15 +1522,18 @@ def legacy_predict():
             'failed_module': 1 if avg_score < 40 else 0
         }
         
-        risk_score = calculate_risk_score(enhanced_data)
-        prediction = 1 if risk_score >= 0.4 else 0
-        confidence = min(risk_score * 1.5, 1.0)
+        rule_risk_score = calculate_risk_score(enhanced_data)
+        scoring = predict_at_risk(columns, np.array([rule_risk_score]))
+        prediction = int(scoring['predictions'][0])
+        confidence = float(scoring['confidences'][0])
+        risk_score = float(scoring['risk_scores'][0])
         
         # Enhanced response with more details
         response = {
             "prediction": [prediction],
             "risk_score": round(risk_score, 3),
             "confidence": round(confidence, 3),
+            "scored_by": scoring['scored_by'],
             "risk_level": "high" if risk_score > 0.6 else "medium" if risk_score > 0.3 else "low",
             "factors_analysis": {
                 "academic_risk": "high" if avg_score < 50 else "medium" if avg_score < 70 else "low",
@@ -1437,16 +1543,184 @@ def legacy_predict():
             "recommendations": generate_quick_recommendations(enhanced_data),
             "note": "Enhanced EduBoost prediction system with comprehensive analysis"
         }
+        if scoring['probabilities'] is not None:
+            # risk_score/risk_level follow the model; the rule engine's view is kept alongside
+            response["probability"] = round(float(scoring['probabilities'][0]), 4)
+            response["rule_risk_score"] = round(rule_risk_score, 3)
         
         return jsonify(response)
         
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@api.route('/predict/batch', methods=['POST'])
+def legacy_predict_batch():
+    """Vectorized legacy prediction for every row of array-valued inputs"""
+    try:
+        data = request.get_json(force=True)
+        
+        # Validate input
+        if not isinstance(data, dict) or not all(col in data for col in LEGACY_BASIC_COLUMNS):
+            return jsonify({
+                "error": "Missing required columns.",
+                "expected": LEGACY_BASIC_COLUMNS,
+                "received": list(data.keys()) if isinstance(data, dict) else []
+            }), 400
+        
+        try:
+            columns = legacy_batch_columns(data)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        
+        row_count = len(columns['Avg_Assessment_Score'])
+        wants_stream = (
+            request.args.get('stream', '').lower() in ('1', 'true', 'yes') or
+            request.accept_mimetypes.best == 'application/x-ndjson'
+        )
+        
+        if wants_stream:
+            # Score and serialize chunk by chunk so huge batches never sit in memory as one JSON document
+            def generate():
+                for start in range(0, row_count, PREDICT_STREAM_CHUNK_ROWS):
+                    chunk = {name: values[start:start + PREDICT_STREAM_CHUNK_ROWS] for name, values in columns.items()}
+                    lines = [json.dumps(row) for row in score_legacy_batch(chunk, start)]
+                    yield '\n'.join(lines) + '\n'
+            
+            return Response(generate(), mimetype='application/x-ndjson')
+        
+        results = score_legacy_batch(columns)
+        
+        return jsonify({
+            "count": row_count,
+            "results": results,
+            "summary": {
+                "predicted_at_risk": sum(row['prediction'] for row in results),
+                "high_risk": sum(1 for row in results if row['risk_level'] == 'high'),
+                "medium_risk": sum(1 for row in results if row['risk_level'] == 'medium'),
+                "low_risk": sum(1 for row in results if row['risk_level'] == 'low')
+            },
+            "note": "Enhanced EduBoost prediction system - vectorized batch scoring"
+        })
+        
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Basic columns for legacy support
+LEGACY_BASIC_COLUMNS = list(feature_transform.BASE_FEATURES)
+
+# Rows per NDJSON chunk when streaming /predict/batch responses
+PREDICT_STREAM_CHUNK_ROWS = 5000
+
+# Rule-based risk scores at or above this are predicted at risk
+RULE_RISK_THRESHOLD = 0.4
+
+# Model probabilities at or above this are predicted at risk
+MODEL_RISK_THRESHOLD = 0.5
+
+def legacy_batch_columns(data):
+    """Convert legacy request fields into equal-length float64 column arrays.
+    
+    Scalars are broadcast to the length of the list-valued fields. Nulls and
+    non-finite numbers are rejected: they would score as NaN, which is not valid JSON.
+    """
+    columns = feature_transform.base_columns(data)
+    invalid = [name for name, values in columns.items() if not np.isfinite(values).all()]
+    if invalid:
+        raise feature_transform.FeatureSchemaError(f"Columns contain null or non-finite values: {invalid}")
+    return columns
+
+def predict_at_risk(columns, risk_scores):
+    """At-risk predictions from the trained model, or from the rule-based risk scores without one.
+    
+    Returns the predictions, the confidence in each, the model probabilities
+    (None for rules), which of the two scored the rows, and the risk scores
+    the response reports: the model probabilities when the model scored, so
+    that risk_score, risk_level and prediction always come from one scorer.
+    """
+    probabilities = current_services().inference.predict_proba(columns)
+    if probabilities is None:
+        return {
+            'predictions': (risk_scores >= RULE_RISK_THRESHOLD).astype(np.int64),
+            'confidences': np.minimum(risk_scores * 1.5, 1.0),
+            'probabilities': None,
+            'risk_scores': risk_scores,
+            'scored_by': 'rules'
+        }
+    
+    predictions = (probabilities >= MODEL_RISK_THRESHOLD).astype(np.int64)
+    return {
+        'predictions': predictions,
+        'confidences': np.where(predictions == 1, probabilities, 1 - probabilities),
+        'probabilities': probabilities,
+        'risk_scores': probabilities,
+        'scored_by': 'model'
+    }
+
+def score_legacy_batch(columns, start_index=0):
+    """Score legacy prediction columns in one vectorized pass.
+    
+    Applies the same derivations and thresholds as legacy_predict, row for row;
+    the rows of one call reach the model as part of a single inference batch.
+    """
+    avg_score = columns['Avg_Assessment_Score']
+    late_assignments = columns['Assignments_Late']
+    login_freq = columns['Login_Frequency']
+    
+    enhanced_data = {
+        'avg_assessment_score': avg_score,
+        'current_gpa': columns['Current_GPA'],
+        'attendance_rate': np.full(avg_score.shape, 85.0),  # Default assumption
+        'lab_completion_rate': np.maximum(0, avg_score - 10),  # Estimated based on assessment
+        'assignments_late': late_assignments,
+        'participation_score': np.maximum(0, avg_score - 5),  # Estimated
+        'login_frequency': login_freq,
+        'failed_module': (avg_score < 40).astype(np.float64)
+    }
+    
+    rule_risk_scores = risk_engine.calculate_risk_scores(enhanced_data)
+    scoring = predict_at_risk(columns, rule_risk_scores)
+    predictions, confidences, risk_scores = scoring['predictions'], scoring['confidences'], scoring['risk_scores']
+    risk_levels = risk_engine.risk_levels_from_scores(risk_scores)
+    
+    def grade(high, medium):
+        return np.where(high, risk_engine.LEVEL_HIGH, np.where(medium, risk_engine.LEVEL_MEDIUM, risk_engine.LEVEL_LOW))
+    
+    academic = grade(avg_score < 50, avg_score < 70)
+    behavioral = grade(late_assignments >= 3, late_assignments >= 1)
+    engagement = grade(login_freq < 10, login_freq < 20)
+    
+    names = risk_engine.LEVEL_NAMES
+    rows = [
+        {
+            "index": start_index + i,
+            "prediction": prediction,
+            "risk_score": round(risk_score, 3),
+            "confidence": round(confidence, 3),
+            "risk_level": names[level],
+            "scored_by": scoring['scored_by'],
+            "factors_analysis": {
+                "academic_risk": names[academic_level],
+                "behavioral_risk": names[behavioral_level],
+                "engagement_risk": names[engagement_level]
+            }
+        }
+        for i, (prediction, risk_score, confidence, level, academic_level, behavioral_level, engagement_level) in enumerate(zip(
+            predictions.tolist(), risk_scores.tolist(), confidences.tolist(), risk_levels.tolist(),
+            academic.tolist(), behavioral.tolist(), engagement.tolist()
+        ))
+    ]
+    if scoring['probabilities'] is not None:
+        for row, probability, rule_risk_score in zip(
+            rows, np.round(scoring['probabilities'], 4).tolist(), rule_risk_scores.tolist()
+        ):
+            row["probability"] = probability
+            row["rule_risk_score"] = round(rule_risk_score, 3)
+    return rows
+
 def generate_weekly_schedule(weak_modules, total_hours):
     """Generate personalized weekly study schedule"""
     schedule = {}
@@ -1559,12 +1833,34 @@ def generate_quick_recommendations(data):
 # APPLICATION STARTUP
 # =============================================================================
 
+def create_app(config=None):
+    """Build the Flask application; services start lazily on the first request that needs them"""
+    settings = dict(DEFAULT_CONFIG, **(config or {}))
+    
+    flask_app = Flask(__name__)
+    flask_app.config.update(settings)
+    flask_app.extensions['eduboost'] = Services(flask_app, settings['DATABASE_PATH'])
+    
+    # Configure CORS to allow requests from Next.js frontend
+    CORS(flask_app, origins=settings['CORS_ORIGINS'], supports_credentials=True)
+    flask_app.register_blueprint(api)
+    return flask_app
+
+# Default application for `python app.py`, serve.py and scripts that do `from app import app`
+app = create_app()
+services = app.extensions['eduboost']
+
+
 if __name__ == '__main__':
     print("🚀 Starting Enhanced EduBoost Educational Platform...")
     print("=" * 60)
     
-    # Initialize database
-    initialize_database()
+    # Create the services and load models before serving so the first request does not pay for them
+    if os.environ.get('EDUBOOST_WARMUP_MODELS', '1') == '1':
+        services.warm_up()
+    
+    # Pick up jobs left queued by a previous run
+    services.jobs.start()
     
     print("\n🌐 Starting Flask server on http://localhost:5000")
     print("\n📋 Enhanced API Endpoints:")
@@ -1572,10 +1868,22 @@ if __name__ == '__main__':
     print("   🎯 GET  /api/students/<id>/goals          - AI-generated personalized goals")
     print("   📚 GET  /api/students/<id>/planner        - Personalized study planner")
     print("   👨‍🏫 POST /api/lecturer/feedback           - Submit lecturer feedback")
+    print("   🗂️ POST /api/lecturer/feedback/bulk      - Submit many feedback records at once")
     print("   📈 POST /api/goals/<goal_id>/progress     - Update goal progress")
+    print("   📥 POST /api/performance/bulk             - Bulk CSV/NDJSON performance upload")
+    print("   🔎 GET  /api/resources/search?q=          - Full-text resource search")
     print("   📖 GET  /api/modules                      - List all modules")
+    print("   🗄️ GET  /api/system/db-pool               - Connection pool statistics")
+    print("   🧠 GET  /api/system/models                - Cached model statistics")
+    print("   🔬 GET  /api/system/inference             - Inference batching statistics")
+    print("   🔌 GET  /api/system/resource-client       - Resource API client statistics")
+    print("   ⚡ GET  /api/system/cache                 - Student cache statistics")
+    print("   🗃️ GET  /api/system/resource-catalog      - Resource catalog statistics")
+    print("   🧵 GET  /api/system/jobs                  - Background job queue statistics")
+    print("   📮 GET  /api/jobs/<job_id>                - Background job status")
     print("   🏥 POST /api/health/predict               - Health recommendations using ML model")
     print("   🔮 POST /predict                          - Legacy ML prediction")
+    print("   📦 POST /predict/batch                    - Vectorized batch prediction")
     
     print("\n🎓 Educational Platform Features:")
     print("   📊 14-field student performance tracking")
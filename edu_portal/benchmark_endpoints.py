@@ -0,0 +1,384 @@
+"""
+Benchmark every app.py endpoint in-process through Flask's test client.
+
+Each scenario is driven by concurrent client threads against a temporary
+database, with student ids drawn from a configurable distribution
+(uniform, zipf for a few hot students, or a single student). For every
+endpoint it reports p50/p95/p99 latency, requests/sec, and the peak
+memory allocated per request (tracemalloc, measured in a separate
+sequential pass so tracing does not slow the timed run).
+
+Results can be saved as a JSON baseline and later compared against it;
+compare mode exits non-zero when an endpoint regressed beyond the
+threshold, so it can gate a deploy.
+
+Usage:
+    python benchmark_endpoints.py --save baseline.json
+    python benchmark_endpoints.py --compare baseline.json --threshold 0.25
+    python benchmark_endpoints.py --endpoints performance,goals --distribution zipf --concurrency 8
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+import synthetic_cohort
+
+# path(student_id, fixtures) -> str; request(student_id, fixtures, rng) -> test client kwargs
+Scenario = namedtuple('Scenario', ['method', 'path', 'request'])
+
+DISTRIBUTIONS = ('uniform', 'zipf', 'single')
+
+# Scenarios whose requests queue goal regeneration or replace goals
+WRITE_SCENARIOS = ('lecturer_feedback', 'lecturer_feedback_bulk', 'goal_progress', 'performance_bulk')
+
+PREDICT_PAYLOAD = {
+    "Module_Difficulty": 3,
+    "Current_GPA": 2.8,
+    "Avg_Assessment_Score": 62,
+    "Assignments_Late": 1,
+    "Num_Submission_Attempts": 2,
+    "Login_Frequency": 12
+}
+
+HEALTH_PAYLOAD = {'mood': 3, 'stress_level': 4, 'procrastination_level': 3, 'sleep_hours': 6}
+
+# Metric -> True when higher is better
+METRICS = {
+    'p50_ms': False,
+    'p95_ms': False,
+    'p99_ms': False,
+    'requests_per_sec': True,
+    'alloc_kib_per_request': False
+}
+
+
+def no_body(student_id, fixtures, rng):
+    return {}
+
+
+def feedback_body(student_id, fixtures, rng):
+    return {'json': {
+        'student_id': student_id,
+        'module_name': synthetic_cohort.MODULES[int(rng.integers(len(synthetic_cohort.MODULES)))],
+        'lecturer_id': 'bench_lecturer',
+        'feedback_text': 'Benchmark feedback',
+        'weak_areas': ['Problem solving'],
+        'improvement_priority': 'medium'
+    }}
+
+
+def bulk_feedback_body(student_id, fixtures, rng):
+    return {'json': [feedback_body(student_id, fixtures, rng)['json'] for _ in range(20)]}
+
+
+def progress_body(student_id, fixtures, rng):
+    return {'json': {'progress': int(rng.integers(0, 100)), 'notes': 'benchmark'}}
+
+
+def performance_body(student_id, fixtures, rng):
+    lines = [json.dumps(record) for record in synthetic_cohort.generate_student_records(student_id)]
+    return {'data': '\n'.join(lines), 'content_type': 'application/x-ndjson'}
+
+
+def predict_batch_body(student_id, fixtures, rng):
+    return {'json': {name: [value] * 100 for name, value in PREDICT_PAYLOAD.items()}}
+
+
+def student_number(student_id):
+    return int(student_id[len('STUD'):])
+
+
+def goal_path(student_id, fixtures):
+    goal_ids = fixtures['goal_ids'].get(student_id) or fixtures['any_goal_ids']
+    return f'/api/goals/{goal_ids[student_number(student_id) % len(goal_ids)]}/progress'
+
+
+def job_path(student_id, fixtures):
+    return f"/api/jobs/{fixtures['job_ids'][student_number(student_id) % len(fixtures['job_ids'])]}"
+
+
+SCENARIOS = {
+    'health': Scenario('GET', lambda s, f: '/', no_body),
+    'performance': Scenario('GET', lambda s, f: f'/api/students/{s}/performance', no_body),
+    'goals': Scenario('GET', lambda s, f: f'/api/students/{s}/goals', no_body),
+    'planner': Scenario('GET', lambda s, f: f'/api/students/{s}/planner', no_body),
+    'lecturer_feedback': Scenario('POST', lambda s, f: '/api/lecturer/feedback', feedback_body),
+    'lecturer_feedback_bulk': Scenario('POST', lambda s, f: '/api/lecturer/feedback/bulk', bulk_feedback_body),
+    'goal_progress': Scenario('POST', goal_path, progress_body),
+    'performance_bulk': Scenario('POST', lambda s, f: '/api/performance/bulk', performance_body),
+    'resource_search': Scenario('GET', lambda s, f: '/api/resources/search?q=programming&limit=10', no_body),
+    'job_status': Scenario('GET', job_path, no_body),
+    'system_db_pool': Scenario('GET', lambda s, f: '/api/system/db-pool', no_body),
+    'system_models': Scenario('GET', lambda s, f: '/api/system/models', no_body),
+    'system_inference': Scenario('GET', lambda s, f: '/api/system/inference', no_body),
+    'system_resource_client': Scenario('GET', lambda s, f: '/api/system/resource-client', no_body),
+    'system_resource_catalog': Scenario('GET', lambda s, f: '/api/system/resource-catalog', no_body),
+    'system_cache': Scenario('GET', lambda s, f: '/api/system/cache', no_body),
+    'system_jobs': Scenario('GET', lambda s, f: '/api/system/jobs', no_body),
+    'modules': Scenario('GET', lambda s, f: '/api/modules', no_body),
+    'health_predict': Scenario('POST', lambda s, f: '/api/health/predict', lambda s, f, r: {'json': HEALTH_PAYLOAD}),
+    'predict': Scenario('POST', lambda s, f: '/predict', lambda s, f, r: {'json': PREDICT_PAYLOAD}),
+    'predict_batch': Scenario('POST', lambda s, f: '/predict/batch', predict_batch_body)
+}
+
+
+def student_ids(distribution, count, students, rng):
+    """`count` student ids drawn from `students` distinct ids"""
+    if distribution == 'single':
+        ranks = np.zeros(count, dtype=int)
+    elif distribution == 'zipf':
+        weights = 1 / np.arange(1, students + 1) ** 1.1
+        ranks = rng.choice(students, size=count, p=weights / weights.sum())
+    else:
+        ranks = rng.integers(students, size=count)
+    return [f'STUD{rank + 1:03d}' for rank in ranks]
+
+
+def create_benchmark_app(db_path):
+    """The app factory pointed at `db_path`, with every service warmed up"""
+    import app as eduboost_app
+    flask_app = eduboost_app.create_app({'DATABASE_PATH': db_path})
+    flask_app.extensions['eduboost'].warm_up()
+    return flask_app
+
+
+def drain_jobs(flask_app, timeout=60.0):
+    """Wait until background goal regeneration has caught up, so it does not overlap the next scenario"""
+    jobs = flask_app.extensions['eduboost'].jobs
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        counts = jobs.stats()['jobs_by_status']
+        if not counts.get('queued') and not counts.get('running'):
+            return True
+        time.sleep(0.1)
+    return False
+
+
+def collect_goal_ids(flask_app, students):
+    """Current goal ids per student (regeneration replaces goals, so re-read after writes)"""
+    client = flask_app.test_client()
+    goal_ids = {}
+    for student_id in (f'STUD{i + 1:03d}' for i in range(students)):
+        goals = client.get(f'/api/students/{student_id}/goals').get_json().get('goals', [])
+        if goals:
+            goal_ids[student_id] = [goal['goal_id'] for goal in goals]
+    return {
+        'goal_ids': goal_ids,
+        'any_goal_ids': [goal_id for ids in goal_ids.values() for goal_id in ids]
+    }
+
+
+def prepare_fixtures(flask_app, students):
+    """Goal and job ids that the progress and job-status scenarios refer to"""
+    client = flask_app.test_client()
+    rng = np.random.default_rng(0)
+    job_ids = [
+        client.post('/api/lecturer/feedback', **feedback_body(f'STUD{i + 1:03d}', None, rng)).get_json()['job_id']
+        for i in range(min(10, students))
+    ]
+    drain_jobs(flask_app)
+    return dict(collect_goal_ids(flask_app, students), job_ids=job_ids)
+
+
+def run_scenario(flask_app, scenario, fixtures, ids, concurrency, seed=0):
+    """Send one request per student id; returns (elapsed seconds, latencies in ms, error count)"""
+    local = threading.local()
+    rng_lock = threading.Lock()
+    rng = np.random.default_rng(seed)
+
+    def send(student_id):
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = flask_app.test_client()
+        with rng_lock:
+            kwargs = scenario.request(student_id, fixtures, rng)
+        started = time.perf_counter()
+        response = client.open(scenario.path(student_id, fixtures), method=scenario.method, **kwargs)
+        response.get_data()
+        return (time.perf_counter() - started) * 1000, response.status_code >= 400
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, ids))
+    elapsed = time.perf_counter() - started
+
+    latencies = np.array([latency for latency, _ in results])
+    return elapsed, latencies, sum(failed for _, failed in results)
+
+
+def allocation_per_request(flask_app, scenario, fixtures, ids, seed=0):
+    """Mean peak KiB allocated while handling one request (sequential, under tracemalloc)"""
+    client = flask_app.test_client()
+    rng = np.random.default_rng(seed)
+    peaks = []
+    for student_id in ids:
+        kwargs = scenario.request(student_id, fixtures, rng)
+        path = scenario.path(student_id, fixtures)
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        client.open(path, method=scenario.method, **kwargs).get_data()
+        peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    return float(np.mean(peaks)) / 1024
+
+
+def benchmark(flask_app, names, fixtures, requests, concurrency, distribution, students,
+              warmup=10, alloc_sample=20, seed=42):
+    """{endpoint: metrics} for the named scenarios"""
+    rng = np.random.default_rng(seed)
+    results = {}
+    for name in names:
+        scenario = SCENARIOS[name]
+        run_scenario(flask_app, scenario, fixtures, student_ids(distribution, warmup, students, rng), concurrency)
+        elapsed, latencies, errors = run_scenario(
+            flask_app, scenario, fixtures, student_ids(distribution, requests, students, rng), concurrency
+        )
+
+        tracemalloc.start()
+        try:
+            alloc_kib = allocation_per_request(
+                flask_app, scenario, fixtures, student_ids(distribution, alloc_sample, students, rng)
+            )
+        finally:
+            tracemalloc.stop()
+
+        if name in WRITE_SCENARIOS:
+            drain_jobs(flask_app)
+            fixtures.update(collect_goal_ids(flask_app, students))
+
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        results[name] = {
+            'requests': len(latencies),
+            'errors': int(errors),
+            'p50_ms': round(float(p50), 3),
+            'p95_ms': round(float(p95), 3),
+            'p99_ms': round(float(p99), 3),
+            'requests_per_sec': round(len(latencies) / elapsed, 1),
+            'alloc_kib_per_request': round(alloc_kib, 1)
+        }
+    return results
+
+
+def compare(results, baseline, threshold, min_delta_ms=0.5):
+    """[(endpoint, metric, baseline, current)] for metrics that regressed beyond `threshold`.
+
+    Any rise in failed requests is a regression: the latency of an endpoint
+    that only returns errors says nothing about the endpoint.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if previous is None:
+            continue
+        if metrics['errors'] > previous.get('errors', 0):
+            regressions.append((name, 'errors', previous.get('errors', 0), metrics['errors']))
+        for metric, higher_is_better in METRICS.items():
+            old, new = previous.get(metric), metrics[metric]
+            if not old:
+                continue
+            if higher_is_better:
+                regressed = new < old * (1 - threshold)
+            else:
+                regressed = new > old * (1 + threshold)
+                if metric.endswith('_ms') and new - old < min_delta_ms:
+                    # Sub-threshold jitter on sub-millisecond endpoints is not a regression
+                    regressed = False
+            if regressed:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def missing_from_baseline(results, baseline):
+    """Benchmarked endpoints the baseline has no numbers for (so nothing was compared)"""
+    return [name for name in results if name not in baseline.get('endpoints', {})]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark every EduBoost endpoint in-process')
+    parser.add_argument('--endpoints', help=f"Comma-separated scenarios (default: all of {', '.join(SCENARIOS)})")
+    parser.add_argument('--requests', type=int, default=200, help='Timed requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=4, help='Concurrent client threads')
+    parser.add_argument('--students', type=int, default=50, help='Distinct student ids')
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='uniform', help='Student id distribution')
+    parser.add_argument('--alloc-sample', type=int, default=20, help='Requests per endpoint traced for allocations')
+    parser.add_argument('--db', help='Database to run against (default: a fresh temporary one)')
+    parser.add_argument('--save', help='Write the results as a JSON baseline')
+    parser.add_argument('--compare', help='Baseline JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25, help='Allowed relative regression')
+    parser.add_argument('--min-delta-ms', type=float, default=0.5,
+                        help='Latency increases smaller than this are never regressions')
+    args = parser.parse_args(argv)
+
+    names = args.endpoints.split(',') if args.endpoints else list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(unknown)}")
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(prefix='eduboost_bench_'), 'eduboost.db')
+    flask_app = create_benchmark_app(db_path)
+    fixtures = prepare_fixtures(flask_app, args.students)
+
+    print("=" * 78)
+    print(f"EduBoost Endpoint Benchmark ({args.requests} requests/endpoint, {args.concurrency} threads, "
+          f"{args.distribution} over {args.students} students)")
+    print("=" * 78)
+    results = benchmark(flask_app, names, fixtures, args.requests, args.concurrency,
+                        args.distribution, args.students, alloc_sample=args.alloc_sample)
+
+    print(f"{'endpoint':<26}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}{'KiB/req':>9}{'errors':>8}")
+    for name, metrics in results.items():
+        print(f"{name:<26}{metrics['p50_ms']:>9.2f}{metrics['p95_ms']:>9.2f}{metrics['p99_ms']:>9.2f}"
+              f"{metrics['requests_per_sec']:>9.0f}{metrics['alloc_kib_per_request']:>9.1f}{metrics['errors']:>8}")
+    for name, metrics in results.items():
+        if metrics['errors']:
+            print(f"⚠️ {name}: {metrics['errors']}/{metrics['requests']} requests failed, its latencies are of the errors")
+
+    report = {
+        'meta': {
+            'created_at': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'requests': args.requests,
+            'concurrency': args.concurrency,
+            'distribution': args.distribution,
+            'students': args.students
+        },
+        'endpoints': results
+    }
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Baseline written to {args.save}")
+
+    status = 0
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        print("=" * 78)
+        for name in missing_from_baseline(results, baseline):
+            print(f"⚠️ {name}: not in {args.compare}, not compared")
+        if regressions:
+            for name, metric, old, new in regressions:
+                print(f"❌ {name}: {metric} {old} -> {new}")
+            print(f"❌ {len(regressions)} regression(s) beyond {args.threshold:.0%} of {args.compare}")
+            status = 1
+        else:
+            print(f"✅ No regressions beyond {args.threshold:.0%} of {args.compare}")
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
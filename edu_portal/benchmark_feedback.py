@@ -0,0 +1,108 @@
+"""
+Benchmark lecturer feedback submission: one POST per record versus
+/api/lecturer/feedback/bulk.
+
+Both paths submit the same synthetic records for a cohort of BENCH
+students against a running server and report records per second.
+
+Requirements:
+- requests library
+- Flask server running (default http://localhost:5000)
+
+Usage:
+    python benchmark_feedback.py --records 500 --batch-size 250
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import requests
+
+MODULES = (
+    "Database Management",
+    "Computer Networks",
+    "Web Development",
+    "Programming Fundamentals"
+)
+
+
+def make_records(count, students, seed=7):
+    """Deterministic feedback records spread over `students` students"""
+    rng = random.Random(seed)
+    return [
+        {
+            'student_id': f'BENCH{i % students:05d}',
+            'module_name': rng.choice(MODULES),
+            'lecturer_id': 'bench_lecturer',
+            'feedback_text': f'Benchmark feedback #{i}',
+            'weak_areas': rng.sample(['Concepts', 'Practice', 'Time Management', 'Exams'], 2),
+            'urgency_level': rng.randint(1, 5)
+        }
+        for i in range(count)
+    ]
+
+
+def bench_single(session, base_url, records):
+    started = time.perf_counter()
+    for record in records:
+        response = session.post(f'{base_url}/api/lecturer/feedback', json=record)
+        response.raise_for_status()
+    return time.perf_counter() - started
+
+
+def bench_bulk(session, base_url, records, batch_size, ndjson=False):
+    started = time.perf_counter()
+    for start in range(0, len(records), batch_size):
+        batch = records[start:start + batch_size]
+        if ndjson:
+            response = session.post(
+                f'{base_url}/api/lecturer/feedback/bulk',
+                data=''.join(json.dumps(record) + '\n' for record in batch),
+                headers={'Content-Type': 'application/x-ndjson'}
+            )
+        else:
+            response = session.post(f'{base_url}/api/lecturer/feedback/bulk', json=batch)
+        response.raise_for_status()
+        written = response.json()['records_written']
+        if written != len(batch):
+            raise RuntimeError(f'Bulk request wrote {written} of {len(batch)} records')
+    return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare single-record and bulk feedback submission')
+    parser.add_argument('--url', default='http://localhost:5000', help='Server base URL')
+    parser.add_argument('--records', type=int, default=500, help='Records per path')
+    parser.add_argument('--students', type=int, default=50, help='Distinct students in the cohort')
+    parser.add_argument('--batch-size', type=int, default=250, help='Records per bulk request')
+    args = parser.parse_args(argv)
+
+    records = make_records(args.records, args.students)
+    session = requests.Session()
+
+    print("📊 Lecturer Feedback Submission Benchmark")
+    print("=" * 60)
+    print(f"   {args.records:,} records, {args.students} students, bulk batches of {args.batch_size}")
+
+    try:
+        results = {
+            'single': bench_single(session, args.url, records),
+            'bulk (JSON array)': bench_bulk(session, args.url, records, args.batch_size),
+            'bulk (NDJSON)': bench_bulk(session, args.url, records, args.batch_size, ndjson=True)
+        }
+    except requests.exceptions.ConnectionError:
+        print(f"❌ Could not connect to {args.url}. Make sure the Flask server is running.")
+        return 1
+
+    baseline = results['single']
+    for name, elapsed in results.items():
+        print(f"✅ {name:<18} {elapsed:8.3f}s  {args.records / elapsed:10,.0f} records/sec  "
+              f"({baseline / elapsed:5.1f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Benchmark request throughput of a running EduBoost server, e.g. the
+Werkzeug dev server (python app.py) against gunicorn (python serve.py).
+
+A fixed mix of read endpoints and /predict calls is sent from concurrent
+client threads, each with its own keep-alive session.
+
+Requirements:
+- requests library
+- Flask server running (default http://localhost:5000)
+
+Usage:
+    python benchmark_serving.py --requests 2000 --concurrency 16
+"""
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import requests
+
+PREDICT_PAYLOAD = {
+    "Module_Difficulty": 3,
+    "Current_GPA": 2.8,
+    "Avg_Assessment_Score": 62,
+    "Assignments_Late": 1,
+    "Num_Submission_Attempts": 2,
+    "Login_Frequency": 12
+}
+
+
+def request_mix(count, students):
+    """(method, path, json) tuples cycling through the benchmarked endpoints"""
+    mix = []
+    for i in range(count):
+        student_id = f'STUD{i % students + 1:03d}'
+        kind = i % 4
+        if kind == 0:
+            mix.append(('GET', f'/api/students/{student_id}/performance', None))
+        elif kind == 1:
+            mix.append(('GET', f'/api/students/{student_id}/goals', None))
+        elif kind == 2:
+            mix.append(('GET', '/api/modules', None))
+        else:
+            mix.append(('POST', '/predict', PREDICT_PAYLOAD))
+    return mix
+
+
+def run(base_url, mix, concurrency):
+    """Send every request in `mix`; returns (elapsed seconds, latencies in ms, error count)"""
+    local = threading.local()
+
+    def send(item):
+        method, path, payload = item
+        session = getattr(local, 'session', None)
+        if session is None:
+            session = local.session = requests.Session()
+        started = time.perf_counter()
+        response = session.request(method, base_url + path, json=payload)
+        return (time.perf_counter() - started) * 1000, response.status_code >= 400
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(send, mix))
+    elapsed = time.perf_counter() - started
+
+    latencies = np.array([latency for latency, _ in results])
+    errors = sum(failed for _, failed in results)
+    return elapsed, latencies, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Measure request throughput of a running server')
+    parser.add_argument('--url', default='http://localhost:5000', help='Server base URL')
+    parser.add_argument('--requests', type=int, default=2000, help='Requests to send')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent client threads')
+    parser.add_argument('--students', type=int, default=50, help='Distinct student ids in the mix')
+    args = parser.parse_args(argv)
+
+    print("📊 EduBoost Serving Benchmark")
+    print("=" * 60)
+    try:
+        # Warm-up pass so first-visit goal generation is not part of the measurement
+        run(args.url, request_mix(args.students * 4, args.students), args.concurrency)
+        elapsed, latencies, errors = run(args.url, request_mix(args.requests, args.students), args.concurrency)
+    except requests.exceptions.ConnectionError:
+        print(f"❌ Could not connect to {args.url}. Make sure the server is running.")
+        return 1
+
+    print(f"   {args.requests:,} requests, {args.concurrency} concurrent clients against {args.url}")
+    print(f"✅ Throughput: {args.requests / elapsed:,.0f} requests/sec ({elapsed:.2f}s)")
+    print(f"⏱️ Latency: p50 {np.percentile(latencies, 50):.1f} ms, "
+          f"p95 {np.percentile(latencies, 95):.1f} ms, p99 {np.percentile(latencies, 99):.1f} ms")
+    if errors:
+        print(f"⚠️ {errors} requests returned an error status")
+    return 0 if errors == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
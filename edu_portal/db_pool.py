@@ -0,0 +1,275 @@
+"""
+EduBoost SQLite Connection Pool
+Pooled, per-thread SQLite connections shared by the Flask apps
+
+Every connection is opened once with WAL journaling and tuned pragmas, then
+handed back to the pool when the request is done instead of being closed.
+Prepared statements are cached per connection, so repeated queries skip the
+SQL parse step as long as the connection stays alive.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+# Pragmas applied to every new connection
+DEFAULT_PRAGMAS = {
+    'journal_mode': 'WAL',          # readers never block the writer
+    'synchronous': 'NORMAL',        # safe with WAL, avoids an fsync per commit
+    'cache_size': -20000,           # ~20 MB page cache per connection
+    'mmap_size': 268435456,         # 256 MB memory-mapped I/O
+    'temp_store': 'MEMORY',
+    'busy_timeout': 5000            # ms to wait on a locked database
+}
+
+DEFAULT_POOL_SIZE = int(os.environ.get('EDUBOOST_DB_POOL_SIZE', 8))
+DEFAULT_STATEMENT_CACHE = 256
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available in time"""
+
+
+class ConnectionPool:
+    """Bounded pool of SQLite connections with per-thread checkout"""
+
+    def __init__(self, db_path, max_size=DEFAULT_POOL_SIZE, timeout=30.0,
+                 pragmas=None, cached_statements=DEFAULT_STATEMENT_CACHE):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        self.cached_statements = cached_statements
+
+        self._idle = deque()
+        self._created = 0
+        self._condition = threading.Condition(threading.Lock())
+        self._local = threading.local()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'waits': 0,
+            'timeouts': 0,
+            'total_wait_ms': 0.0,
+            'max_wait_ms': 0.0
+        }
+
+    # -------------------------------------------------------------------------
+    # Connection lifecycle
+    # -------------------------------------------------------------------------
+
+    def _connect(self):
+        """Open a new connection and apply the configured pragmas"""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        for name, value in self.pragmas.items():
+            conn.execute(f'PRAGMA {name} = {value}')
+        return conn
+
+    def _acquire(self):
+        """Take an idle connection or open a new one, waiting if the pool is full"""
+        started = time.perf_counter()
+        waited = False
+
+        with self._condition:
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    self._stats['hits'] += 1
+                    break
+
+                if self._created < self.max_size:
+                    self._created += 1
+                    self._stats['misses'] += 1
+                    conn = None
+                    break
+
+                waited = True
+                remaining = self.timeout - (time.perf_counter() - started)
+                if remaining <= 0 or not self._condition.wait(remaining):
+                    if not self._idle:
+                        self._stats['timeouts'] += 1
+                        raise PoolTimeoutError(
+                            f'No database connection available after {self.timeout}s'
+                        )
+
+            wait_ms = (time.perf_counter() - started) * 1000
+            if waited:
+                self._stats['waits'] += 1
+            self._stats['total_wait_ms'] += wait_ms
+            self._stats['max_wait_ms'] = max(self._stats['max_wait_ms'], wait_ms)
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._condition:
+                    self._created -= 1
+                    self._condition.notify()
+                raise
+
+        return conn
+
+    def _release(self, conn):
+        """Return a connection to the idle set"""
+        if conn.in_transaction:
+            conn.rollback()
+
+        with self._condition:
+            self._idle.append(conn)
+            self._condition.notify()
+
+    def _discard(self, conn):
+        """Drop a broken connection and free its slot"""
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+        with self._condition:
+            self._created -= 1
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the current thread.
+
+        Nested calls on the same thread reuse the connection that is already
+        checked out, so helpers can open their own block inside a handler.
+        """
+        held = getattr(self._local, 'conn', None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._acquire()
+        self._local.conn = conn
+        self._local.depth = 1
+        broken = False
+        try:
+            yield conn
+        except sqlite3.DatabaseError as e:
+            broken = not isinstance(e, (sqlite3.IntegrityError, sqlite3.OperationalError))
+            raise
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            if broken:
+                self._discard(conn)
+            else:
+                self._release(conn)
+
+    @contextmanager
+    def transaction(self, immediate=False):
+        """Yield a cursor inside a transaction; commit on success, roll back on error.
+
+        With immediate=True the write lock is taken up front (BEGIN IMMEDIATE), so
+        read-then-write transactions cannot fail to upgrade under concurrent writers.
+
+        A transaction opened inside another one on the same thread becomes a
+        SAVEPOINT: on error only the inner block is rolled back, and nothing is
+        committed until the outermost block exits.
+        """
+        with self.connection() as conn:
+            depth = getattr(self._local, 'transactions', 0)
+            cursor = conn.cursor()
+            if depth:
+                savepoint = f'eduboost_sp{depth}'
+                cursor.execute(f'SAVEPOINT {savepoint}')
+            elif not conn.in_transaction:
+                # Always open the transaction explicitly, so a nested SAVEPOINT never starts (and commits) its own
+                cursor.execute('BEGIN IMMEDIATE' if immediate else 'BEGIN')
+
+            self._local.transactions = depth + 1
+            try:
+                yield cursor
+            except BaseException:
+                if depth:
+                    cursor.execute(f'ROLLBACK TO {savepoint}')
+                    cursor.execute(f'RELEASE {savepoint}')
+                else:
+                    conn.rollback()
+                raise
+            else:
+                if depth:
+                    cursor.execute(f'RELEASE {savepoint}')
+                else:
+                    conn.commit()
+            finally:
+                self._local.transactions = depth
+                cursor.close()
+
+    def close(self):
+        """Close all idle connections (checked-out connections close on release)"""
+        with self._condition:
+            while self._idle:
+                self._idle.pop().close()
+                self._created -= 1
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict:
+        """Return pool hit/miss counters and wait-time statistics"""
+        with self._condition:
+            stats = dict(self._stats)
+            checkouts = stats['hits'] + stats['misses']
+            stats.update({
+                'db_path': self.db_path,
+                'max_size': self.max_size,
+                'open_connections': self._created,
+                'idle_connections': len(self._idle),
+                'checkouts': checkouts,
+                'hit_rate': round(stats['hits'] / checkouts, 4) if checkouts else 0.0,
+                'avg_wait_ms': round(stats['total_wait_ms'] / checkouts, 4) if checkouts else 0.0,
+                'total_wait_ms': round(stats['total_wait_ms'], 4),
+                'max_wait_ms': round(stats['max_wait_ms'], 4)
+            })
+        return stats
+
+
+# =============================================================================
+# POOL REGISTRY
+# =============================================================================
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path, **kwargs) -> ConnectionPool:
+    """Get the process-wide pool for a database file, creating it on first use"""
+    key = os.path.abspath(db_path)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(key, **kwargs)
+                _pools[key] = pool
+    return pool
+
+
+def close_all_pools(db_path: Optional[str] = None):
+    """Close idle connections of one pool, or of every pool"""
+    with _pools_lock:
+        if db_path is not None:
+            pools = [_pools.pop(os.path.abspath(db_path), None)]
+        else:
+            pools = list(_pools.values())
+            _pools.clear()
+
+    for pool in pools:
+        if pool is not None:
+            pool.close()
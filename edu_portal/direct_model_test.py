@@ -3,42 +3,36 @@ Direct Model Inspection and Testing
 Inspect the actual model file and test it properly
 """
 
-import pickle
 import pandas as pd
 import numpy as np
 from sklearn.metrics import accuracy_score, classification_report
 import os
 import sys
 
-def inspect_pickle_file():
-    """Inspect the pickle file contents in detail"""
+import model_artifact
+
+def inspect_model_artifact():
+    """Verify the model artifact and inspect its contents in detail"""
     try:
-        model_path = os.path.join('model', 'eduboost_ultra_accuracy_model.pkl')
-        
-        print("🔍 Inspecting pickle file structure...")
+        print("🔍 Inspecting model artifact structure...")
         
-        with open(model_path, 'rb') as f:
-            # Load with error handling
-            try:
-                model = pickle.load(f)
-                print("✅ Model loaded successfully!")
-            except Exception as e:
-                print(f"❌ Pickle load error: {e}")
-                return None
+        # Load with error handling (an artifact's checksum is verified before anything is used)
+        try:
+            model = model_artifact.load_model(os.path.join('model', 'eduboost_ultra_accuracy_model.pkl'))
+            print("✅ Model loaded successfully!")
+        except model_artifact.ArtifactError as e:
+            print(f"❌ Artifact load error: {e}")
+            return None
         
         # Inspect model type and structure
-        print(f"📋 Model type: {type(model)}")
-        
-        if hasattr(model, '__dict__'):
-            attrs = [attr for attr in dir(model) if not attr.startswith('_')]
-            print(f"📋 Model attributes: {attrs[:10]}...")  # Show first 10
-        
-        if isinstance(model, dict):
-            print(f"📋 Dictionary keys: {list(model.keys())}")
-            for key, value in model.items():
-                print(f"   {key}: {type(value)}")
+        if not isinstance(model, model_artifact.ArtifactModel):
+            print(f"📋 Unpickled model type: {type(model).__name__}")
+            return model
+        for key, value in model.describe().items():
+            print(f"📋 {key}: {value}")
+        for name, values in model.arrays.items():
+            print(f"   {name}: {values.dtype} {values.shape}")
         
-        # Try to understand the structure
         return model
         
     except Exception as e:
@@ -105,7 +99,7 @@ def test_with_actual_model():
     print("=" * 50)
     
     # First inspect the model
-    model = inspect_pickle_file()
+    model = inspect_model_artifact()
     
     if model is None:
         print("❌ Could not load model, creating test model instead...")
@@ -172,9 +166,6 @@ def test_with_actual_model():
         # Try different prediction methods
         if hasattr(model, 'predict'):
             y_pred = model.predict(X_test)
-        elif isinstance(model, dict) and 'xgb_model' in model:
-            xgb_model = model['xgb_model']
-            y_pred = xgb_model.predict(X_test)
         else:
             # Fallback to rule-based
             print("⚠️ Using rule-based fallback...")
@@ -12,8 +12,6 @@ AI Models: Performance analysis, goal generation, resource recommendation
 """
 
 from flask import Flask, request, jsonify, render_template_string
-import pandas as pd
-import pickle
 import os
 import numpy as np
 from datetime import datetime, timedelta
@@ -22,114 +20,34 @@ import json
 import sqlite3
 from typing import Dict, List, Optional
 import uuid
+from db_pool import get_pool
+from migrations import apply_migrations, schema_version
+import synthetic_cohort
+import model_artifact
+from resource_catalog import RECOMMENDATION_CATEGORIES, ResourceCatalog
 
 # Initialize Flask app
 app = Flask(__name__)
 
+# Shared connection pool for the (working-directory relative) database
+DB_PATH = 'eduboost.db'
+
+def get_db_pool():
+    """Get the shared connection pool for the application database"""
+    return get_pool(DB_PATH)
+
+# In-memory learning_resources index, built on first lookup
+resource_catalog = ResourceCatalog(get_db_pool())
+
 # =============================================================================
 # DATABASE SETUP AND MODELS
 # =============================================================================
 
 def initialize_database():
-    """Initialize SQLite database with enhanced schema"""
-    conn = sqlite3.connect('eduboost.db')
-    cursor = conn.cursor()
-    
-    # Student Performance Table (Enhanced with 14 fields)
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS student_performance (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id TEXT NOT NULL,
-            module_name TEXT NOT NULL,
-            module_difficulty REAL,
-            current_gpa REAL,
-            avg_assessment_score INTEGER,
-            assignments_late INTEGER,
-            num_submission_attempts INTEGER,
-            login_frequency INTEGER,
-            attendance_rate REAL,
-            lab_completion_rate REAL,
-            participation_score INTEGER,
-            failed_module INTEGER,
-            semester TEXT,
-            risk_score REAL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Lecturer Feedback Table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS lecturer_feedback (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            student_id TEXT NOT NULL,
-            module_name TEXT NOT NULL,
-            lecturer_id TEXT NOT NULL,
-            feedback_text TEXT,
-            weak_areas TEXT, -- JSON string
-            strength_areas TEXT, -- JSON string
-            recommended_actions TEXT, -- JSON string
-            urgency_level INTEGER CHECK (urgency_level BETWEEN 1 AND 5),
-            improvement_timeline TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Student Goals Table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS student_goals (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            goal_id TEXT UNIQUE NOT NULL,
-            student_id TEXT NOT NULL,
-            module_name TEXT,
-            goal_title TEXT NOT NULL,
-            goal_description TEXT,
-            goal_type TEXT, -- "skill_improvement", "assignment_completion", "resource_study"
-            priority_level TEXT, -- "high", "medium", "low"
-            target_completion_date DATE,
-            current_progress INTEGER DEFAULT 0, -- 0-100%
-            is_completed BOOLEAN DEFAULT FALSE,
-            generated_by TEXT DEFAULT 'ai', -- "ai", "lecturer", "student"
-            success_criteria TEXT, -- JSON string
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Learning Resources Table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS learning_resources (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            module_name TEXT NOT NULL,
-            resource_type TEXT, -- "book", "online", "video", "practice", "tutorial"
-            resource_title TEXT NOT NULL,
-            resource_url TEXT,
-            resource_author TEXT,
-            difficulty_level INTEGER CHECK (difficulty_level BETWEEN 1 AND 5),
-            topic_tags TEXT, -- JSON string
-            rating REAL,
-            estimated_hours INTEGER,
-            description TEXT,
-            is_free BOOLEAN DEFAULT TRUE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    
-    # Goal Resources Mapping
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS goal_resources (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            goal_id TEXT NOT NULL,
-            resource_id INTEGER,
-            relevance_score REAL,
-            recommended_by TEXT DEFAULT 'ai',
-            FOREIGN KEY (resource_id) REFERENCES learning_resources (id)
-        )
-    ''')
-    
-    conn.commit()
-    conn.close()
-    print("✅ Database initialized successfully")
+    """Initialize SQLite database by applying pending schema migrations"""
+    with get_db_pool().connection() as conn:
+        apply_migrations(conn)
+        print(f"✅ Database initialized successfully (schema v{schema_version(conn)})")
 
 # =============================================================================
 # ENHANCED AI SYSTEM
@@ -158,9 +76,7 @@ class EnhancedEduBoostAI:
     def load_model(self):
         """Load the machine learning model"""
         try:
-            model_path = os.path.join('model', 'eduboost_ultra_accuracy_model.pkl')
-            with open(model_path, 'rb') as f:
-                self.model = pickle.load(f)
+            self.model = model_artifact.load_model(os.path.join('model', 'eduboost_ultra_accuracy_model.pkl'))
             print("✅ Enhanced ML model loaded successfully")
         except Exception as e:
             print(f"⚠️ Model loading failed: {e}")
@@ -169,32 +85,26 @@ class EnhancedEduBoostAI:
     
     def initialize_resources(self):
         """Initialize comprehensive resource database"""
-        conn = sqlite3.connect('eduboost.db')
-        cursor = conn.cursor()
-        
-        # Check if resources already exist
-        cursor.execute("SELECT COUNT(*) FROM learning_resources")
-        count = cursor.fetchone()[0]
-        
-        if count == 0:
-            resources = self.get_comprehensive_resources()
-            for resource in resources:
-                cursor.execute('''
+        with get_db_pool().transaction() as cursor:
+            # Check if resources already exist
+            cursor.execute("SELECT COUNT(*) FROM learning_resources")
+            count = cursor.fetchone()[0]
+            
+            if count == 0:
+                resources = self.get_comprehensive_resources()
+                cursor.executemany('''
                     INSERT INTO learning_resources 
                     (module_name, resource_type, resource_title, resource_url, resource_author,
                      difficulty_level, topic_tags, rating, estimated_hours, description, is_free)
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
+                ''', [(
                     resource['module_name'], resource['resource_type'], resource['resource_title'],
                     resource['resource_url'], resource['resource_author'], resource['difficulty_level'],
                     json.dumps(resource['topic_tags']), resource['rating'], resource['estimated_hours'],
                     resource['description'], resource['is_free']
-                ))
-            
-            conn.commit()
-            print("✅ Resource database initialized")
-        
-        conn.close()
+                ) for resource in resources])
+                
+                print("✅ Resource database initialized")
     
     def get_comprehensive_resources(self):
         """Get comprehensive learning resources for all modules"""
@@ -610,9 +520,6 @@ class EnhancedEduBoostAI:
     
     def get_personalized_resources(self, student_profile, goals):
         """Get personalized learning resources based on goals and performance"""
-        conn = sqlite3.connect('eduboost.db')
-        cursor = conn.cursor()
-        
         recommendations = {
             'books': [],
             'online_courses': [],
@@ -623,47 +530,13 @@ class EnhancedEduBoostAI:
         # Get modules from goals
         goal_modules = list(set([goal['module_name'] for goal in goals if goal['module_name'] != 'General']))
         
-        for module in goal_modules:
-            # Get resources for this module
-            cursor.execute('''
-                SELECT * FROM learning_resources 
-                WHERE module_name = ?
-                ORDER BY rating DESC, difficulty_level ASC
-            ''', (module,))
-            
-            module_resources = cursor.fetchall()
-            
-            for resource in module_resources:
-                resource_dict = {
-                    'id': resource[0],
-                    'module_name': resource[1],
-                    'resource_type': resource[2],
-                    'resource_title': resource[3],
-                    'resource_url': resource[4],
-                    'resource_author': resource[5],
-                    'difficulty_level': resource[6],
-                    'topic_tags': json.loads(resource[7]) if resource[7] else [],
-                    'rating': resource[8],
-                    'estimated_hours': resource[9],
-                    'description': resource[10],
-                    'is_free': resource[11]
-                }
-                
-                # Categorize resources
-                if resource_dict['resource_type'] == 'book':
-                    recommendations['books'].append(resource_dict)
-                elif resource_dict['resource_type'] == 'online':
-                    recommendations['online_courses'].append(resource_dict)
-                elif resource_dict['resource_type'] == 'practice':
-                    recommendations['practice_platforms'].append(resource_dict)
-                elif resource_dict['resource_type'] == 'video':
-                    recommendations['video_tutorials'].append(resource_dict)
-        
-        conn.close()
-        
-        # Limit recommendations per category
-        for category in recommendations:
-            recommendations[category] = recommendations[category][:5]
+        # Each module's resources are pre-sorted by rating in the in-memory catalog
+        catalog = resource_catalog.snapshot()
+        for category, resource_types in RECOMMENDATION_CATEGORIES.items():
+            for module in goal_modules:
+                remaining = 5 - len(recommendations[category])
+                if remaining > 0:
+                    recommendations[category].extend(catalog.top([module], resource_types, limit=remaining))
         
         return recommendations
 
@@ -673,86 +546,8 @@ class EnhancedEduBoostAI:
 
 def generate_enhanced_student_data(student_id):
     """Generate comprehensive student performance data with 14 fields"""
-    performance_data = []
-    random.seed(hash(student_id) % 1000)  # Consistent data per student
-    
-    modules = [
-        "Introduction to Computer Science",
-        "Mathematics for Computing", 
-        "Programming Fundamentals",
-        "Object Oriented Programming",
-        "Computer Networks",
-        "Operating System",
-        "Introduction to Machine Learning",
-        "Web Development",
-        "Electronics and Computer System Architecture",
-        "Database Management"
-    ]
-    
-    # Generate base student profile
-    base_ability = random.normalvariate(0, 1)  # Student's general academic ability
-    current_gpa = max(0.0, min(4.0, 2.5 + base_ability * 0.8))
-    current_semester = random.choice(['Fall2024', 'Spring2025', 'Summer2025'])
-    
-    for module in modules:
-        # Module-specific difficulty
-        module_difficulty = random.uniform(2.0, 4.5)
-        
-        # Correlated performance metrics
-        base_score = max(0, min(100, 60 + base_ability * 20 + random.normalvariate(0, 15)))
-        avg_assessment_score = int(base_score)
-        
-        # Behavioral metrics correlated with performance
-        attendance_rate = max(30, min(100, base_score + random.normalvariate(10, 15)))
-        lab_completion_rate = max(0, min(100, base_score + random.normalvariate(5, 20)))
-        participation_score = max(0, min(100, base_score + random.normalvariate(-5, 15)))
-        
-        # Submission patterns
-        if base_score < 50:
-            assignments_late = random.poisson(3)
-            num_submission_attempts = random.poisson(2.5) + 1
-        else:
-            assignments_late = random.poisson(0.8)
-            num_submission_attempts = random.poisson(1.2) + 1
-        
-        # Engagement metrics
-        login_frequency = max(1, int(10 + base_ability * 8 + random.normalvariate(0, 5)))
-        
-        # Risk indicators
-        failed_module = 1 if (base_score < 40 and random.random() < 0.7) else 0
-        
-        # Calculate risk score
-        risk_score = calculate_risk_score({
-            'avg_assessment_score': avg_assessment_score,
-            'current_gpa': current_gpa,
-            'attendance_rate': attendance_rate,
-            'lab_completion_rate': lab_completion_rate,
-            'assignments_late': assignments_late,
-            'participation_score': participation_score,
-            'login_frequency': login_frequency,
-            'failed_module': failed_module
-        })
-        
-        module_data = {
-            'student_id': student_id,
-            'module_name': module,
-            'module_difficulty': round(module_difficulty, 2),
-            'current_gpa': round(current_gpa, 2),
-            'avg_assessment_score': avg_assessment_score,
-            'assignments_late': min(assignments_late, 10),
-            'num_submission_attempts': min(num_submission_attempts, 8),
-            'login_frequency': login_frequency,
-            'attendance_rate': round(attendance_rate, 2),
-            'lab_completion_rate': round(lab_completion_rate, 2),
-            'participation_score': int(participation_score),
-            'failed_module': failed_module,
-            'semester': current_semester,
-            'risk_score': round(risk_score, 3)
-        }
-        
-        performance_data.append(module_data)
-    
-    return performance_data
+    # Deterministic per student id and safe to call from concurrent requests
+    return synthetic_cohort.generate_student_records(student_id)
 
 def calculate_risk_score(data):
     """Calculate comprehensive risk score"""
@@ -867,6 +662,7 @@ def health_check():
             'POST /api/lecturer/feedback - Submit lecturer feedback',
             'POST /api/goals/<goal_id>/progress - Update goal progress',
             'GET /api/modules - List all available modules',
+            'GET /api/system/db-pool - Database connection pool statistics',
             'POST /predict - Legacy ML prediction'
         ],
         'database_features': [
@@ -1030,29 +826,25 @@ def submit_enhanced_lecturer_feedback():
             return jsonify({'error': 'Missing required fields', 'required': required_fields}), 400
         
         # Store feedback in database
-        conn = sqlite3.connect('eduboost.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO lecturer_feedback 
-            (student_id, module_name, lecturer_id, feedback_text, weak_areas, 
-             strength_areas, recommended_actions, urgency_level, improvement_timeline)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            data['student_id'],
-            data['module_name'],
-            data['lecturer_id'],
-            data['feedback_text'],
-            json.dumps(data.get('weak_areas', [])),
-            json.dumps(data.get('strength_areas', [])),
-            json.dumps(data.get('recommended_actions', [])),
-            data.get('urgency_level', 3),
-            data.get('improvement_timeline', '2 weeks')
-        ))
-        
-        feedback_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        with get_db_pool().transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO lecturer_feedback 
+                (student_id, module_name, lecturer_id, feedback_text, weak_areas, 
+                 strength_areas, recommended_actions, urgency_level, improvement_timeline)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                data['student_id'],
+                data['module_name'],
+                data['lecturer_id'],
+                data['feedback_text'],
+                json.dumps(data.get('weak_areas', [])),
+                json.dumps(data.get('strength_areas', [])),
+                json.dumps(data.get('recommended_actions', [])),
+                data.get('urgency_level', 3),
+                data.get('improvement_timeline', '2 weeks')
+            ))
+            
+            feedback_id = cursor.lastrowid
         
         # Trigger goal regeneration for the student
         # In a real system, this would be done asynchronously
@@ -1084,27 +876,21 @@ def update_goal_progress(goal_id):
             return jsonify({'error': 'Progress must be between 0 and 100'}), 400
         
         # Update goal in database
-        conn = sqlite3.connect('eduboost.db')
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            UPDATE student_goals 
-            SET current_progress = ?, is_completed = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE goal_id = ?
-        ''', (new_progress, new_progress >= 100, goal_id))
-        
-        if cursor.rowcount == 0:
-            conn.close()
-            return jsonify({'error': 'Goal not found'}), 404
-        
-        # Record progress update
-        cursor.execute('''
-            INSERT INTO student_progress (goal_id, progress_update, notes, updated_by)
-            VALUES (?, ?, ?, ?)
-        ''', (goal_id, new_progress, notes, 'student'))
-        
-        conn.commit()
-        conn.close()
+        with get_db_pool().transaction() as cursor:
+            cursor.execute('''
+                UPDATE student_goals 
+                SET current_progress = ?, is_completed = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE goal_id = ?
+            ''', (new_progress, new_progress >= 100, goal_id))
+            
+            if cursor.rowcount == 0:
+                return jsonify({'error': 'Goal not found'}), 404
+            
+            # Record progress update
+            cursor.execute('''
+                INSERT INTO student_progress (goal_id, progress_update, notes, updated_by)
+                VALUES (?, ?, ?, ?)
+            ''', (goal_id, new_progress, notes, 'student'))
         
         return jsonify({
             'goal_id': goal_id,
@@ -1117,6 +903,11 @@ def update_goal_progress(goal_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/system/db-pool', methods=['GET'])
+def get_db_pool_stats():
+    """Get connection pool hit/miss and wait-time statistics"""
+    return jsonify(get_db_pool().stats())
+
 @app.route('/api/modules', methods=['GET'])
 def get_available_modules():
     """Get list of all available modules"""
@@ -0,0 +1,154 @@
+"""
+EduBoost Feature Transform
+The 32-column model input built from the six basic prediction fields
+
+One definition of the derived features (ratios, categories, interactions,
+composite risks) shared by batch evaluation and online scoring. Every
+feature is a column operation written straight into a preallocated float32
+matrix, so a million rows cost about as much as one.
+
+Column order is part of the model contract: FEATURE_NAMES never changes
+within a FEATURE_VERSION, and a model trained on one version must not be
+fed another (see check_feature_names).
+"""
+
+import hashlib
+from typing import Mapping, Optional, Sequence
+
+import numpy as np
+
+# Bump whenever a feature is added, removed, reordered or redefined
+FEATURE_VERSION = 1
+
+BASE_FEATURES = (
+    'Module_Difficulty', 'Current_GPA', 'Avg_Assessment_Score',
+    'Assignments_Late', 'Num_Submission_Attempts', 'Login_Frequency'
+)
+
+DERIVED_FEATURES = (
+    'GPA_Assessment_Ratio', 'Late_Submission_Ratio', 'Performance_Index', 'Risk_Score_Basic',
+    'Engagement_Level', 'Academic_Stress', 'Success_Probability', 'Submission_Efficiency',
+    'GPA_Category', 'Assessment_Category', 'Late_Category', 'Login_Category',
+    'Difficulty_GPA_Interaction', 'Assessment_Login_Interaction', 'Late_GPA_Interaction',
+    'Composite_Risk_1', 'Composite_Risk_2', 'Performance_Variance',
+    'Normalized_GPA', 'Normalized_Assessment', 'Normalized_Login',
+    'Binary_High_Risk_GPA', 'Binary_Low_Assessment', 'Binary_Late_Issues', 'Binary_Low_Engagement',
+    'Overall_Performance_Score'
+)
+
+FEATURE_NAMES = BASE_FEATURES + DERIVED_FEATURES
+FEATURE_COUNT = len(FEATURE_NAMES)
+
+# Identifies the exact column layout, e.g. for storing next to a trained model
+FEATURE_SCHEMA_ID = 'v{}-{}'.format(
+    FEATURE_VERSION, hashlib.sha256('\x1f'.join(FEATURE_NAMES).encode('utf-8')).hexdigest()[:12]
+)
+
+FEATURE_DTYPE = np.float32
+
+
+class FeatureSchemaError(ValueError):
+    """Input columns or a model's expected features do not match this transform"""
+
+
+def check_feature_names(names: Sequence[str]):
+    """Raise FeatureSchemaError unless `names` is exactly FEATURE_NAMES, in order"""
+    names = tuple(names)
+    if names != FEATURE_NAMES:
+        missing = [name for name in FEATURE_NAMES if name not in names]
+        unexpected = [name for name in names if name not in FEATURE_NAMES]
+        raise FeatureSchemaError(
+            f"Model expects a different feature layout than {FEATURE_SCHEMA_ID} "
+            f"(missing: {missing}, unexpected: {unexpected}, order differs: {not missing and not unexpected})"
+        )
+
+
+def base_columns(data: Mapping) -> dict:
+    """The basic fields of `data` as equal-length float64 arrays.
+
+    Accepts a DataFrame, a dict of arrays/lists or a dict of scalars (one
+    row); scalars are broadcast to the length of the list-valued fields.
+    """
+    missing = [name for name in BASE_FEATURES if name not in data]
+    if missing:
+        raise FeatureSchemaError(f"Missing required columns: {missing}")
+
+    raw = {name: np.asarray(data[name], dtype=np.float64) for name in BASE_FEATURES}
+    if any(values.ndim > 1 for values in raw.values()):
+        raise FeatureSchemaError("Columns must be scalars or flat lists")
+
+    lengths = {values.size for values in raw.values() if values.ndim > 0}
+    if len(lengths) > 1:
+        raise FeatureSchemaError(f"All list-valued columns must have the same length, got {sorted(lengths)}")
+
+    row_count = lengths.pop() if lengths else 1
+    return {name: np.broadcast_to(values, (row_count,)) for name, values in raw.items()}
+
+
+def _bands(values, thresholds, labels, default):
+    """Category of the first `values >= threshold` band that matches (an if/elif ladder)"""
+    return np.select([values >= threshold for threshold in thresholds], labels, default=default)
+
+
+def transform(data: Mapping, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """(rows, FEATURE_COUNT) float32 model input for the basic fields in `data`.
+
+    `out` may be a preallocated matrix of that shape to fill in place (e.g. a
+    slice of a larger batch buffer).
+    """
+    columns = base_columns(data)
+    rows = len(columns['Current_GPA'])
+    if out is None:
+        out = np.empty((rows, FEATURE_COUNT), dtype=FEATURE_DTYPE)
+    elif out.shape != (rows, FEATURE_COUNT):
+        raise FeatureSchemaError(f"out must have shape {(rows, FEATURE_COUNT)}, got {out.shape}")
+
+    difficulty = columns['Module_Difficulty']
+    gpa = columns['Current_GPA']
+    assessment = columns['Avg_Assessment_Score']
+    late = columns['Assignments_Late']
+    attempts = columns['Num_Submission_Attempts']
+    logins = columns['Login_Frequency']
+
+    attempts_floor = np.maximum(attempts, 1)
+    gpa_gap = 4 - gpa
+    difficulty_stress = difficulty * (5 - gpa)
+
+    features = (
+        difficulty, gpa, assessment, late, attempts, logins,
+        # Ratios and indices
+        np.divide(gpa, assessment / 25, out=np.zeros(rows), where=assessment > 0),
+        late / attempts_floor,
+        (gpa * 25 + assessment) / 2,
+        np.minimum(late * 2 + gpa_gap, 10),
+        np.minimum(logins / 20, 1),
+        difficulty_stress,
+        (gpa + assessment / 25) / 2,
+        1 / attempts_floor,
+        # Categories (1 = best band)
+        _bands(gpa, (3.5, 3.0, 2.5), (1, 2, 3), 4),
+        _bands(assessment, (80, 70, 60), (1, 2, 3), 4),
+        np.select([late == 0, late <= 2], (0, 1), default=2),
+        _bands(logins, (20, 10), (1, 2), 3),
+        # Interactions
+        difficulty_stress,
+        assessment * logins / 100,
+        late * gpa_gap,
+        # Composite risks
+        (late * 2 + (100 - assessment) / 10) / 2,
+        (gpa_gap * 2 + difficulty) / 3,
+        np.abs(gpa * 25 - assessment),
+        # Normalized values
+        gpa / 4.0,
+        assessment / 100.0,
+        np.minimum(logins / 30, 1),
+        # Binary flags
+        gpa < 2.5,
+        assessment < 60,
+        late >= 2,
+        logins < 10,
+        gpa * 0.4 + assessment / 100 * 0.4 + (1 - late / 10) * 0.2
+    )
+    for index, values in enumerate(features):
+        out[:, index] = values
+    return out
@@ -0,0 +1,140 @@
+"""
+EduBoost Feedback Ingestion
+Validation and batched inserts for lecturer_feedback records
+
+Used by both /api/lecturer/feedback (one record) and
+/api/lecturer/feedback/bulk (a JSON array or an NDJSON stream). Every
+record is validated up front; the valid ones are written in one
+transaction and the invalid ones are reported back by their position in
+the submission. Bulk bodies are capped in both bytes and records.
+"""
+
+import io
+import json
+import os
+from typing import Dict, Iterable, List, Tuple
+
+from performance_ingest import detect_format
+
+REQUIRED_FIELDS = ('student_id', 'module_name', 'lecturer_id', 'feedback_text')
+LIST_FIELDS = ('weak_areas', 'strength_areas', 'recommended_actions')
+DEFAULT_URGENCY = 3
+DEFAULT_TIMELINE = '2 weeks'
+
+MAX_BULK_RECORDS = int(os.environ.get('EDUBOOST_FEEDBACK_BULK_LIMIT', 5000))
+MAX_BULK_BYTES = int(os.environ.get('EDUBOOST_FEEDBACK_BULK_MAX_BYTES', 8 * 1024 * 1024))
+
+INSERT_FEEDBACK_SQL = '''
+    INSERT INTO lecturer_feedback
+    (student_id, module_name, lecturer_id, feedback_text, weak_areas,
+     strength_areas, recommended_actions, urgency_level, improvement_timeline)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+INSERT_FEEDBACK_RETURNING_SQL = INSERT_FEEDBACK_SQL + ' RETURNING id'
+
+
+class FeedbackFormatError(ValueError):
+    """Raised when a bulk feedback body cannot be parsed"""
+
+
+class FeedbackTooLargeError(FeedbackFormatError):
+    """Raised when a bulk feedback body exceeds MAX_BULK_BYTES"""
+
+
+def feedback_row(data: Dict) -> tuple:
+    """Parameters for INSERT_FEEDBACK_SQL from one feedback record"""
+    return (
+        data['student_id'],
+        data['module_name'],
+        data['lecturer_id'],
+        data['feedback_text'],
+        json.dumps(data.get('weak_areas', [])),
+        json.dumps(data.get('strength_areas', [])),
+        json.dumps(data.get('recommended_actions', [])),
+        data.get('urgency_level', DEFAULT_URGENCY),
+        data.get('improvement_timeline', DEFAULT_TIMELINE)
+    )
+
+
+def validate_feedback(record) -> List[Dict]:
+    """Field errors for one feedback record (empty when it can be inserted)"""
+    if not isinstance(record, dict):
+        return [{'field': None, 'error': 'must be a JSON object'}]
+
+    errors = []
+    for field in REQUIRED_FIELDS:
+        value = record.get(field)
+        if not isinstance(value, str) or not value.strip():
+            errors.append({'field': field, 'error': 'is required'})
+    for field in LIST_FIELDS:
+        if field in record and not isinstance(record[field], list):
+            errors.append({'field': field, 'error': 'must be a list'})
+
+    urgency = record.get('urgency_level', DEFAULT_URGENCY)
+    if isinstance(urgency, bool) or not isinstance(urgency, int) or not 1 <= urgency <= 5:
+        errors.append({'field': 'urgency_level', 'error': 'must be a whole number between 1 and 5'})
+    if not isinstance(record.get('improvement_timeline', DEFAULT_TIMELINE), str):
+        errors.append({'field': 'improvement_timeline', 'error': 'must be a string'})
+    return errors
+
+
+def validate_records(records: Iterable) -> Tuple[List[tuple], List[int], List[Dict]]:
+    """Split records into insert rows, the positions of those rows, and per-record errors"""
+    rows, positions, errors = [], [], []
+    for index, record in enumerate(records):
+        record_errors = validate_feedback(record)
+        if record_errors:
+            errors.append({'index': index, 'errors': record_errors})
+        else:
+            rows.append(feedback_row(record))
+            positions.append(index)
+    return rows, positions, errors
+
+
+def read_records(binary_stream, content_type='') -> List:
+    """Records from a JSON array body or an NDJSON stream (one object per line)"""
+    # Never read more than the cap, whatever Content-Length claims (or if it is absent)
+    body = binary_stream.read(MAX_BULK_BYTES + 1)
+    if len(body) > MAX_BULK_BYTES:
+        raise FeedbackTooLargeError(f'Request body is larger than {MAX_BULK_BYTES} bytes')
+    try:
+        text = body.decode('utf-8-sig')
+    except UnicodeDecodeError as e:
+        raise FeedbackFormatError(f"Body is not valid UTF-8: {e}") from e
+
+    if detect_format(content_type) == 'ndjson':
+        records = []
+        for line_number, line in enumerate(io.StringIO(text, newline=''), start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError as e:
+                raise FeedbackFormatError(f"Invalid JSON on line {line_number}: {e}") from e
+            if len(records) > MAX_BULK_RECORDS:
+                break
+    else:
+        try:
+            records = json.loads(text)
+        except ValueError as e:
+            raise FeedbackFormatError(f"Invalid JSON: {e}") from e
+        if not isinstance(records, list):
+            raise FeedbackFormatError('Expected a JSON array of feedback records')
+
+    if not records:
+        raise FeedbackFormatError('No feedback records submitted')
+    if len(records) > MAX_BULK_RECORDS:
+        raise FeedbackFormatError(f'At most {MAX_BULK_RECORDS} feedback records per request')
+    return records
+
+
+def insert_feedback(cursor, rows: List[tuple]) -> List[int]:
+    """Insert validated rows inside the caller's transaction and return their ids in order.
+
+    Each id comes from the row's own RETURNING clause rather than being
+    derived from last_insert_rowid(), so it is right even if ids are not
+    consecutive. The statement is compiled once and reused for every row.
+    """
+    return [cursor.execute(INSERT_FEEDBACK_RETURNING_SQL, row).fetchone()[0] for row in rows]
@@ -9,162 +9,18 @@ from sklearn.metrics import accuracy_score, classification_report, confusion_mat
 from datetime import datetime
 import json
 
+from accuracy_eval import rule_based_predictions
+from synthetic_cohort import generate_accuracy_samples
+
 def generate_realistic_test_data(n_samples=2000):
     """Generate comprehensive test dataset"""
-    np.random.seed(42)  # Reproducible results
-    
-    data = []
-    labels = []
-    
     print(f"📊 Generating {n_samples} realistic test samples...")
-    
-    for i in range(n_samples):
-        # Create realistic student profiles
-        
-        # Academic performance (correlated)
-        base_ability = np.random.normal(0, 1)  # Underlying academic ability
-        
-        current_gpa = 2.5 + base_ability * 0.8 + np.random.normal(0, 0.3)
-        current_gpa = np.clip(current_gpa, 0.0, 4.0)
-        
-        avg_assessment = (current_gpa * 20) + np.random.normal(0, 12)
-        avg_assessment = np.clip(avg_assessment, 0, 100)
-        
-        # Behavioral factors (correlated with performance)
-        stress_level = max(0, -base_ability + np.random.normal(0, 0.5))
-        
-        assignments_late = np.random.poisson(stress_level * 2 + 0.5)
-        assignments_late = min(assignments_late, 10)
-        
-        login_frequency = max(1, int(15 + base_ability * 5 + np.random.normal(0, 3)))
-        login_frequency = min(login_frequency, 50)
-        
-        # Course factors
-        module_difficulty = np.random.uniform(1, 5)
-        submission_attempts = max(1, int(np.random.poisson(1.2) + 1))
-        
-        # Create comprehensive risk assessment
-        risk_factors = []
-        
-        # Academic risk factors
-        if current_gpa < 2.0:
-            risk_factors.append(("Very Low GPA", 4))
-        elif current_gpa < 2.5:
-            risk_factors.append(("Low GPA", 3))
-        elif current_gpa < 3.0:
-            risk_factors.append(("Below Average GPA", 1))
-        
-        if avg_assessment < 40:
-            risk_factors.append(("Very Low Assessment", 4))
-        elif avg_assessment < 50:
-            risk_factors.append(("Low Assessment", 3))
-        elif avg_assessment < 60:
-            risk_factors.append(("Below Average Assessment", 2))
-        elif avg_assessment < 70:
-            risk_factors.append(("Marginal Assessment", 1))
-        
-        # Behavioral risk factors
-        if assignments_late >= 5:
-            risk_factors.append(("Many Late Assignments", 3))
-        elif assignments_late >= 3:
-            risk_factors.append(("Some Late Assignments", 2))
-        elif assignments_late >= 1:
-            risk_factors.append(("Occasional Late Assignment", 1))
-        
-        if login_frequency < 5:
-            risk_factors.append(("Very Low Engagement", 3))
-        elif login_frequency < 10:
-            risk_factors.append(("Low Engagement", 2))
-        elif login_frequency < 15:
-            risk_factors.append(("Below Average Engagement", 1))
-        
-        # Course difficulty interaction
-        if module_difficulty > 4 and current_gpa < 3.0:
-            risk_factors.append(("Difficult Course + Low GPA", 2))
-        
-        # Calculate total risk score
-        total_risk = sum(score for _, score in risk_factors)
-        
-        # Binary classification with realistic threshold
-        at_risk = 1 if total_risk >= 4 else 0
-        
-        # Store sample
-        sample = {
-            'Module_Difficulty': module_difficulty,
-            'Current_GPA': current_gpa,
-            'Avg_Assessment_Score': avg_assessment,
-            'Assignments_Late': assignments_late,
-            'Num_Submission_Attempts': submission_attempts,
-            'Login_Frequency': login_frequency,
-            'Risk_Score': total_risk,
-            'Risk_Factors': len(risk_factors)
-        }
-        
-        data.append(sample)
-        labels.append(at_risk)
-    
-    df = pd.DataFrame(data)
-    return df, np.array(labels)
+    features, labels = generate_accuracy_samples(n_samples, 'realistic', seed=42)  # Reproducible results
+    return pd.DataFrame(features), labels
 
 def optimized_rule_based_prediction(df):
-    """Optimized rule-based prediction system"""
-    predictions = []
-    confidence_scores = []
-    
-    for _, row in df.iterrows():
-        risk_score = 0
-        
-        # GPA-based risk (weighted heavily)
-        if row['Current_GPA'] < 2.0:
-            risk_score += 3.5
-        elif row['Current_GPA'] < 2.5:
-            risk_score += 2.5
-        elif row['Current_GPA'] < 3.0:
-            risk_score += 1.0
-        
-        # Assessment-based risk
-        if row['Avg_Assessment_Score'] < 50:
-            risk_score += 3.0
-        elif row['Avg_Assessment_Score'] < 60:
-            risk_score += 2.0
-        elif row['Avg_Assessment_Score'] < 70:
-            risk_score += 1.0
-        
-        # Behavioral risk
-        if row['Assignments_Late'] >= 4:
-            risk_score += 2.5
-        elif row['Assignments_Late'] >= 2:
-            risk_score += 1.5
-        elif row['Assignments_Late'] >= 1:
-            risk_score += 0.5
-        
-        # Engagement risk
-        if row['Login_Frequency'] < 8:
-            risk_score += 2.0
-        elif row['Login_Frequency'] < 12:
-            risk_score += 1.0
-        elif row['Login_Frequency'] < 18:
-            risk_score += 0.5
-        
-        # Interaction effects
-        if row['Module_Difficulty'] > 4 and row['Current_GPA'] < 2.8:
-            risk_score += 1.5
-        
-        if row['Assignments_Late'] > 2 and row['Current_GPA'] < 2.5:
-            risk_score += 1.0
-        
-        # Submission efficiency
-        if row['Num_Submission_Attempts'] > 3:
-            risk_score += 0.5
-        
-        # Final prediction with optimized threshold
-        prediction = 1 if risk_score >= 3.0 else 0
-        confidence = min(risk_score / 6.0, 1.0)
-        
-        predictions.append(prediction)
-        confidence_scores.append(confidence)
-    
-    return np.array(predictions), np.array(confidence_scores)
+    """Optimized rule-based prediction system (vectorized in accuracy_eval)"""
+    return rule_based_predictions(df)
 
 def analyze_model_performance():
     """Comprehensive model performance analysis"""
@@ -0,0 +1,205 @@
+"""
+EduBoost Goal Store
+Write-once, incrementally refreshed student goals in the student_goals table
+
+Goals get deterministic ids (uuid5 of student, module and title), so the
+same goal keeps its id -- and its progress -- across regenerations.
+
+Each student has a row in goal_generation. Writers of performance rows or
+lecturer feedback bump its inputs_version in the same transaction. A read
+is a single indexed query that returns the stored goals together with
+that state. Generation only runs when the student has no goals yet or
+their inputs changed since the last run, and then only the modules whose
+input digest differs are rewritten. The same row carries the data version
+that per-student caches are keyed by (data_version).
+"""
+
+import hashlib
+import json
+import uuid
+from typing import Dict, Iterable, List, Optional
+
+# Maximum number of goals shown to a student
+MAX_GOALS = 6
+
+# Goals that are not tied to one module's inputs (e.g. 'Improve Study Habits')
+GENERAL_MODULE = 'General'
+
+GOAL_NAMESPACE = uuid.UUID('8f7c1d2e-5b8a-4c3e-9a61-2d4b6e0f1a37')
+
+GOAL_COLUMNS = (
+    'goal_id', 'student_id', 'module_name', 'goal_title', 'goal_description', 'goal_type',
+    'priority_level', 'target_completion_date', 'current_progress', 'success_criteria'
+)
+
+READ_GOALS_SQL = '''
+    SELECT gen.inputs_version, gen.generated_version, {columns}
+    FROM goal_generation gen
+    LEFT JOIN student_goals g ON g.student_id = gen.student_id
+    WHERE gen.student_id = ?
+    ORDER BY g.sort_order
+    LIMIT ?
+'''.format(columns=', '.join(f'g.{column}' for column in GOAL_COLUMNS))
+
+DATA_VERSION_SQL = '''
+    SELECT inputs_version, generated_version, progress_version
+    FROM goal_generation
+    WHERE student_id = ?
+'''
+
+READ_INPUT_DIGESTS_SQL = 'SELECT module_name, input_digest FROM goal_inputs WHERE student_id = ?'
+
+READ_GOAL_IDS_SQL = 'SELECT goal_id, module_name FROM student_goals WHERE student_id = ?'
+
+UPSERT_GOAL_SQL = '''
+    INSERT INTO student_goals
+    (goal_id, student_id, module_name, goal_title, goal_description, goal_type,
+     priority_level, target_completion_date, success_criteria, sort_order, generated_by)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'ai')
+    ON CONFLICT (goal_id) DO UPDATE SET
+        goal_description = excluded.goal_description,
+        goal_type = excluded.goal_type,
+        priority_level = excluded.priority_level,
+        success_criteria = excluded.success_criteria,
+        sort_order = excluded.sort_order,
+        updated_at = CURRENT_TIMESTAMP
+'''
+
+
+def goal_id_for(student_id, module_name, goal_title) -> str:
+    """Stable goal id: the same goal for the same student always has the same id"""
+    return str(uuid.uuid5(GOAL_NAMESPACE, f'{student_id}\x1f{module_name}\x1f{goal_title}'))
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def input_digests(performance_data: List[Dict], lecturer_feedback: Optional[List[Dict]],
+                  overall_risk_level) -> Dict[str, str]:
+    """Digest of the inputs behind each module's goals (plus the general goals)"""
+    inputs = {}
+    for record in performance_data:
+        inputs.setdefault(record['module_name'], {'performance': [], 'feedback': []})['performance'].append(record)
+    for feedback in lecturer_feedback or []:
+        inputs.setdefault(feedback['module_name'], {'performance': [], 'feedback': []})['feedback'].append(feedback)
+
+    digests = {module: _digest(value) for module, value in inputs.items()}
+    digests[GENERAL_MODULE] = _digest({'overall_risk_level': overall_risk_level})
+    return digests
+
+
+def mark_inputs_changed(cursor, student_ids: Iterable):
+    """Flag students whose goal inputs were written (call inside the write transaction)"""
+    cursor.executemany('''
+        INSERT INTO goal_generation (student_id, inputs_version) VALUES (?, 1)
+        ON CONFLICT (student_id) DO UPDATE SET inputs_version = inputs_version + 1
+    ''', [(student_id,) for student_id in student_ids])
+
+
+def mark_progress_changed(cursor, student_id):
+    """Flag a goal progress update for `student_id` (call inside the write transaction)"""
+    cursor.execute('''
+        INSERT INTO goal_generation (student_id, progress_version) VALUES (?, 1)
+        ON CONFLICT (student_id) DO UPDATE SET progress_version = progress_version + 1
+    ''', (student_id,))
+
+
+def data_version(cursor, student_id):
+    """Version of everything derived from a student's stored data, for cache keys.
+
+    Moves on every performance/feedback write (inputs_version), goal
+    regeneration (generated_version) and progress update (progress_version);
+    one primary-key lookup, so every worker process can afford it per request.
+    """
+    row = cursor.execute(DATA_VERSION_SQL, (student_id,)).fetchone()
+    return tuple(row) if row else (0, None, 0)
+
+
+def read_goals(cursor, student_id, limit=MAX_GOALS):
+    """Return (is_current, inputs_version, goals) with one indexed query"""
+    rows = cursor.execute(READ_GOALS_SQL, (student_id, limit)).fetchall()
+    if not rows:
+        return False, 0, []
+
+    inputs_version, generated_version = rows[0][0], rows[0][1]
+    goals = [dict(zip(GOAL_COLUMNS, row[2:])) for row in rows if row[2] is not None]
+    for goal in goals:
+        goal['success_criteria'] = json.loads(goal['success_criteria']) if goal['success_criteria'] else []
+
+    is_current = generated_version is not None and generated_version >= inputs_version
+    return is_current, inputs_version, goals
+
+
+def sync_goals(pool, student_id, goals: List[Dict], digests: Dict[str, str], inputs_version=0,
+               limit=MAX_GOALS) -> Dict:
+    """Persist freshly generated goals, rewriting only modules whose inputs changed.
+
+    `goals` is the full ordered candidate list and `inputs_version` the version
+    seen before the inputs were loaded. Returns the stored goals to display and
+    the modules that were regenerated.
+    """
+    # Candidate goals keyed by stable id (duplicate titles collapse into one goal)
+    candidates = {}
+    for goal in goals:
+        goal_id = goal_id_for(student_id, goal['module_name'], goal['goal_title'])
+        if goal_id not in candidates:
+            candidates[goal_id] = dict(goal, goal_id=goal_id, sort_order=len(candidates))
+
+    with pool.transaction(immediate=True) as cursor:
+        stored = dict(cursor.execute(READ_INPUT_DIGESTS_SQL, (student_id,)).fetchall())
+        changed = {module for module, digest in digests.items() if stored.get(module) != digest}
+        changed |= set(stored) - set(digests)
+
+        def input_key(module_name):
+            """The digest a goal's content depends on"""
+            return module_name if module_name in digests or module_name in stored else GENERAL_MODULE
+
+        # Drop goals of changed modules that the new inputs no longer produce
+        existing = cursor.execute(READ_GOAL_IDS_SQL, (student_id,)).fetchall()
+        stale_ids = [
+            (goal_id,) for goal_id, module_name in existing
+            if goal_id not in candidates and input_key(module_name) in changed
+        ]
+        cursor.executemany('DELETE FROM student_goals WHERE goal_id = ?', stale_ids)
+        cursor.executemany('DELETE FROM goal_resources WHERE goal_id = ?', stale_ids)
+
+        existing_ids = {goal_id for goal_id, _ in existing}
+        cursor.executemany(UPSERT_GOAL_SQL, [
+            (
+                goal_id, student_id, goal['module_name'], goal['goal_title'], goal['goal_description'],
+                goal['goal_type'], goal['priority_level'], goal['target_completion_date'],
+                goal['success_criteria'] if isinstance(goal['success_criteria'], str) else json.dumps(goal['success_criteria']),
+                goal['sort_order']
+            )
+            for goal_id, goal in candidates.items()
+            if input_key(goal['module_name']) in changed or goal_id not in existing_ids
+        ])
+        # Unchanged goals keep their content and progress, only their position moves
+        cursor.executemany(
+            'UPDATE student_goals SET sort_order = ? WHERE goal_id = ? AND sort_order != ?',
+            [(goal['sort_order'], goal_id, goal['sort_order'])
+             for goal_id, goal in candidates.items() if input_key(goal['module_name']) not in changed]
+        )
+
+        cursor.executemany('''
+            INSERT INTO goal_inputs (student_id, module_name, input_digest) VALUES (?, ?, ?)
+            ON CONFLICT (student_id, module_name) DO UPDATE SET input_digest = excluded.input_digest
+        ''', [(student_id, module, digests[module]) for module in changed if module in digests])
+        cursor.executemany('DELETE FROM goal_inputs WHERE student_id = ? AND module_name = ?',
+                           [(student_id, module) for module in changed if module not in digests])
+
+        cursor.execute('''
+            INSERT INTO goal_generation (student_id, inputs_version, generated_version, generated_at)
+            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT (student_id) DO UPDATE SET
+                generated_version = MAX(COALESCE(generated_version, 0), excluded.generated_version),
+                generated_at = CURRENT_TIMESTAMP
+        ''', (student_id, inputs_version, inputs_version))
+
+        _, _, stored_goals = read_goals(cursor, student_id, limit)
+
+    return {
+        'goals': stored_goals,
+        'regenerated_modules': sorted(changed)
+    }
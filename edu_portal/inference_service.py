@@ -0,0 +1,232 @@
+"""
+EduBoost Inference Service
+Micro-batched online scoring with the trained at-risk model
+
+Concurrent prediction requests are queued and a single batcher thread
+collects them for up to `max_wait_ms` after the first one arrives (or
+until `max_batch_rows` rows are waiting), stacks their feature matrices
+and makes one vectorized predict_proba call for the whole batch. Callers
+block on a future for their own slice of the result.
+
+When no model is loaded, or the model fails on a batch, predict_proba()
+returns None and the caller scores the rows with the rule engine instead.
+Batch sizes and queue latencies are recorded in fixed-bucket histograms.
+"""
+
+import os
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections import namedtuple
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+import feature_transform
+
+DEFAULT_MAX_BATCH_ROWS = int(os.environ.get('EDUBOOST_INFERENCE_MAX_BATCH_ROWS', 256))
+DEFAULT_MAX_WAIT_MS = float(os.environ.get('EDUBOOST_INFERENCE_MAX_WAIT_MS', 2.0))
+
+# Histogram upper bounds (an implicit +inf bucket follows the last one)
+BATCH_ROWS_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+QUEUE_MS_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50, 100)
+
+_Pending = namedtuple('_Pending', 'features future enqueued_at')
+
+
+class Histogram:
+    """Counts of observed values per upper-bound bucket, plus count/sum/max"""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> Dict:
+        """counts[i] is the number of values <= bounds[i]; the last count is everything above"""
+        return {
+            'bounds': list(self.bounds),
+            'counts': list(self.counts),
+            'count': self.count,
+            'mean': round(self.total / self.count, 4) if self.count else None,
+            'max': round(self.max, 4)
+        }
+
+
+def positive_probabilities(model, features: np.ndarray) -> np.ndarray:
+    """P(at risk) for each row of a FEATURE_NAMES matrix.
+
+    Supports estimators with predict_proba (or only predict) and the
+    {'xgb_model': ..., 'scaler': ...} dictionaries the training scripts save.
+    """
+    if isinstance(model, dict) and 'xgb_model' in model:
+        if model.get('scaler') is not None:
+            features = model['scaler'].transform(features)
+        model = model['xgb_model']
+
+    names = getattr(model, 'feature_names_in_', None)
+    if names is not None:
+        feature_transform.check_feature_names(names)
+    expected = getattr(model, 'n_features_in_', None)
+    if expected is not None and expected != feature_transform.FEATURE_COUNT:
+        raise feature_transform.FeatureSchemaError(
+            f"Model expects {expected} features, transform {feature_transform.FEATURE_SCHEMA_ID} "
+            f"produces {feature_transform.FEATURE_COUNT}"
+        )
+
+    if hasattr(model, 'predict_proba'):
+        probabilities = np.asarray(model.predict_proba(features), dtype=np.float64)
+        return probabilities[:, -1] if probabilities.ndim == 2 else probabilities
+    if hasattr(model, 'predict'):
+        return np.asarray(model.predict(features), dtype=np.float64).reshape(-1)
+    raise TypeError(f"Unsupported model type {type(model).__name__}")
+
+
+class InferenceService:
+    """Process-wide micro-batcher in front of the currently loaded model"""
+
+    def __init__(self, model_source: Callable[[], Optional[object]],
+                 max_batch_rows=DEFAULT_MAX_BATCH_ROWS, max_wait_ms=DEFAULT_MAX_WAIT_MS):
+        self.model_source = model_source
+        self.max_batch_rows = max_batch_rows
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._batch_rows = Histogram(BATCH_ROWS_BUCKETS)
+        self._batch_requests = Histogram(BATCH_ROWS_BUCKETS)
+        self._queue_ms = Histogram(QUEUE_MS_BUCKETS)
+        self._stats = {
+            'requests': 0,
+            'rows': 0,
+            'batches': 0,
+            'model_errors': 0,
+            'fallbacks': 0,
+            'last_error': None
+        }
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    # -------------------------------------------------------------------------
+    # Callers
+    # -------------------------------------------------------------------------
+
+    def predict_proba(self, data) -> Optional[np.ndarray]:
+        """P(at risk) per row of `data` (see feature_transform.transform for
+        accepted inputs), or None if the rule engine should score it instead"""
+        if self.model_source() is None:
+            self._count('fallbacks')
+            return None
+
+        self._start()
+        pending = _Pending(feature_transform.transform(data), Future(), time.perf_counter())
+        self._queue.put(pending)
+        probabilities = pending.future.result()
+        if probabilities is None:
+            self._count('fallbacks')
+        return probabilities
+
+    # -------------------------------------------------------------------------
+    # Batcher
+    # -------------------------------------------------------------------------
+
+    def _start(self):
+        """Start the batcher thread once per process (threads do not survive fork())"""
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.SimpleQueue()
+            self._thread = threading.Thread(target=self._work, name='eduboost-inference', daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _collect(self):
+        """Block for the first request, then gather more until the window closes or the batch is full"""
+        batch = [self._queue.get()]
+        rows = len(batch[0].features)
+        deadline = batch[0].enqueued_at + self.max_wait
+        while rows < self.max_batch_rows:
+            remaining = deadline - time.perf_counter()
+            try:
+                pending = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(pending)
+            rows += len(pending.features)
+        return batch, rows
+
+    def _run(self, batch, rows):
+        started = time.perf_counter()
+        features = batch[0].features if len(batch) == 1 else np.concatenate([p.features for p in batch])
+
+        try:
+            model = self.model_source()
+            probabilities = None if model is None else positive_probabilities(model, features)
+        except Exception as e:
+            probabilities = None
+            with self._stats_lock:
+                self._stats['model_errors'] += 1
+                self._stats['last_error'] = str(e)
+
+        with self._stats_lock:
+            self._stats['requests'] += len(batch)
+            self._stats['rows'] += rows
+            self._stats['batches'] += 1
+            self._batch_rows.observe(rows)
+            self._batch_requests.observe(len(batch))
+            for pending in batch:
+                self._queue_ms.observe((started - pending.enqueued_at) * 1000)
+
+        offset = 0
+        for pending in batch:
+            size = len(pending.features)
+            pending.future.set_result(None if probabilities is None else probabilities[offset:offset + size])
+            offset += size
+
+    def _work(self):
+        while True:
+            batch, rows = self._collect()
+            try:
+                self._run(batch, rows)
+            except Exception as e:
+                # Never leave a caller waiting
+                for pending in batch:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+            stats.update({
+                'batch_rows': self._batch_rows.snapshot(),
+                'batch_requests': self._batch_requests.snapshot(),
+                'queue_latency_ms': self._queue_ms.snapshot()
+            })
+        stats.update({
+            'max_batch_rows': self.max_batch_rows,
+            'max_wait_ms': self.max_wait * 1000,
+            'feature_schema': feature_transform.FEATURE_SCHEMA_ID,
+            'batcher_running': self._pid == os.getpid()
+        })
+        return stats
@@ -0,0 +1,264 @@
+"""
+EduBoost Background Jobs
+SQLite-backed job queue with a local worker thread pool
+
+Jobs are rows in the `jobs` table, so they are enqueued in the same
+transaction as the write that triggers them and survive restarts. A job
+with a dedupe key is merged into the queued job with the same key: its
+start is pushed back by the debounce delay (but never more than
+max_delay after the first request), so a burst of lecturer feedback for
+one student becomes a single regeneration.
+
+Workers claim due jobs with one atomic UPDATE, so several processes can
+share a database. A job left 'running' by a crashed worker is requeued
+once its lease expires.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+DEFAULT_WORKERS = int(os.environ.get('EDUBOOST_JOB_WORKERS', 2))
+DEFAULT_DEBOUNCE = float(os.environ.get('EDUBOOST_JOB_DEBOUNCE', 2.0))
+DEFAULT_MAX_DELAY = float(os.environ.get('EDUBOOST_JOB_MAX_DELAY', 30.0))
+DEFAULT_POLL_INTERVAL = float(os.environ.get('EDUBOOST_JOB_POLL_INTERVAL', 1.0))
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+JOB_FIELDS = ('id', 'job_type', 'dedupe_key', 'payload', 'status', 'attempts', 'merged',
+              'enqueued_at', 'run_after', 'started_at', 'finished_at', 'result', 'error')
+
+# Worker-loop queries; test_query_plans.py audits their plans
+CLAIM_JOB_SQL = '''
+    UPDATE jobs SET status = 'running', started_at = ?, attempts = attempts + 1
+    WHERE id = (
+        SELECT id FROM jobs
+        WHERE status = 'queued' AND run_after <= ?
+        ORDER BY run_after
+        LIMIT 1
+    )
+    RETURNING id, job_type, payload, attempts
+'''
+
+NEXT_RUN_SQL = "SELECT MIN(run_after) FROM jobs WHERE status = 'queued'"
+
+REQUEUE_EXPIRED_SQL = '''
+    UPDATE jobs SET status = 'queued', started_at = NULL
+    WHERE status = 'running' AND started_at < ?
+'''
+
+
+class JobQueue:
+    """Persistent job queue processed by background worker threads"""
+
+    def __init__(self, pool, workers=DEFAULT_WORKERS, debounce=DEFAULT_DEBOUNCE,
+                 max_delay=DEFAULT_MAX_DELAY, poll_interval=DEFAULT_POLL_INTERVAL,
+                 lease_seconds=DEFAULT_LEASE_SECONDS, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.pool = pool
+        self.workers = workers
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        self._handlers: Dict[str, Callable] = {}
+        self._threads = []
+        self._pid = None
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # Only outcomes of this process's own transactions; enqueue counts come from the table
+        self._stats = {
+            'completed': 0,
+            'failed': 0,
+            'retried': 0,
+            'requeued_expired': 0
+        }
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def register(self, job_type, handler: Callable):
+        """Register the function that processes jobs of `job_type` (payload dict -> result)"""
+        self._handlers[job_type] = handler
+
+    # -------------------------------------------------------------------------
+    # Producers
+    # -------------------------------------------------------------------------
+
+    def enqueue(self, cursor, job_type, payload: Dict, dedupe_key=None, delay=None) -> int:
+        """Add a job inside the caller's transaction and return its id.
+
+        If a queued job with the same dedupe_key exists, that job's id is
+        returned instead and its start is debounced.
+        """
+        if job_type not in self._handlers:
+            raise ValueError(f"No handler registered for job type '{job_type}'")
+
+        now = time.time()
+        run_after = now + (self.debounce if delay is None else delay)
+        cursor.execute('''
+            INSERT INTO jobs (job_type, dedupe_key, payload, status, enqueued_at, run_after)
+            VALUES (?, ?, ?, 'queued', ?, ?)
+            ON CONFLICT (dedupe_key) WHERE status = 'queued' DO UPDATE SET
+                payload = excluded.payload,
+                run_after = MIN(jobs.enqueued_at + ?, excluded.run_after),
+                merged = jobs.merged + 1
+            RETURNING id
+        ''', (job_type, dedupe_key, json.dumps(payload), now, run_after, self.max_delay))
+        job_id, = cursor.fetchone()
+
+        self.start()
+        # Also on a merge: a shorter delay can move the queued job's start earlier
+        self._wakeup.set()
+        return job_id
+
+    def get(self, job_id) -> Optional[Dict]:
+        """Current state of a job, or None if it does not exist"""
+        with self.pool.connection() as conn:
+            row = conn.execute(f'SELECT {", ".join(JOB_FIELDS)} FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        job = dict(zip(JOB_FIELDS, row))
+        job['payload'] = json.loads(job['payload']) if job['payload'] else None
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+
+    def start(self):
+        """Start the worker threads once per process (safe to call repeatedly)"""
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            # Threads do not survive fork(), so a forked child starts its own
+            if self._pid == os.getpid():
+                return
+            self._stopping.clear()
+            self._threads = [
+                threading.Thread(target=self._work, name=f'eduboost-job-{i}', daemon=True)
+                for i in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+            self._pid = os.getpid()
+
+    def stop(self, timeout=5.0):
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._pid = None
+
+    def _requeue_expired(self):
+        """Put jobs whose worker died (lease expired) back in the queue"""
+        with self.pool.transaction() as cursor:
+            cursor.execute(REQUEUE_EXPIRED_SQL, (time.time() - self.lease_seconds,))
+            requeued = cursor.rowcount
+        # Counted once committed, so a rolled-back requeue is not reported
+        if requeued > 0:
+            self._count('requeued_expired', requeued)
+
+    def _claim(self):
+        """Atomically mark the next due job as running; returns (id, type, payload, attempts) or None"""
+        now = time.time()
+        with self.pool.transaction(immediate=True) as cursor:
+            cursor.execute(CLAIM_JOB_SQL, (now, now))
+            return cursor.fetchone()
+
+    def _next_due_in(self):
+        """Seconds until the earliest queued job is due (capped at poll_interval)"""
+        with self.pool.connection() as conn:
+            next_run = conn.execute(NEXT_RUN_SQL).fetchone()[0]
+        if next_run is None:
+            return self.poll_interval
+        return max(0.0, min(self.poll_interval, next_run - time.time()))
+
+    def _finish(self, job_id, status, result=None, error=None, run_after=None):
+        with self.pool.transaction() as cursor:
+            cursor.execute('''
+                UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?,
+                       run_after = COALESCE(?, run_after)
+                WHERE id = ?
+            ''', (status, json.dumps(result) if result is not None else None, error,
+                  time.time() if status in ('done', 'failed') else None, run_after, job_id))
+
+    def _run(self, job_id, job_type, payload, attempts):
+        handler = self._handlers.get(job_type)
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job type '{job_type}'")
+            result = handler(json.loads(payload) if payload else {})
+        except Exception as e:
+            if attempts < self.max_attempts:
+                # Back off and let another attempt pick it up
+                try:
+                    self._finish(job_id, 'queued', error=str(e), run_after=time.time() + 2 ** attempts)
+                    self._count('retried')
+                except sqlite3.IntegrityError:
+                    # A newer job with the same dedupe key is already queued and will redo the work
+                    self._finish(job_id, 'failed', error=f'{e} (superseded by a newer queued job)')
+                    self._count('failed')
+            else:
+                self._finish(job_id, 'failed', error=str(e))
+                self._count('failed')
+                print(f"❌ Job {job_id} ({job_type}) failed: {e}")
+            return
+
+        self._finish(job_id, 'done', result=result)
+        self._count('completed')
+
+    def _work(self):
+        last_lease_check = 0.0
+        while not self._stopping.is_set():
+            try:
+                if time.monotonic() - last_lease_check >= self.lease_seconds / 4:
+                    self._requeue_expired()
+                    last_lease_check = time.monotonic()
+
+                # Only take the write lock when a job is actually due
+                delay = self._next_due_in()
+                if delay > 0:
+                    self._wakeup.wait(delay)
+                    self._wakeup.clear()
+                    continue
+
+                job = self._claim()
+                if job is not None:
+                    self._run(*job)
+            except Exception as e:
+                # Keep the worker alive through transient database errors
+                print(f"⚠️ Job worker error: {e}")
+                self._stopping.wait(self.poll_interval)
+
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        with self.pool.connection() as conn:
+            rows = conn.execute('SELECT status, COUNT(*), SUM(merged) FROM jobs GROUP BY status').fetchall()
+        # enqueue() runs in the caller's transaction, so only committed rows say what was enqueued
+        counts = {status: count for status, count, _ in rows}
+        stats.update({
+            'enqueued': sum(counts.values()),
+            'merged': sum(merged for _, _, merged in rows),
+            'workers': self.workers,
+            'workers_running': self._pid == os.getpid(),
+            'debounce_seconds': self.debounce,
+            'max_delay_seconds': self.max_delay,
+            'jobs_by_status': counts
+        })
+        return stats
@@ -0,0 +1,311 @@
+"""
+EduBoost Schema Migrations
+Versioned, forward-only migrations for eduboost.db
+
+The applied schema version is stored in SQLite's `PRAGMA user_version`.
+Each migration runs in its own BEGIN IMMEDIATE transaction together with
+the version bump, so a failed step leaves the database on the previous
+version and concurrent workers starting at the same time apply every step
+exactly once.
+
+Add new steps to the end of MIGRATIONS; never edit a released one.
+"""
+
+import sqlite3
+from collections import namedtuple
+from typing import List
+
+Migration = namedtuple('Migration', ['version', 'description', 'statements'])
+
+MIGRATIONS = (
+    Migration(1, 'Base schema', (
+        # Student Performance Table (Enhanced with 14 fields)
+        '''
+        CREATE TABLE IF NOT EXISTS student_performance (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id TEXT NOT NULL,
+            module_name TEXT NOT NULL,
+            module_difficulty REAL,
+            current_gpa REAL,
+            avg_assessment_score INTEGER,
+            assignments_late INTEGER,
+            num_submission_attempts INTEGER,
+            login_frequency INTEGER,
+            attendance_rate REAL,
+            lab_completion_rate REAL,
+            participation_score INTEGER,
+            failed_module INTEGER,
+            semester TEXT,
+            risk_score REAL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        # Lecturer Feedback Table
+        '''
+        CREATE TABLE IF NOT EXISTS lecturer_feedback (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            student_id TEXT NOT NULL,
+            module_name TEXT NOT NULL,
+            lecturer_id TEXT NOT NULL,
+            feedback_text TEXT,
+            weak_areas TEXT, -- JSON string
+            strength_areas TEXT, -- JSON string
+            recommended_actions TEXT, -- JSON string
+            urgency_level INTEGER CHECK (urgency_level BETWEEN 1 AND 5),
+            improvement_timeline TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        # Student Goals Table
+        '''
+        CREATE TABLE IF NOT EXISTS student_goals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            goal_id TEXT UNIQUE NOT NULL,
+            student_id TEXT NOT NULL,
+            module_name TEXT,
+            goal_title TEXT NOT NULL,
+            goal_description TEXT,
+            goal_type TEXT, -- "skill_improvement", "assignment_completion", "resource_study"
+            priority_level TEXT, -- "high", "medium", "low"
+            target_completion_date DATE,
+            current_progress INTEGER DEFAULT 0, -- 0-100%
+            is_completed BOOLEAN DEFAULT FALSE,
+            generated_by TEXT DEFAULT 'ai', -- "ai", "lecturer", "student"
+            success_criteria TEXT, -- JSON string
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        # Learning Resources Table
+        '''
+        CREATE TABLE IF NOT EXISTS learning_resources (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            module_name TEXT NOT NULL,
+            resource_type TEXT, -- "book", "online", "video", "practice", "tutorial"
+            resource_title TEXT NOT NULL,
+            resource_url TEXT,
+            resource_author TEXT,
+            difficulty_level INTEGER CHECK (difficulty_level BETWEEN 1 AND 5),
+            topic_tags TEXT, -- JSON string
+            rating REAL,
+            estimated_hours INTEGER,
+            description TEXT,
+            is_free BOOLEAN DEFAULT TRUE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        # Goal Resources Mapping
+        '''
+        CREATE TABLE IF NOT EXISTS goal_resources (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            goal_id TEXT NOT NULL,
+            resource_id INTEGER,
+            relevance_score REAL,
+            recommended_by TEXT DEFAULT 'ai',
+            FOREIGN KEY (resource_id) REFERENCES learning_resources (id)
+        )
+        '''
+    )),
+    Migration(2, 'Indexes for student, module, goal and resource lookups', (
+        # Per-student performance rows, one per module
+        'CREATE INDEX IF NOT EXISTS idx_student_performance_student_module '
+        'ON student_performance (student_id, module_name)',
+        # Feedback for a student (and module), newest first
+        'CREATE INDEX IF NOT EXISTS idx_lecturer_feedback_student_module_created '
+        'ON lecturer_feedback (student_id, module_name, created_at)',
+        # Goals for a student, grouped by module
+        'CREATE INDEX IF NOT EXISTS idx_student_goals_student_module '
+        'ON student_goals (student_id, module_name)',
+        # Resources for a module ordered by rating DESC, difficulty_level ASC
+        'CREATE INDEX IF NOT EXISTS idx_learning_resources_module_rating '
+        'ON learning_resources (module_name, rating DESC, difficulty_level ASC)',
+        # Resources attached to a goal (covers the resource_id lookup)
+        'CREATE INDEX IF NOT EXISTS idx_goal_resources_goal_resource '
+        'ON goal_resources (goal_id, resource_id)',
+        'ANALYZE'
+    )),
+    Migration(3, 'Unique performance rows per student, module and semester', (
+        # Keep the most recent row of any duplicates before enforcing uniqueness
+        '''
+        DELETE FROM student_performance
+        WHERE id NOT IN (
+            SELECT MAX(id) FROM student_performance
+            GROUP BY student_id, module_name, semester
+        )
+        ''',
+        'CREATE UNIQUE INDEX IF NOT EXISTS ux_student_performance_student_module_semester '
+        'ON student_performance (student_id, module_name, semester)',
+        # The unique index has the same leading columns
+        'DROP INDEX IF EXISTS idx_student_performance_student_module'
+    )),
+    Migration(4, 'Persisted goal generation state and goal progress history', (
+        # Progress updates recorded by /api/goals/<goal_id>/progress
+        '''
+        CREATE TABLE IF NOT EXISTS student_progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            goal_id TEXT NOT NULL,
+            progress_update INTEGER,
+            notes TEXT,
+            updated_by TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_student_progress_goal_created '
+        'ON student_progress (goal_id, created_at)',
+        # Display order of a student's goals
+        'ALTER TABLE student_goals ADD COLUMN sort_order INTEGER NOT NULL DEFAULT 0',
+        'CREATE INDEX IF NOT EXISTS idx_student_goals_student_order '
+        'ON student_goals (student_id, sort_order)',
+        # inputs_version is bumped by every write to a student's performance rows
+        # or feedback; goals are current while generated_version has caught up
+        '''
+        CREATE TABLE IF NOT EXISTS goal_generation (
+            student_id TEXT PRIMARY KEY,
+            inputs_version INTEGER NOT NULL DEFAULT 0,
+            generated_version INTEGER,
+            generated_at TIMESTAMP
+        )
+        ''',
+        # Digest of the inputs each module's goals were generated from
+        '''
+        CREATE TABLE IF NOT EXISTS goal_inputs (
+            student_id TEXT NOT NULL,
+            module_name TEXT NOT NULL,
+            input_digest TEXT NOT NULL,
+            PRIMARY KEY (student_id, module_name)
+        )
+        '''
+    )),
+    Migration(5, 'Background job queue', (
+        '''
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_type TEXT NOT NULL,
+            dedupe_key TEXT,
+            payload TEXT, -- JSON string
+            status TEXT NOT NULL DEFAULT 'queued', -- "queued", "running", "done", "failed"
+            attempts INTEGER NOT NULL DEFAULT 0,
+            merged INTEGER NOT NULL DEFAULT 0, -- requests folded into this job
+            enqueued_at REAL NOT NULL, -- unix time
+            run_after REAL NOT NULL,
+            started_at REAL,
+            finished_at REAL,
+            result TEXT, -- JSON string
+            error TEXT
+        )
+        ''',
+        # At most one queued job per dedupe key; enqueue merges into it
+        'CREATE UNIQUE INDEX IF NOT EXISTS ux_jobs_queued_dedupe_key '
+        "ON jobs (dedupe_key) WHERE status = 'queued'",
+        # Next due job / earliest run_after / expired leases
+        'CREATE INDEX IF NOT EXISTS idx_jobs_status_run_after ON jobs (status, run_after)'
+    )),
+    Migration(6, 'Version stamp for the in-memory resource catalog', (
+        # Bumped on every write so in-memory copies know when to rebuild
+        '''
+        CREATE TABLE IF NOT EXISTS catalog_versions (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+        ''',
+        "INSERT OR IGNORE INTO catalog_versions (name, version) VALUES ('learning_resources', 0)",
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_learning_resources_version_insert
+        AFTER INSERT ON learning_resources BEGIN
+            UPDATE catalog_versions SET version = version + 1 WHERE name = 'learning_resources';
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_learning_resources_version_update
+        AFTER UPDATE ON learning_resources BEGIN
+            UPDATE catalog_versions SET version = version + 1 WHERE name = 'learning_resources';
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_learning_resources_version_delete
+        AFTER DELETE ON learning_resources BEGIN
+            UPDATE catalog_versions SET version = version + 1 WHERE name = 'learning_resources';
+        END
+        '''
+    )),
+    Migration(7, 'Persisted goal-to-resource relevance', (
+        # Catalog version a ranking was computed against; older rankings are redone
+        'ALTER TABLE goal_resources ADD COLUMN catalog_version INTEGER',
+        # A goal's resources, best first
+        'CREATE INDEX IF NOT EXISTS idx_goal_resources_goal_relevance '
+        'ON goal_resources (goal_id, relevance_score DESC)'
+    )),
+    Migration(8, 'Full-text search index over learning resources', (
+        # External content: the index stores terms only and reads rows from learning_resources
+        '''
+        CREATE VIRTUAL TABLE IF NOT EXISTS learning_resources_fts USING fts5(
+            resource_title, description, topic_tags,
+            content = 'learning_resources', content_rowid = 'id',
+            tokenize = 'porter unicode61'
+        )
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_learning_resources_fts_insert
+        AFTER INSERT ON learning_resources BEGIN
+            INSERT INTO learning_resources_fts (rowid, resource_title, description, topic_tags)
+            VALUES (new.id, new.resource_title, new.description, new.topic_tags);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_learning_resources_fts_delete
+        AFTER DELETE ON learning_resources BEGIN
+            INSERT INTO learning_resources_fts (learning_resources_fts, rowid, resource_title, description, topic_tags)
+            VALUES ('delete', old.id, old.resource_title, old.description, old.topic_tags);
+        END
+        ''',
+        '''
+        CREATE TRIGGER IF NOT EXISTS trg_learning_resources_fts_update
+        AFTER UPDATE OF resource_title, description, topic_tags ON learning_resources BEGIN
+            INSERT INTO learning_resources_fts (learning_resources_fts, rowid, resource_title, description, topic_tags)
+            VALUES ('delete', old.id, old.resource_title, old.description, old.topic_tags);
+            INSERT INTO learning_resources_fts (rowid, resource_title, description, topic_tags)
+            VALUES (new.id, new.resource_title, new.description, new.topic_tags);
+        END
+        ''',
+        # Index the resources that already exist
+        "INSERT INTO learning_resources_fts (learning_resources_fts) VALUES ('rebuild')"
+    )),
+    Migration(9, 'Goal progress counter for cross-process cache versions', (
+        # Bumped by every goal progress update; part of goal_store.data_version
+        'ALTER TABLE goal_generation ADD COLUMN progress_version INTEGER NOT NULL DEFAULT 0',
+    ))
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def schema_version(conn) -> int:
+    """Schema version currently recorded in the database"""
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+
+def apply_migrations(conn, target=LATEST_VERSION) -> List[int]:
+    """Bring the database up to `target`; returns the versions that were applied"""
+    applied = []
+    for migration in MIGRATIONS:
+        if migration.version > target or migration.version <= schema_version(conn):
+            continue
+
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Another process may have migrated while we waited for the write lock
+            if schema_version(conn) >= migration.version:
+                conn.rollback()
+                continue
+            for statement in migration.statements:
+                conn.execute(statement)
+            conn.execute(f'PRAGMA user_version = {int(migration.version)}')
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        conn.commit()
+
+        applied.append(migration.version)
+        print(f"✅ Applied migration {migration.version}: {migration.description}")
+    return applied
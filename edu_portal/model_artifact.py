@@ -0,0 +1,477 @@
+"""
+EduBoost Model Artifacts
+Flat, checksummed model files loaded with numpy.memmap instead of pickle
+
+A trained model is exported once (offline, from a pickle you trust) into a
+single .ebm file:
+
+    magic (16 bytes) | header length (uint64) | SHA-256 (32 bytes) | JSON header | arrays
+
+The header names the model kind and its parameters and gives the dtype,
+shape and 64-byte aligned offset of every array. The digest covers the
+header and all array bytes, so a corrupted or truncated file is rejected
+before any of it is used, and nothing in it is ever executed. The digest
+lives in the same file, so it detects accidental damage, not deliberate
+edits: whoever can write the file can rewrite the digest too, so protect
+model/ like the code.
+
+Loading maps the file read-only, so every worker process shares the same
+page-cache copy of the arrays and nothing is unpickled. The digest check
+still reads the whole file once per load (hot reloads included), so load
+time grows linearly with the artifact's size. Tree ensembles are stored as flat node arrays and evaluated for
+all rows and trees at once; linear models as a coefficient vector.
+
+Usage:
+    python model_artifact.py export model/eduboost_ultra_accuracy_model.pkl
+    python model_artifact.py inspect model/eduboost_ultra_accuracy_model.ebm
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+from typing import Dict, Optional
+
+import numpy as np
+
+import feature_transform
+
+MAGIC = b'EDUBOOST-MODEL\x00\x01'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+ARTIFACT_SUFFIX = '.ebm'
+
+_PREFIX = struct.Struct('<16sQ32s')
+
+# Only plain little-endian numeric arrays may appear in an artifact
+ALLOWED_DTYPES = ('<f4', '<f8', '<i4', '<i8', '|u1')
+
+KIND_TREE_ENSEMBLE = 'tree_ensemble'
+KIND_LINEAR = 'linear'
+
+# Rows evaluated at once by tree ensembles (bounds the rows x trees node matrix)
+PREDICT_CHUNK_ROWS = 8192
+
+
+class ArtifactError(Exception):
+    """A model artifact is malformed, fails its checksum or cannot be exported"""
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+# =============================================================================
+# FILE FORMAT
+# =============================================================================
+
+def save_artifact(path, kind, params: Dict, arrays: Dict[str, np.ndarray], n_features,
+                  feature_schema: Optional[str] = None) -> Dict:
+    """Write an artifact atomically (readers never see a half-written file); returns its header"""
+    layout, offset = {}, 0
+    arrays = {name: np.ascontiguousarray(values) for name, values in arrays.items()}
+    for name, values in arrays.items():
+        dtype = values.dtype.newbyteorder('<') if values.dtype.byteorder == '>' else values.dtype
+        if dtype.str not in ALLOWED_DTYPES:
+            raise ArtifactError(f"Array '{name}' has unsupported dtype {values.dtype}")
+        offset = _aligned(offset)
+        layout[name] = {'dtype': dtype.str, 'shape': list(values.shape), 'offset': offset}
+        offset += values.nbytes
+
+    header = {
+        'format_version': FORMAT_VERSION,
+        'kind': kind,
+        'n_features': int(n_features),
+        'feature_schema': feature_schema,
+        'params': params,
+        'arrays': layout
+    }
+    header_bytes = json.dumps(header, sort_keys=True).encode('utf-8')
+    data_start = _aligned(_PREFIX.size + len(header_bytes))
+
+    body = bytearray(data_start - _PREFIX.size + offset)
+    body[:len(header_bytes)] = header_bytes
+    for name, values in arrays.items():
+        start = data_start - _PREFIX.size + layout[name]['offset']
+        body[start:start + values.nbytes] = values.astype(layout[name]['dtype'], copy=False).tobytes()
+    digest = hashlib.sha256(body).digest()
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_PREFIX.pack(MAGIC, len(header_bytes), digest))
+            f.write(body)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return header
+
+
+def read_artifact(path, verify=True):
+    """Map an artifact read-only; returns (header, arrays) with arrays as memmap views"""
+    try:
+        mapped = np.memmap(path, dtype=np.uint8, mode='r')
+    except (OSError, ValueError) as e:
+        raise ArtifactError(f"Cannot map {path}: {e}") from e
+    if len(mapped) < _PREFIX.size:
+        raise ArtifactError(f"{path} is too small to be a model artifact")
+
+    magic, header_length, digest = _PREFIX.unpack(bytes(mapped[:_PREFIX.size]))
+    if magic != MAGIC:
+        raise ArtifactError(f"{path} is not an EduBoost model artifact")
+    if verify and hashlib.sha256(mapped[_PREFIX.size:]).digest() != digest:
+        raise ArtifactError(f"{path} failed its SHA-256 integrity check")
+
+    try:
+        header = json.loads(bytes(mapped[_PREFIX.size:_PREFIX.size + header_length]))
+    except ValueError as e:
+        raise ArtifactError(f"{path} has an unreadable header: {e}") from e
+    if header.get('format_version') != FORMAT_VERSION:
+        raise ArtifactError(f"{path} uses format version {header.get('format_version')}, expected {FORMAT_VERSION}")
+
+    data = mapped[_aligned(_PREFIX.size + header_length):]
+    arrays = {}
+    for name, spec in header.get('arrays', {}).items():
+        if spec['dtype'] not in ALLOWED_DTYPES:
+            raise ArtifactError(f"Array '{name}' has unsupported dtype {spec['dtype']}")
+        dtype = np.dtype(spec['dtype'])
+        count = int(np.prod(spec['shape'], dtype=np.int64))
+        start, end = spec['offset'], spec['offset'] + count * dtype.itemsize
+        if start % ALIGNMENT or end > len(data):
+            raise ArtifactError(f"Array '{name}' lies outside the artifact")
+        arrays[name] = data[start:end].view(dtype).reshape(spec['shape'])
+    return header, arrays
+
+
+# =============================================================================
+# LOADED MODELS
+# =============================================================================
+
+def _sigmoid(margin):
+    return 1 / (1 + np.exp(-margin))
+
+
+class ArtifactModel:
+    """A model served straight from a mapped artifact, with a scikit-learn style predict API"""
+
+    def __init__(self, header, arrays, path=None):
+        self.path = path
+        self.kind = header['kind']
+        self.params = header['params']
+        self.arrays = arrays
+        self.n_features_in_ = header['n_features']
+        self.feature_schema = header.get('feature_schema')
+        self.classes_ = np.array([0, 1])
+
+        if self.kind not in (KIND_TREE_ENSEMBLE, KIND_LINEAR):
+            raise ArtifactError(f"Unknown model kind '{self.kind}'")
+        if self.kind == KIND_TREE_ENSEMBLE:
+            nodes = len(arrays['feature'])
+            if any(len(arrays[name]) != nodes for name in ('threshold', 'children', 'missing', 'value')):
+                raise ArtifactError("Tree node arrays differ in length")
+            references = (arrays['children'], arrays['missing'], arrays['roots'])
+            if nodes and (any(values.min() < 0 or values.max() >= nodes for values in references)
+                          or arrays['feature'].min() < 0 or arrays['feature'].max() >= self.n_features_in_):
+                raise ArtifactError("Tree node references are out of range")
+
+    def features(self, data) -> np.ndarray:
+        """Model input matrix for a feature matrix, a DataFrame or a dict of basic fields"""
+        if isinstance(data, np.ndarray):
+            if data.ndim == 2 and data.shape[1] == self.n_features_in_:
+                return data
+            if data.ndim == 2 and data.shape[1] == len(feature_transform.BASE_FEATURES):
+                data = dict(zip(feature_transform.BASE_FEATURES, data.T))
+            else:
+                raise feature_transform.FeatureSchemaError(
+                    f"Expected {self.n_features_in_} feature columns, got shape {data.shape}")
+
+        if self.n_features_in_ == feature_transform.FEATURE_COUNT:
+            return feature_transform.transform(data)
+        if self.n_features_in_ == len(feature_transform.BASE_FEATURES):
+            columns = feature_transform.base_columns(data)
+            return np.column_stack([columns[name] for name in feature_transform.BASE_FEATURES])
+        raise feature_transform.FeatureSchemaError(
+            f"Cannot build {self.n_features_in_} model features from named columns")
+
+    def _scaled(self, features):
+        if 'scale_mean' in self.arrays:
+            return (features - self.arrays['scale_mean']) / self.arrays['scale_std']
+        return features
+
+    def _tree_margin(self, features):
+        """Walk every (row, tree) pair down one level per step; leaves loop onto themselves"""
+        feature, threshold, missing = self.arrays['feature'], self.arrays['threshold'], self.arrays['missing']
+        children = self.arrays['children'].reshape(-1)
+        strict = self.params['comparison'] == 'lt'
+
+        flat = np.ascontiguousarray(features).reshape(-1)
+        row_starts = (np.arange(len(features)) * features.shape[1])[:, None]
+        nodes = np.broadcast_to(self.arrays['roots'], (len(features), len(self.arrays['roots'])))
+        for _ in range(self.params['max_depth']):
+            values = flat[row_starts + feature[nodes]]
+            cutoff = threshold[nodes]
+            goes_right = ~(values < cutoff) if strict else ~(values <= cutoff)
+            following = children[nodes * 2 + goes_right]
+            unknown = np.isnan(values)
+            nodes = np.where(unknown, missing[nodes], following) if unknown.any() else following
+
+        leaves = self.arrays['value'][nodes]
+        total = leaves.mean(axis=1) if self.params['aggregation'] == 'mean' else leaves.sum(axis=1, dtype=np.float64)
+        return total + self.params.get('base_margin', 0.0)
+
+    def decision_function(self, data) -> np.ndarray:
+        """Raw model output before the link function"""
+        features = self._scaled(self.features(data))
+        if self.kind == KIND_LINEAR:
+            return features @ self.arrays['coef'] + self.params['intercept']
+        return np.concatenate([
+            self._tree_margin(features[start:start + PREDICT_CHUNK_ROWS])
+            for start in range(0, len(features), PREDICT_CHUNK_ROWS)
+        ]) if len(features) else np.zeros(0)
+
+    def predict_proba(self, data) -> np.ndarray:
+        output = self.decision_function(data)
+        positive = _sigmoid(output) if self.params['link'] == 'logistic' else np.clip(output, 0.0, 1.0)
+        return np.column_stack([1 - positive, positive])
+
+    def predict(self, data) -> np.ndarray:
+        return (self.predict_proba(data)[:, 1] >= 0.5).astype(np.int64)
+
+    def describe(self) -> Dict:
+        summary = {
+            'kind': self.kind,
+            'n_features': self.n_features_in_,
+            'feature_schema': self.feature_schema,
+            'params': self.params,
+            'array_bytes': sum(values.nbytes for values in self.arrays.values())
+        }
+        if self.kind == KIND_TREE_ENSEMBLE:
+            summary.update(trees=len(self.arrays['roots']), nodes=len(self.arrays['feature']))
+        return summary
+
+
+def load_artifact(path) -> ArtifactModel:
+    """Map and verify an artifact (the model registry factory for .ebm files)"""
+    header, arrays = read_artifact(path)
+    try:
+        return ArtifactModel(header, arrays, path)
+    except (KeyError, TypeError, ValueError) as e:
+        raise ArtifactError(f"{path} does not describe a valid model: {e!r}") from e
+
+
+# =============================================================================
+# TRAINED MODEL FILES
+# =============================================================================
+
+# Unpickling runs arbitrary code from the file, so the pickle is only a fallback on request
+ALLOW_PICKLED_MODELS = os.environ.get('EDUBOOST_ALLOW_PICKLED_MODELS', '0') == '1'
+
+
+def load_pickled_model(path):
+    """Unpickle a trained model; this is what imports its ML library (e.g. xgboost)"""
+    import pickle
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def artifact_path_for(pickle_path):
+    """Where `python model_artifact.py export pickle_path` writes the artifact"""
+    return os.path.splitext(pickle_path)[0] + ARTIFACT_SUFFIX
+
+
+def model_source(pickle_path):
+    """(path, loader) of a trained model: its artifact, or the pickle if allowed and no artifact exists"""
+    artifact_path = artifact_path_for(pickle_path)
+    if ALLOW_PICKLED_MODELS and not os.path.exists(artifact_path):
+        return pickle_path, load_pickled_model
+    return artifact_path, load_artifact
+
+
+def load_model(pickle_path):
+    """Load the model trained as `pickle_path` the way the server does (see model_source)"""
+    path, loader = model_source(pickle_path)
+    if loader is load_artifact and not os.path.exists(path) and os.path.exists(pickle_path):
+        raise ArtifactError(f"{path} does not exist: run `python model_artifact.py export {pickle_path}` "
+                            "or set EDUBOOST_ALLOW_PICKLED_MODELS=1")
+    return loader(path)
+
+
+# =============================================================================
+# EXPORT
+# =============================================================================
+
+def _pack_trees(trees, comparison, aggregation, link, base_margin=0.0):
+    """Concatenate per-tree node lists into flat arrays.
+
+    Each tree is a list of nodes (feature, threshold, left, right,
+    default_left, value) with child indices local to the tree and
+    feature -1 for leaves. In the packed form a leaf has feature 0 and all
+    its children point back to itself, so traversal needs no leaf test.
+    """
+    feature, threshold, children, missing, value = [], [], [], [], []
+    roots, max_depth = [], 0
+    for tree in trees:
+        offset = len(feature)
+        roots.append(offset)
+        depth = {0: 0}
+        for index, (split, cutoff, left, right, default_left, leaf_value) in enumerate(tree):
+            node = index + offset
+            if split < 0:
+                feature.append(0)
+                children.append((node, node))
+                missing.append(node)
+            else:
+                depth[left] = depth[right] = depth[index] + 1
+                max_depth = max(max_depth, depth[index] + 1)
+                feature.append(split)
+                children.append((left + offset, right + offset))
+                missing.append((left if default_left else right) + offset)
+            threshold.append(cutoff)
+            value.append(leaf_value)
+
+    arrays = {
+        'feature': np.array(feature, dtype='<i4'),
+        'threshold': np.array(threshold, dtype='<f8'),
+        'children': np.array(children, dtype='<i4').reshape(-1, 2),
+        'missing': np.array(missing, dtype='<i4'),
+        'value': np.array(value, dtype='<f8'),
+        'roots': np.array(roots, dtype='<i4')
+    }
+    params = {
+        'comparison': comparison,
+        'aggregation': aggregation,
+        'link': link,
+        'base_margin': float(base_margin),
+        'max_depth': max_depth
+    }
+    return KIND_TREE_ENSEMBLE, params, arrays
+
+
+def _sklearn_trees(estimators):
+    """Random forest / decision tree classifiers: leaf value is P(positive class)"""
+    trees = []
+    for estimator in estimators:
+        tree = estimator.tree_
+        value = np.asarray(tree.value)[:, 0, :]
+        positive = value[:, -1] / np.maximum(value.sum(axis=1), 1e-12)
+        missing_left = getattr(tree, 'missing_go_to_left', np.ones(tree.node_count))
+        trees.append([
+            (int(feature) if left >= 0 else -1, float(threshold), int(left), int(right), int(bool(default_left)), float(p))
+            for feature, threshold, left, right, default_left, p in zip(
+                tree.feature, tree.threshold, tree.children_left, tree.children_right, missing_left, positive)
+        ])
+    return _pack_trees(trees, comparison='le', aggregation='mean', link='identity')
+
+
+def _xgboost_trees(booster):
+    """XGBoost binary:logistic boosters, from their JSON tree dump"""
+    config = json.loads(booster.save_config())
+    objective = config['learner']['objective']['name']
+    if objective not in ('binary:logistic', 'reg:logistic'):
+        raise ArtifactError(f"Unsupported XGBoost objective '{objective}'")
+    # Newer releases store it as a one-element vector, e.g. "[5E-1]"
+    base_score = float(config['learner']['learner_model_param']['base_score'].strip('[]'))
+    names = list(booster.feature_names or [])
+
+    def feature_index(split):
+        if split in names:
+            return names.index(split)
+        return int(split.lstrip('f'))
+
+    trees = []
+    for dump in booster.get_dump(dump_format='json'):
+        nodes = {}
+        stack = [json.loads(dump)]
+        while stack:
+            node = stack.pop()
+            nodes[node['nodeid']] = node
+            stack.extend(node.get('children', ()))
+        local = {nodeid: index for index, nodeid in enumerate(sorted(nodes))}
+        trees.append([
+            (-1, 0.0, 0, 0, 1, float(node['leaf'])) if 'leaf' in node else (
+                feature_index(node['split']), float(np.float32(node['split_condition'])),
+                local[node['yes']], local[node['no']], int(node.get('missing', node['yes']) == node['yes']), 0.0)
+            for node in (nodes[nodeid] for nodeid in sorted(nodes))
+        ])
+    base_margin = np.log(base_score / (1 - base_score))
+    return _pack_trees(trees, comparison='lt', aggregation='sum', link='logistic', base_margin=base_margin)
+
+
+def export_model(model):
+    """Convert a trained model object into (kind, params, arrays, n_features, feature_schema)"""
+    scaler = None
+    if isinstance(model, dict) and 'xgb_model' in model:
+        scaler, model = model.get('scaler'), model['xgb_model']
+
+    n_features = getattr(model, 'n_features_in_', None)
+    if hasattr(model, 'get_booster'):
+        model = model.get_booster()
+    if hasattr(model, 'get_dump'):
+        kind, params, arrays = _xgboost_trees(model)
+        n_features = n_features or model.num_features()
+    elif hasattr(model, 'estimators_') and all(hasattr(tree, 'tree_') for tree in model.estimators_):
+        kind, params, arrays = _sklearn_trees(model.estimators_)
+    elif hasattr(model, 'tree_'):
+        kind, params, arrays = _sklearn_trees([model])
+    elif hasattr(model, 'coef_') and hasattr(model, 'intercept_'):
+        kind = KIND_LINEAR
+        arrays = {'coef': np.asarray(model.coef_, dtype='<f8').reshape(-1)}
+        params = {'intercept': float(np.ravel(model.intercept_)[0]), 'link': 'logistic'}
+        n_features = n_features or len(arrays['coef'])
+    else:
+        raise ArtifactError(f"Cannot export models of type {type(model).__name__}")
+
+    if scaler is not None:
+        arrays['scale_mean'] = np.asarray(scaler.mean_, dtype='<f8')
+        arrays['scale_std'] = np.asarray(scaler.scale_, dtype='<f8')
+
+    names = getattr(model, 'feature_names_in_', None)
+    if names is None and n_features == feature_transform.FEATURE_COUNT:
+        names = feature_transform.FEATURE_NAMES
+    feature_schema = feature_transform.FEATURE_SCHEMA_ID if names is not None and tuple(names) == feature_transform.FEATURE_NAMES else None
+    if n_features is None:
+        raise ArtifactError("Cannot determine the model's number of input features")
+    return kind, params, arrays, n_features, feature_schema
+
+
+def export_pickle(pickle_path, artifact_path=None) -> Dict:
+    """Unpickle a trusted model file once and write it as an artifact next to it"""
+    model = load_pickled_model(pickle_path)
+    artifact_path = artifact_path or artifact_path_for(pickle_path)
+    kind, params, arrays, n_features, feature_schema = export_model(model)
+    header = save_artifact(artifact_path, kind, params, arrays, n_features, feature_schema)
+    return dict(header, path=artifact_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export or inspect EduBoost model artifacts')
+    commands = parser.add_subparsers(dest='command', required=True)
+    export = commands.add_parser('export', help='Convert a trusted pickled model into an artifact')
+    export.add_argument('pickle_path')
+    export.add_argument('--output', help=f'Artifact path (default: the pickle path with {ARTIFACT_SUFFIX})')
+    inspect = commands.add_parser('inspect', help='Verify an artifact and print its summary')
+    inspect.add_argument('artifact_path')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'export':
+            header = export_pickle(args.pickle_path, args.output)
+            print(f"✅ Wrote {header['kind']} artifact to {header['path']} ({os.path.getsize(header['path']):,} bytes)")
+        else:
+            model = load_artifact(args.artifact_path)
+            print(f"✅ {args.artifact_path} passed its integrity check")
+            print(json.dumps(model.describe(), indent=2))
+    except (ArtifactError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""
+EduBoost Model Registry
+Process-wide, lazily loaded model cache with mtime-based hot reload
+
+Models are registered with a file path and a factory that builds the model
+from that path. The first get() loads the model; later calls return the
+cached instance until the file's modification time changes on disk, at
+which point the model is reloaded once and swapped in.
+
+A failed first load is remembered: get() raises straight away, without the
+lock or another open(), until the file changes or retry_interval passes.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# Seconds between os.stat() calls when checking a model file for changes
+DEFAULT_CHECK_INTERVAL = float(os.environ.get('EDUBOOST_MODEL_CHECK_INTERVAL', 2.0))
+
+# Seconds a failed load is not retried unless the file changes
+DEFAULT_RETRY_INTERVAL = float(os.environ.get('EDUBOOST_MODEL_RETRY_INTERVAL', 30.0))
+
+
+def _current_rss_bytes() -> Optional[int]:
+    """Resident set size of this process, or None where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class ModelNotAvailableError(Exception):
+    """Raised when a registered model cannot be loaded"""
+
+
+class CachedModel:
+    """One registered model: lazy load, hot reload and load statistics"""
+
+    def __init__(self, name, path, factory: Callable, check_interval=DEFAULT_CHECK_INTERVAL,
+                 retry_interval=DEFAULT_RETRY_INTERVAL):
+        self.name = name
+        self.path = path
+        self.factory = factory
+        self.check_interval = check_interval
+        self.retry_interval = retry_interval
+
+        self._model = None
+        self._mtime_ns = None
+        self._last_check = 0.0
+        # Last failed first load: (error message, file mtime or None if missing, monotonic retry time)
+        self._failure = None
+        self._lock = threading.Lock()
+        self._stats = {
+            'loads': 0,
+            'reloads': 0,
+            'failures': 0,
+            'cached_failures': 0,
+            'last_error': None,
+            'load_time_ms': None,
+            'loaded_at': None,
+            'file_size_bytes': None,
+            'rss_delta_bytes': None
+        }
+
+    def _file_mtime_ns(self):
+        return os.stat(self.path).st_mtime_ns
+
+    def _is_stale(self):
+        """Check (at most every check_interval seconds) whether the file changed"""
+        now = time.monotonic()
+        if now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+
+        try:
+            return self._file_mtime_ns() != self._mtime_ns
+        except OSError:
+            # Keep serving the loaded model if the file is briefly missing mid-deploy
+            return False
+
+    def _load(self):
+        """Build the model from disk and record timing and memory footprint"""
+        is_reload = self._model is not None
+        rss_before = _current_rss_bytes()
+        started = time.perf_counter()
+
+        try:
+            mtime_ns = self._file_mtime_ns()
+            model = self.factory(self.path)
+        except Exception as e:
+            self._stats['failures'] += 1
+            self._stats['last_error'] = str(e)
+            if is_reload:
+                print(f"⚠️ Reload of model '{self.name}' failed, keeping previous version: {e}")
+                return
+            message = f"Model '{self.name}' could not be loaded: {e}"
+            now = time.monotonic()
+            self._failure = (message, self._mtime_or_none(), now + self.retry_interval)
+            self._last_check = now
+            raise ModelNotAvailableError(message) from e
+
+        load_time_ms = (time.perf_counter() - started) * 1000
+        rss_after = _current_rss_bytes()
+
+        self._model = model
+        self._mtime_ns = mtime_ns
+        self._failure = None
+        self._last_check = time.monotonic()
+        self._stats['loads'] += 1
+        if is_reload:
+            self._stats['reloads'] += 1
+        self._stats.update({
+            'last_error': None,
+            'load_time_ms': round(load_time_ms, 3),
+            'loaded_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'file_size_bytes': os.path.getsize(self.path),
+            'rss_delta_bytes': (rss_after - rss_before) if rss_before is not None and rss_after is not None else None
+        })
+        print(f"✅ Model '{self.name}' {'reloaded' if is_reload else 'loaded'} in {load_time_ms:.1f} ms")
+
+    def _cached_failure(self):
+        """The error message of the last failed load while it still stands, else None.
+
+        It stands until retry_interval passes or the file's mtime (checked at
+        most every check_interval seconds) differs from the failed attempt's.
+        """
+        failure = self._failure
+        if failure is None:
+            return None
+        message, mtime_ns, retry_at = failure
+        now = time.monotonic()
+        if now >= retry_at:
+            return None
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            if self._mtime_or_none() != mtime_ns:
+                return None
+        return message
+
+    def get(self):
+        """Return the cached model, loading or hot-reloading it if needed"""
+        model = self._model
+        if model is not None and not self._is_stale():
+            return model
+        if model is None:
+            message = self._cached_failure()
+            if message is not None:
+                self._stats['cached_failures'] += 1
+                raise ModelNotAvailableError(message)
+
+        with self._lock:
+            # Another thread may have (re)loaded the model -- or failed to -- while we waited
+            if self._model is None:
+                message = self._cached_failure()
+                if message is not None:
+                    self._stats['cached_failures'] += 1
+                    raise ModelNotAvailableError(message)
+            if self._model is None or self._mtime_ns != self._safe_mtime_ns():
+                self._load()
+            return self._model
+
+    def _safe_mtime_ns(self):
+        try:
+            return self._file_mtime_ns()
+        except OSError:
+            return self._mtime_ns
+
+    def _mtime_or_none(self):
+        try:
+            return self._file_mtime_ns()
+        except OSError:
+            return None
+
+    @property
+    def is_loaded(self):
+        return self._model is not None
+
+    def stats(self) -> Dict:
+        return dict(self._stats, name=self.name, path=self.path, loaded=self.is_loaded)
+
+
+class ModelRegistry:
+    """Named collection of CachedModel entries shared by the whole process"""
+
+    def __init__(self):
+        self._models: Dict[str, CachedModel] = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, path, factory: Callable, **kwargs) -> CachedModel:
+        """Register (or replace) a model; nothing is loaded until first use"""
+        entry = CachedModel(name, path, factory, **kwargs)
+        with self._lock:
+            self._models[name] = entry
+        return entry
+
+    def is_registered(self, name) -> bool:
+        return name in self._models
+
+    def get(self, name):
+        """Return the named model, loading it on first use"""
+        entry = self._models.get(name)
+        if entry is None:
+            raise ModelNotAvailableError(f"Model '{name}' is not registered")
+        return entry.get()
+
+    def warm_up(self, names=None):
+        """Eagerly load models (all registered ones by default); returns failures"""
+        failures = {}
+        for name in (names or list(self._models)):
+            try:
+                self.get(name)
+            except ModelNotAvailableError as e:
+                failures[name] = str(e)
+                print(f"⚠️ {e}")
+        return failures
+
+    def stats(self) -> Dict:
+        return {name: entry.stats() for name, entry in self._models.items()}
+
+
+# Process-wide registry used by the Flask apps
+model_registry = ModelRegistry()
@@ -0,0 +1,376 @@
+"""
+EduBoost Performance Ingestion
+Bulk loader for student_performance rows from CSV or NDJSON streams
+
+Records are read lazily from the input, grouped into chunks, validated
+column-wise with NumPy and written with executemany inside one transaction
+per chunk. Rows are upserted on (student_id, module_name, semester), so
+re-loading a term's results replaces the previous values instead of
+duplicating them. Missing risk scores are filled in by the risk engine.
+
+Usage:
+    python performance_ingest.py results.csv
+    python performance_ingest.py results.ndjson --format ndjson --batch-size 20000
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+import goal_store
+import risk_engine
+
+TEXT_FIELDS = ('student_id', 'module_name', 'semester')
+
+# Numeric fields with their (min, max) bounds; None means unbounded
+FLOAT_FIELDS = {
+    'module_difficulty': (1.0, 5.0),
+    'current_gpa': (0.0, 4.0),
+    'attendance_rate': (0.0, 100.0),
+    'lab_completion_rate': (0.0, 100.0)
+}
+INT_FIELDS = {
+    'avg_assessment_score': (0, 100),
+    'assignments_late': (0, None),
+    'num_submission_attempts': (0, None),
+    'login_frequency': (0, None),
+    'participation_score': (0, 100),
+    'failed_module': (0, 1)
+}
+RISK_FIELD = 'risk_score'
+
+REQUIRED_FIELDS = TEXT_FIELDS + tuple(FLOAT_FIELDS) + tuple(INT_FIELDS)
+PERFORMANCE_FIELDS = REQUIRED_FIELDS + (RISK_FIELD,)
+
+DEFAULT_BATCH_SIZE = int(os.environ.get('EDUBOOST_INGEST_BATCH_SIZE', 10000))
+# One batch is buffered and written in one transaction (holding the write lock)
+MAX_BATCH_SIZE = int(os.environ.get('EDUBOOST_INGEST_MAX_BATCH_SIZE', 50000))
+# Largest request body the HTTP endpoint streams in; the CLI reads files of any size
+MAX_BULK_BYTES = int(os.environ.get('EDUBOOST_INGEST_MAX_BYTES', 256 * 1024 * 1024))
+MAX_REPORTED_ERRORS = 100
+
+UPSERT_SQL = '''
+    INSERT INTO student_performance ({columns})
+    VALUES ({placeholders})
+    ON CONFLICT (student_id, module_name, semester) DO UPDATE SET
+        {updates},
+        updated_at = CURRENT_TIMESTAMP
+'''.format(
+    columns=', '.join(PERFORMANCE_FIELDS),
+    placeholders=', '.join('?' for _ in PERFORMANCE_FIELDS),
+    updates=',\n        '.join(f'{field} = excluded.{field}'
+                               for field in PERFORMANCE_FIELDS if field not in TEXT_FIELDS)
+)
+
+
+class IngestFormatError(ValueError):
+    """Raised when the input stream cannot be parsed as the requested format.
+
+    Batches before the bad input are already committed; `result` is the
+    ingest_stream summary of them (None when nothing was read).
+    """
+
+    def __init__(self, message, result=None):
+        super().__init__(message)
+        self.result = result
+
+
+class IngestTooLargeError(IngestFormatError):
+    """Raised when an input stream exceeds its byte limit (rows before it are committed)"""
+
+
+# =============================================================================
+# READERS
+# =============================================================================
+
+def iter_csv_chunks(lines: Iterable[str], batch_size=DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, list]]:
+    """Yield {field: [values]} column chunks from CSV text with a header row"""
+    reader = csv.reader(lines)
+    try:
+        header = [name.strip() for name in next(reader)]
+    except StopIteration:
+        return
+
+    missing = [field for field in REQUIRED_FIELDS if field not in header]
+    if missing:
+        raise IngestFormatError(f"CSV header is missing fields: {', '.join(missing)}")
+    positions = {field: header.index(field) for field in PERFORMANCE_FIELDS if field in header}
+
+    rows = []
+    for row in reader:
+        if not row:
+            continue
+        rows.append(row)
+        if len(rows) >= batch_size:
+            yield _csv_columns(rows, positions, len(header))
+            rows = []
+    if rows:
+        yield _csv_columns(rows, positions, len(header))
+
+
+def _csv_columns(rows, positions, width):
+    # Pad short rows so zip() keeps every record
+    rows = [row if len(row) >= width else row + [''] * (width - len(row)) for row in rows]
+    transposed = list(zip(*rows))
+    return {field: list(transposed[index]) for field, index in positions.items()}
+
+
+def iter_ndjson_chunks(lines: Iterable[str], batch_size=DEFAULT_BATCH_SIZE) -> Iterator[Dict[str, list]]:
+    """Yield {field: [values]} column chunks from one JSON object per line"""
+    records = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise IngestFormatError(f"Invalid JSON on line {line_number}: {e}") from e
+        if not isinstance(record, dict):
+            raise IngestFormatError(f"Line {line_number} is not a JSON object")
+        records.append(record)
+        if len(records) >= batch_size:
+            yield _record_columns(records)
+            records = []
+    if records:
+        yield _record_columns(records)
+
+
+def _record_columns(records):
+    return {field: [record.get(field) for record in records] for field in PERFORMANCE_FIELDS}
+
+
+READERS = {
+    'csv': iter_csv_chunks,
+    'ndjson': iter_ndjson_chunks
+}
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def _to_float_array(values):
+    """Convert raw values to float64; unparsable or empty entries become NaN"""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        pass
+
+    converted = np.empty(len(values), dtype=np.float64)
+    for i, value in enumerate(values):
+        try:
+            converted[i] = float(value)
+        except (TypeError, ValueError):
+            converted[i] = np.nan
+    return converted
+
+
+def _field_errors(valid, errors, offset, field, bad, reason):
+    """Mark rows invalid and keep a bounded sample of error messages"""
+    valid &= ~bad
+    if len(errors) < MAX_REPORTED_ERRORS:
+        for row in np.flatnonzero(bad)[:MAX_REPORTED_ERRORS - len(errors)]:
+            errors.append({'row': offset + int(row), 'field': field, 'error': reason})
+
+
+def validate_chunk(columns: Dict[str, list], offset=0, errors: Optional[List] = None):
+    """Validate a column chunk; returns (parameter rows for valid records, rejected count)"""
+    if errors is None:
+        errors = []
+    row_count = len(columns['student_id'])
+    valid = np.ones(row_count, dtype=bool)
+
+    text = {}
+    for field in TEXT_FIELDS:
+        values = np.array(['' if value is None else str(value).strip() for value in columns[field]], dtype=object)
+        _field_errors(valid, errors, offset, field, values == '', 'is required')
+        text[field] = values
+
+    numeric = {}
+    for field, (low, high) in {**FLOAT_FIELDS, **INT_FIELDS}.items():
+        values = _to_float_array(columns[field])
+        bad = ~np.isfinite(values)
+        _field_errors(valid, errors, offset, field, bad, 'must be a number')
+        out_of_range = ~bad & (((values < low) if low is not None else False) |
+                               ((values > high) if high is not None else False))
+        if np.any(out_of_range):
+            bounds = f'between {low} and {high}' if high is not None else f'at least {low}'
+            _field_errors(valid, errors, offset, field, out_of_range, f'must be {bounds}')
+        if field in INT_FIELDS:
+            fractional = ~bad & (values != np.floor(values))
+            if np.any(fractional):
+                _field_errors(valid, errors, offset, field, fractional, 'must be a whole number')
+        numeric[field] = values
+
+    risk = _to_float_array(columns[RISK_FIELD]) if RISK_FIELD in columns else np.full(row_count, np.nan)
+    bad_risk = np.isfinite(risk) & ((risk < 0) | (risk > 1))
+    if np.any(bad_risk):
+        _field_errors(valid, errors, offset, RISK_FIELD, bad_risk, 'must be between 0 and 1')
+
+    rejected = int(row_count - np.count_nonzero(valid))
+    if not np.any(valid):
+        return [], rejected
+
+    # Fill in missing risk scores with the same rules as the synthetic data
+    missing_risk = ~np.isfinite(risk) & valid
+    if np.any(missing_risk):
+        computed = risk_engine.calculate_risk_scores(
+            {field: np.nan_to_num(numeric[field][missing_risk]) for field in risk_engine.RISK_SCORE_FIELDS}
+        )
+        risk[missing_risk] = np.round(computed, 3)
+
+    output = []
+    for field in PERFORMANCE_FIELDS:
+        if field in TEXT_FIELDS:
+            output.append(text[field][valid].tolist())
+        elif field in INT_FIELDS:
+            output.append(numeric[field][valid].astype(np.int64).tolist())
+        elif field == RISK_FIELD:
+            output.append(risk[valid].tolist())
+        else:
+            output.append(numeric[field][valid].tolist())
+    return list(zip(*output)), rejected
+
+
+# =============================================================================
+# INGESTION
+# =============================================================================
+
+def ingest_stream(pool, lines: Iterable[str], fmt='csv', batch_size=DEFAULT_BATCH_SIZE) -> Dict:
+    """Validate and upsert every record from `lines` in batched transactions"""
+    if fmt not in READERS:
+        raise IngestFormatError(f"Unsupported format '{fmt}', expected one of: {', '.join(READERS)}")
+    batch_size = min(max(1, batch_size), MAX_BATCH_SIZE)
+
+    started = time.perf_counter()
+    errors = []
+    student_ids = set()
+    received = written = rejected = batches = 0
+
+    def summary():
+        elapsed = time.perf_counter() - started
+        return {
+            'rows_received': received,
+            'rows_written': written,
+            'rows_rejected': rejected,
+            'batches': batches,
+            'students': len(student_ids),
+            'student_ids': student_ids,
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': round(written / elapsed, 1) if elapsed > 0 else 0.0,
+            'errors': errors
+        }
+
+    try:
+        for columns in READERS[fmt](lines, batch_size):
+            rows, chunk_rejected = validate_chunk(columns, offset=received, errors=errors)
+            received += len(columns['student_id'])
+            rejected += chunk_rejected
+            if not rows:
+                continue
+
+            batch_students = {row[0] for row in rows}
+            with pool.transaction() as cursor:
+                cursor.executemany(UPSERT_SQL, rows)
+                goal_store.mark_inputs_changed(cursor, batch_students)
+            written += len(rows)
+            batches += 1
+            student_ids.update(batch_students)
+    except UnicodeDecodeError as e:
+        raise IngestFormatError(f"Input is not valid UTF-8: {e}", summary()) from e
+    except IngestFormatError as e:
+        raise type(e)(str(e), summary()) from e
+
+    return summary()
+
+
+def detect_format(content_type='', filename=''):
+    """Pick 'csv' or 'ndjson' from a content type or file extension"""
+    content_type = (content_type or '').lower()
+    if 'ndjson' in content_type or 'jsonl' in content_type:
+        return 'ndjson'
+    if filename.lower().endswith(('.ndjson', '.jsonl', '.json')):
+        return 'ndjson'
+    return 'csv'
+
+
+class _CappedStream(io.RawIOBase):
+    """Binary stream that raises IngestTooLargeError once more than `max_bytes` are read"""
+
+    def __init__(self, stream, max_bytes):
+        self.stream = stream
+        self.max_bytes = self.remaining = max_bytes
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.stream.read(min(len(buffer), self.remaining + 1))
+        if len(data) > self.remaining:
+            raise IngestTooLargeError(f"Input is larger than {self.max_bytes} bytes")
+        self.remaining -= len(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+
+def text_lines(binary_stream, max_bytes=None):
+    """Wrap a binary stream (e.g. a request body) for line-by-line UTF-8 reading, at most `max_bytes` of it"""
+    if max_bytes is not None:
+        binary_stream = io.BufferedReader(_CappedStream(binary_stream, max_bytes))
+    return io.TextIOWrapper(binary_stream, encoding='utf-8-sig', newline='')
+
+
+# =============================================================================
+# COMMAND LINE
+# =============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Bulk load student_performance rows from CSV or NDJSON')
+    parser.add_argument('path', help="Input file ('-' for stdin)")
+    parser.add_argument('--format', choices=sorted(READERS), help='Input format (default: from file extension)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='Rows per transaction')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'eduboost.db'),
+                        help='SQLite database path')
+    args = parser.parse_args(argv)
+
+    from db_pool import get_pool
+    from migrations import apply_migrations
+
+    pool = get_pool(args.db)
+    with pool.connection() as conn:
+        apply_migrations(conn)
+
+    fmt = args.format or detect_format(filename=args.path)
+    print(f"📥 Loading {args.path} ({fmt}) into {args.db}...")
+
+    try:
+        if args.path == '-':
+            result = ingest_stream(pool, text_lines(sys.stdin.buffer), fmt, args.batch_size)
+        else:
+            with open(args.path, encoding='utf-8-sig', newline='') as f:
+                result = ingest_stream(pool, f, fmt, args.batch_size)
+    except IngestFormatError as e:
+        print(f"❌ {e}")
+        if e.result and e.result['rows_written']:
+            print(f"⚠️ {e.result['rows_written']:,} rows before the error were already written")
+        return 2
+
+    print(f"✅ {result['rows_written']:,} rows written for {result['students']:,} students "
+          f"in {result['elapsed_seconds']}s ({result['rows_per_second']:,.0f} rows/sec)")
+    if result['rows_rejected']:
+        print(f"⚠️ {result['rows_rejected']:,} rows rejected, first errors:")
+        for error in result['errors'][:10]:
+            print(f"   row {error['row']}: {error['field']} {error['error']}")
+    return 0 if result['rows_rejected'] == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+EduBoost Resource Catalog
+In-memory, read-only index of the learning_resources table
+
+The table is loaded once per process into column arrays sorted by
+rating DESC, difficulty_level ASC (the order of the indexed SQL query), so
+a resource is identified by its row number and lower rows rank higher.
+Row numbers are bucketed by module, (module, type) and
+(module, type, difficulty); every bucket is therefore already in rank
+order and a lookup is a dict access plus a slice. topic_tags JSON is
+decoded once while loading, and only the rows a caller returns are turned
+into dicts.
+
+Writes to learning_resources bump a version counter through triggers
+(migration 6). The catalog re-reads that counter at most every
+check_interval seconds and swaps in a freshly built snapshot when it
+changed; readers keep using the snapshot they already hold.
+"""
+
+import heapq
+import json
+import os
+import threading
+import time
+from itertools import islice
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+CATALOG_NAME = 'learning_resources'
+DEFAULT_CHECK_INTERVAL = float(os.environ.get('EDUBOOST_CATALOG_CHECK_INTERVAL', 5.0))
+
+# Planner recommendation categories and the resource types they draw from
+RECOMMENDATION_CATEGORIES = {
+    'books': ('book',),
+    'online_courses': ('online', 'tutorial'),
+    'practice_platforms': ('practice',),
+    'video_tutorials': ('video',)
+}
+
+RESOURCE_COLUMNS = (
+    'id', 'module_name', 'resource_type', 'resource_title', 'resource_url', 'resource_author',
+    'difficulty_level', 'topic_tags', 'rating', 'estimated_hours', 'description', 'is_free'
+)
+
+EMPTY_ROWS = np.empty(0, dtype=np.int32)
+
+CATALOG_VERSION_SQL = 'SELECT version FROM catalog_versions WHERE name = ?'
+
+
+def catalog_version(cursor) -> int:
+    """Current version stamp of learning_resources (bumped by triggers on every write)"""
+    row = cursor.execute(CATALOG_VERSION_SQL, (CATALOG_NAME,)).fetchone()
+    return row[0] if row else 0
+
+
+class CatalogSnapshot:
+    """Immutable index over one version of learning_resources"""
+
+    def __init__(self, rows: List[tuple], version: int):
+        self.version = version
+        started = time.perf_counter()
+
+        # Rank order of ORDER BY rating DESC, difficulty_level ASC, id: SQLite sorts
+        # NULL as the smallest value, so NULL ratings come last and NULL difficulties first
+        rows = sorted(rows, key=lambda row: (
+            -(row[8] if row[8] is not None else float('-inf')),
+            row[6] if row[6] is not None else float('-inf'),
+            row[0]
+        ))
+
+        self.ids = np.array([row[0] for row in rows], dtype=np.int64)
+        self.difficulty = np.array([row[6] if row[6] is not None else 0 for row in rows], dtype=np.int8)
+        self.rating = np.array([row[8] if row[8] is not None else np.nan for row in rows], dtype=np.float64)
+        self.hours = np.array([row[9] if row[9] is not None else 0 for row in rows], dtype=np.int32)
+        self.is_free = np.array([bool(row[11]) for row in rows], dtype=bool)
+        self.module = tuple(row[1] for row in rows)
+        self.type = tuple(row[2] for row in rows)
+        self.title = tuple(row[3] for row in rows)
+        self.url = tuple(row[4] for row in rows)
+        self.author = tuple(row[5] for row in rows)
+        self.description = tuple(row[10] for row in rows)
+        self.tags = tuple(tuple(json.loads(row[7])) if row[7] else () for row in rows)
+        self.row_by_id = {resource_id: row for row, resource_id in enumerate(self.ids.tolist())}
+
+        buckets = {}
+        for row in range(len(rows)):
+            module, resource_type, difficulty = self.module[row], self.type[row], int(self.difficulty[row])
+            for key in ((module,), (module, resource_type), (module, resource_type, difficulty)):
+                buckets.setdefault(key, []).append(row)
+        self.buckets = {key: np.array(bucket, dtype=np.int32) for key, bucket in buckets.items()}
+
+        self.build_ms = (time.perf_counter() - started) * 1000
+
+    def __len__(self):
+        return len(self.ids)
+
+    def lookup(self, module, resource_type=None, difficulty=None) -> np.ndarray:
+        """Row numbers of a module's resources (optionally one type/difficulty), best first"""
+        if difficulty is not None and resource_type is None:
+            rows = self.buckets.get((module,), EMPTY_ROWS)
+            return rows[self.difficulty[rows] == difficulty]
+        key = (module,) if resource_type is None else (
+            (module, resource_type) if difficulty is None else (module, resource_type, difficulty)
+        )
+        return self.buckets.get(key, EMPTY_ROWS)
+
+    def top(self, modules: Iterable[str], resource_types: Optional[Sequence[str]] = None,
+            difficulty=None, limit=5) -> List[Dict]:
+        """Best `limit` resources across several modules and types, as dicts"""
+        types = resource_types or (None,)
+        buckets = [self.lookup(module, resource_type, difficulty) for module in modules for resource_type in types]
+        # Buckets are ascending row numbers, i.e. already in rank order
+        return self.records(islice(heapq.merge(*(bucket.tolist() for bucket in buckets if len(bucket))), limit))
+
+    def record(self, row) -> Dict:
+        """One resource as the dict shape used by the planner APIs"""
+        rating = self.rating[row]
+        return {
+            'id': int(self.ids[row]),
+            'module_name': self.module[row],
+            'resource_type': self.type[row],
+            'resource_title': self.title[row],
+            'resource_url': self.url[row],
+            'resource_author': self.author[row],
+            'difficulty_level': int(self.difficulty[row]),
+            'topic_tags': list(self.tags[row]),
+            'rating': None if np.isnan(rating) else float(rating),
+            'estimated_hours': int(self.hours[row]),
+            'description': self.description[row],
+            'is_free': bool(self.is_free[row])
+        }
+
+    def records(self, rows: Iterable[int]) -> List[Dict]:
+        return [self.record(row) for row in rows]
+
+    def memory_bytes(self) -> int:
+        """Approximate size of the numeric columns and bucket arrays"""
+        arrays = [self.ids, self.difficulty, self.rating, self.hours, self.is_free, *self.buckets.values()]
+        return int(sum(array.nbytes for array in arrays))
+
+
+class ResourceCatalog:
+    """Process-wide catalog that rebuilds its snapshot when learning_resources changes"""
+
+    def __init__(self, pool, check_interval=DEFAULT_CHECK_INTERVAL):
+        self.pool = pool
+        self.check_interval = check_interval
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._last_check = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'builds': 0, 'version_checks': 0}
+
+    def _build(self):
+        with self.pool.connection() as conn:
+            # Version first: a write racing with the load just triggers one more rebuild
+            version = catalog_version(conn)
+            rows = conn.execute(f'SELECT {", ".join(RESOURCE_COLUMNS)} FROM learning_resources').fetchall()
+        snapshot = CatalogSnapshot(rows, version)
+        self._stats['builds'] += 1
+        return snapshot
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Current index, rebuilt first if learning_resources changed since it was built"""
+        snapshot = self._snapshot
+        if snapshot is not None and time.monotonic() - self._last_check < self.check_interval:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not None and time.monotonic() - self._last_check < self.check_interval:
+                return self._snapshot
+            if self._snapshot is None:
+                self._snapshot = self._build()
+            else:
+                self._stats['version_checks'] += 1
+                with self.pool.connection() as conn:
+                    version = catalog_version(conn)
+                if version != self._snapshot.version:
+                    self._snapshot = self._build()
+            self._last_check = time.monotonic()
+            return self._snapshot
+
+    def invalidate(self):
+        """Force a version check on the next lookup (e.g. right after writing resources)"""
+        self._last_check = 0.0
+
+    def stats(self) -> Dict:
+        snapshot = self._snapshot
+        stats = dict(self._stats, check_interval_seconds=self.check_interval, loaded=snapshot is not None)
+        if snapshot is not None:
+            stats.update({
+                'version': snapshot.version,
+                'resources': len(snapshot),
+                'buckets': len(snapshot.buckets),
+                'build_ms': round(snapshot.build_ms, 3),
+                'memory_bytes': snapshot.memory_bytes()
+            })
+        return stats
@@ -0,0 +1,263 @@
+"""
+EduBoost Resource API Client
+Pooled, circuit-broken client for the Next.js /api/resources endpoint
+
+- A persistent requests.Session with a keep-alive connection pool
+- Fetches run on a small worker pool; callers wait at most `deadline`
+  seconds, so a slow Next.js side can no longer pin a Flask worker
+- Identical in-flight (studentId, modules) queries are coalesced into one
+  HTTP call whose result is shared by every waiting caller; at most
+  `max_pending` distinct calls may be in flight, further ones fail fast
+- A circuit breaker opens after consecutive failures and fails fast until
+  the reset timeout has passed, then lets a single trial request through.
+  Every call reports exactly one outcome to it; a call that misses the
+  caller's deadline counts as a failure even if it answers later
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict
+
+
+DEFAULT_RESOURCES_API_URL = os.environ.get('EDUBOOST_RESOURCES_API_URL', 'http://localhost:3000/api/resources')
+
+
+class ResourceFetchError(Exception):
+    """Raised when the resource API call fails or returns an unusable response"""
+
+
+class CircuitOpenError(ResourceFetchError):
+    """Raised without calling the API while the circuit breaker is open"""
+
+
+class _Attempt:
+    """One HTTP call; its outcome is reported to the breaker once (deadline miss or result)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.settled = False
+
+    def settle(self) -> bool:
+        """True for the first caller only"""
+        with self._lock:
+            if self.settled:
+                return False
+            self.settled = True
+            return True
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a half-open trial state"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.times_opened = 0
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self):
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = False
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a call may go out now (claims the trial slot when half-open)"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_in_flight = False
+
+
+class ResourceClient:
+    """Client for personalized resource recommendations from the web app"""
+
+    def __init__(self, base_url=DEFAULT_RESOURCES_API_URL,
+                 connect_timeout=float(os.environ.get('EDUBOOST_RESOURCES_CONNECT_TIMEOUT', 1.0)),
+                 read_timeout=float(os.environ.get('EDUBOOST_RESOURCES_READ_TIMEOUT', 5.0)),
+                 deadline=float(os.environ.get('EDUBOOST_RESOURCES_DEADLINE', 2.0)),
+                 pool_size=int(os.environ.get('EDUBOOST_RESOURCES_POOL_SIZE', 10)),
+                 max_pending=int(os.environ.get('EDUBOOST_RESOURCES_MAX_PENDING', 20)),
+                 failure_threshold=int(os.environ.get('EDUBOOST_RESOURCES_FAILURE_THRESHOLD', 5)),
+                 reset_timeout=float(os.environ.get('EDUBOOST_RESOURCES_RESET_TIMEOUT', 30.0))):
+        self.base_url = base_url
+        self.timeout = (connect_timeout, read_timeout)
+        self.deadline = deadline
+        self.max_pending = max_pending
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+
+        # requests (with urllib3 and certifi) is imported on first use, not with the app
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._request_errors = (requests.exceptions.RequestException, ValueError)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='resource-fetch')
+        self._in_flight = {}
+        self._in_flight_lock = threading.RLock()  # done-callbacks may run inline
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'requests': 0,
+            'http_calls': 0,
+            'coalesced': 0,
+            'successes': 0,
+            'failures': 0,
+            'short_circuited': 0,
+            'rejected': 0,
+            'deadline_exceeded': 0,
+            'late_responses': 0
+        }
+
+    def _count(self, key, amount=1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _settle(self, attempt, success):
+        """Report an attempt's outcome to the breaker unless its deadline already did"""
+        if not attempt.settle():
+            self._count('late_responses')
+            return
+        if success:
+            self.breaker.record_success()
+            self._count('successes')
+        else:
+            self.breaker.record_failure()
+            self._count('failures')
+
+    def _fetch(self, params, attempt):
+        """Perform one HTTP call (runs on the worker pool)"""
+        self._count('http_calls')
+        try:
+            response = self.session.get(self.base_url, params=params, timeout=self.timeout)
+            if response.status_code != 200:
+                raise ResourceFetchError(f'Resource API request failed with status {response.status_code}')
+
+            data = response.json()
+            if not isinstance(data, dict):
+                raise ResourceFetchError(f'Resource API returned {type(data).__name__} instead of an object')
+            if not data.get('success'):
+                raise ResourceFetchError(f"Resource API error: {data.get('error', 'Unknown error')}")
+            resources = data.get('data', {})
+        except ResourceFetchError:
+            self._settle(attempt, False)
+            raise
+        except self._request_errors as e:
+            self._settle(attempt, False)
+            raise ResourceFetchError(f'Error connecting to resource API: {e}') from e
+        except Exception as e:
+            # Anything unexpected still has to close out a half-open trial
+            self._settle(attempt, False)
+            raise ResourceFetchError(f'Unusable resource API response: {e}') from e
+
+        self._settle(attempt, True)
+        return resources
+
+    def _release(self, key):
+        with self._in_flight_lock:
+            self._in_flight.pop(key, None)
+
+    def get_resources(self, student_id, modules, difficulty_level='intermediate') -> Dict:
+        """Fetch recommendations for a student; raises ResourceFetchError on any failure"""
+        self._count('requests')
+        key = (student_id, tuple(sorted(modules)), difficulty_level)
+
+        with self._in_flight_lock:
+            call = self._in_flight.get(key)
+            if call is not None:
+                self._count('coalesced')
+            else:
+                if len(self._in_flight) >= self.max_pending:
+                    self._count('rejected')
+                    raise ResourceFetchError(f'Too many resource API calls in flight ({self.max_pending})')
+                if not self.breaker.allow_request():
+                    self._count('short_circuited')
+                    raise CircuitOpenError('Resource API circuit breaker is open')
+
+                params = {
+                    'studentId': student_id,
+                    'modules': ','.join(modules),
+                    'difficultyLevel': difficulty_level
+                }
+                attempt = _Attempt()
+                call = (self._executor.submit(self._fetch, params, attempt), attempt)
+                self._in_flight[key] = call
+                call[0].add_done_callback(lambda _, key=key: self._release(key))
+
+        future, attempt = call
+        try:
+            return future.result(timeout=self.deadline)
+        except FutureTimeoutError as e:
+            # The HTTP call keeps running, but its late answer no longer counts as a success
+            self._count('deadline_exceeded')
+            if attempt.settle():
+                self.breaker.record_failure()
+                self._count('failures')
+            raise ResourceFetchError(f'Resource API did not answer within {self.deadline}s') from e
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats.update({
+            'base_url': self.base_url,
+            'circuit_state': self.breaker.state,
+            'circuit_opened': self.breaker.times_opened,
+            'in_flight': len(self._in_flight)
+        })
+        return stats
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_resource_client() -> ResourceClient:
+    """Get the process-wide resource client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ResourceClient()
+    return _client
@@ -0,0 +1,254 @@
+"""
+EduBoost Resource Relevance
+Inverted index over learning resources and goal-to-resource ranking
+
+Terms come from each resource's topic_tags, title and description, with a
+higher field weight for tags than for the title and for the title than for
+the description. A goal's query is the lecturer's weak areas for its
+module plus the distinctive words of its title. Scores are tf-free field
+weights times the term's IDF, normalized to 0..1 and blended with the
+resource rating; the best k resources are taken with a heap instead of
+sorting every candidate.
+
+Rankings are persisted in goal_resources together with the catalog version
+they were computed against, so the planner only ranks goals that are new,
+were regenerated, or whose ranking predates a catalog change. A goal that
+matched nothing is stored as one row with a NULL resource_id, so an empty
+ranking is remembered as well.
+"""
+
+import heapq
+import json
+import math
+import re
+import threading
+import weakref
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import goal_store
+
+# Field weights for where a query term occurs in a resource
+FIELD_WEIGHTS = {'tags': 3.0, 'title': 2.0, 'description': 1.0}
+MAX_FIELD_WEIGHT = sum(FIELD_WEIGHTS.values())
+
+# Query weights: lecturer-identified weak areas count double
+WEAK_AREA_WEIGHT = 2.0
+GOAL_TEXT_WEIGHT = 1.0
+
+# Share of the final relevance taken by text match vs. rating
+MATCH_SHARE = 0.8
+RATING_SHARE = 0.2
+
+DEFAULT_TOP_K = 5
+
+STOPWORDS = frozenset('''
+    a an and are as at be by for from in into is it of on or the to with your you
+'''.split())
+
+# Words every generated goal title uses; they say nothing about the topic
+GENERIC_GOAL_TERMS = frozenset('''
+    improve strengthen foundation understand master complete develop learn skills skill
+    performance understanding comprehensive apply
+'''.split())
+
+_TERM_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def tokenize(text) -> List[str]:
+    """Lowercase word terms of `text`, without stopwords"""
+    if not text:
+        return []
+    return [term for term in _TERM_PATTERN.findall(str(text).lower()) if term not in STOPWORDS and len(term) > 1]
+
+
+class ResourceIndex:
+    """Inverted index (term -> rows, field weights) over one catalog snapshot"""
+
+    def __init__(self, snapshot):
+        self.snapshot = snapshot
+        size = len(snapshot)
+
+        postings = {}
+        for row in range(size):
+            weights = {}
+            for field, terms in (
+                ('tags', (term for tag in snapshot.tags[row] for term in tokenize(tag))),
+                ('title', tokenize(snapshot.title[row])),
+                ('description', tokenize(snapshot.description[row]))
+            ):
+                for term in set(terms):
+                    weights[term] = weights.get(term, 0.0) + FIELD_WEIGHTS[field]
+            for term, weight in weights.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(row)
+                postings[term][1].append(weight)
+
+        self.postings = {
+            term: (np.array(rows, dtype=np.int32), np.array(weights, dtype=np.float32))
+            for term, (rows, weights) in postings.items()
+        }
+        self.idf = {term: math.log(1.0 + size / len(rows)) for term, (rows, _) in self.postings.items()}
+
+        rating = np.nan_to_num(snapshot.rating, nan=0.0)
+        self.rating_prior = np.clip(rating / 5.0, 0.0, 1.0) * RATING_SHARE
+
+    def scores(self, query: Dict[str, float]) -> np.ndarray:
+        """Relevance (0..1) of every resource for a {term: weight} query"""
+        match = np.zeros(len(self.snapshot), dtype=np.float64)
+        max_score = 0.0
+        for term, weight in query.items():
+            idf = self.idf.get(term)
+            if idf is None:
+                # Unknown terms still count against a perfect match
+                max_score += weight * math.log(1.0 + len(self.snapshot)) * MAX_FIELD_WEIGHT
+                continue
+            rows, field_weights = self.postings[term]
+            match[rows] += weight * idf * field_weights
+            max_score += weight * idf * MAX_FIELD_WEIGHT
+        if max_score > 0:
+            match *= MATCH_SHARE / max_score
+        return match + self.rating_prior
+
+    def matching_rows(self, query: Dict[str, float]) -> np.ndarray:
+        """Rows containing at least one query term"""
+        postings = [self.postings[term][0] for term in query if term in self.postings]
+        return np.unique(np.concatenate(postings)) if postings else np.empty(0, dtype=np.int32)
+
+    def top_k(self, query: Dict[str, float], candidates: Optional[Sequence[int]] = None,
+              k=DEFAULT_TOP_K) -> List[Tuple[int, float]]:
+        """Best k (row, relevance) pairs among `candidates` (default: every resource)"""
+        scores = self.scores(query)
+        if candidates is None:
+            candidates = range(len(scores))
+        best = heapq.nlargest(k, candidates, key=scores.__getitem__)
+        return [(int(row), round(float(scores[row]), 4)) for row in best]
+
+
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def index_for(snapshot) -> ResourceIndex:
+    """The inverted index of a catalog snapshot, built once per snapshot"""
+    index = _indexes.get(snapshot)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(snapshot)
+            if index is None:
+                index = _indexes[snapshot] = ResourceIndex(snapshot)
+    return index
+
+
+# =============================================================================
+# GOAL QUERIES
+# =============================================================================
+
+def weak_areas_by_module(lecturer_feedback: Optional[Iterable[Dict]]) -> Dict[str, List[str]]:
+    """Lecturer-identified weak areas of each module"""
+    areas = {}
+    for feedback in lecturer_feedback or []:
+        weak_areas = feedback.get('weak_areas') or []
+        if isinstance(weak_areas, str):
+            weak_areas = json.loads(weak_areas) if weak_areas else []
+        areas.setdefault(feedback['module_name'], []).extend(weak_areas)
+    return areas
+
+
+def goal_query(goal: Dict, weak_areas: Sequence[str] = ()) -> Dict[str, float]:
+    """{term: weight} query for a goal: its module's weak areas plus its title words"""
+    query = {}
+    for term in tokenize(goal.get('goal_title')):
+        if term not in GENERIC_GOAL_TERMS:
+            query[term] = max(query.get(term, 0.0), GOAL_TEXT_WEIGHT)
+    for area in weak_areas:
+        for term in tokenize(area):
+            query[term] = max(query.get(term, 0.0), WEAK_AREA_WEIGHT)
+    return query
+
+
+def rank_goal_resources(snapshot, goals: Iterable[Dict], lecturer_feedback=None,
+                        k=DEFAULT_TOP_K) -> Dict[str, List[Tuple[int, float]]]:
+    """Top-k (resource_id, relevance) for each goal, from its module's resources"""
+    index = index_for(snapshot)
+    areas = weak_areas_by_module(lecturer_feedback)
+    ranked = {}
+    for goal in goals:
+        module = goal['module_name']
+        query = goal_query(goal, areas.get(module, ()))
+        candidates = snapshot.lookup(module) if module != goal_store.GENERAL_MODULE else None
+        if candidates is None or not len(candidates):
+            # No module to draw from: any resource that matches the query
+            candidates = index.matching_rows(query)
+        rows = index.top_k(query, candidates.tolist(), k)
+        ranked[goal['goal_id']] = [(int(snapshot.ids[row]), relevance) for row, relevance in rows]
+    return ranked
+
+
+# =============================================================================
+# PERSISTENCE (goal_resources)
+# =============================================================================
+
+READ_GOAL_RESOURCES_SQL = '''
+    SELECT gr.goal_id, gr.resource_id, gr.relevance_score, gr.catalog_version
+    FROM student_goals g
+    JOIN goal_resources gr ON gr.goal_id = g.goal_id
+    WHERE g.student_id = ?
+'''
+
+
+def read_goal_resources(cursor, student_id) -> Dict[str, Dict]:
+    """Stored rankings of a student's goals: {goal_id: {'version', 'resources'}}"""
+    stored = {}
+    for goal_id, resource_id, relevance, version in cursor.execute(READ_GOAL_RESOURCES_SQL, (student_id,)):
+        entry = stored.setdefault(goal_id, {'version': version, 'resources': []})
+        if resource_id is not None:
+            entry['resources'].append((resource_id, relevance))
+        if entry['version'] != version:
+            entry['version'] = None  # mixed versions: rank again
+    for entry in stored.values():
+        entry['resources'].sort(key=lambda item: -item[1])
+    return stored
+
+
+DELETE_AI_GOAL_RESOURCES_SQL = "DELETE FROM goal_resources WHERE goal_id = ? AND recommended_by = 'ai'"
+
+
+def store_goal_resources(cursor, ranked: Dict[str, List[Tuple[int, float]]], catalog_version):
+    """Replace the persisted rankings of the given goals; an empty ranking is one NULL row"""
+    cursor.executemany(DELETE_AI_GOAL_RESOURCES_SQL, [(goal_id,) for goal_id in ranked])
+    cursor.executemany('''
+        INSERT INTO goal_resources (goal_id, resource_id, relevance_score, recommended_by, catalog_version)
+        VALUES (?, ?, ?, 'ai', ?)
+    ''', [
+        (goal_id, resource_id, relevance, catalog_version)
+        for goal_id, resources in ranked.items()
+        for resource_id, relevance in resources or [(None, None)]
+    ])
+
+
+def goal_resources(pool, snapshot, student_id, goals: List[Dict], load_feedback: Callable[[], List[Dict]],
+                   stale_goal_ids: Iterable[str] = (), k=DEFAULT_TOP_K) -> Dict[str, List[Tuple[int, float]]]:
+    """Ranked resources of each goal, ranking (and persisting) only missing or stale ones.
+
+    `load_feedback` is only called when some goal has to be ranked.
+    """
+    with pool.connection() as conn:
+        stored = read_goal_resources(conn, student_id)
+
+    stale_goal_ids = set(stale_goal_ids)
+    to_rank = [
+        goal for goal in goals
+        if goal['goal_id'] in stale_goal_ids
+        or goal['goal_id'] not in stored
+        or stored[goal['goal_id']]['version'] != snapshot.version
+    ]
+    result = {goal['goal_id']: stored[goal['goal_id']]['resources'][:k]
+              for goal in goals if goal['goal_id'] in stored}
+    if to_rank:
+        ranked = rank_goal_resources(snapshot, to_rank, load_feedback(), k)
+        with pool.transaction(immediate=True) as cursor:
+            store_goal_resources(cursor, ranked, snapshot.version)
+        result.update(ranked)
+    return result
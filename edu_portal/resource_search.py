@@ -0,0 +1,158 @@
+"""
+EduBoost Resource Search
+Full-text search over learning_resources (SQLite FTS5, BM25 ranking)
+
+learning_resources_fts indexes resource titles, descriptions and topic tags
+and is kept in sync with learning_resources by triggers (migration 8).
+Matches are ordered by BM25, with title and tag hits weighted above
+description hits, then by id. Pages continue after the last (score, id)
+returned, so a deep page costs the same as the first one.
+
+Every match that passes the filters is ranked, so the cost grows with the
+number of matches: FTS5 evaluates bm25() for each of them (and a filter
+reads each matching resource row) before the page is cut.
+"""
+
+import base64
+import json
+from typing import Dict, Optional
+
+from resource_index import tokenize
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+MAX_TERMS = 8
+
+# bm25() weights for (resource_title, description, topic_tags)
+COLUMN_WEIGHTS = (10.0, 1.0, 5.0)
+
+RESOURCE_TYPES = ('book', 'online', 'video', 'practice', 'tutorial')
+
+RESULT_COLUMNS = (
+    'id', 'module_name', 'resource_type', 'resource_title', 'resource_url', 'resource_author',
+    'difficulty_level', 'topic_tags', 'rating', 'estimated_hours', 'description', 'is_free'
+)
+
+_BOOLEANS = {'true': True, '1': True, 'yes': True, 'false': False, '0': False, 'no': False}
+
+
+class SearchQueryError(ValueError):
+    """Invalid search text, filter or cursor"""
+
+
+def fts_query(text) -> str:
+    """FTS5 MATCH expression requiring every word of `text` (user input is never parsed as syntax)
+
+    Stopwords are dropped: they match most resources and would make BM25 walk
+    nearly the whole index.
+    """
+    terms = tokenize(text)
+    if not terms:
+        raise SearchQueryError("Query parameter 'q' must contain at least one searchable word")
+    if len(terms) > MAX_TERMS:
+        raise SearchQueryError(f"Query is limited to {MAX_TERMS} words")
+    return ' '.join(f'"{term}"' for term in dict.fromkeys(terms))
+
+
+def optimize_index(cursor):
+    """Merge the index's segments into one (worth doing after bulk resource loads)"""
+    cursor.execute("INSERT INTO learning_resources_fts (learning_resources_fts) VALUES ('optimize')")
+
+
+def encode_cursor(score, resource_id) -> str:
+    """Opaque keyset cursor for the page after (score, resource_id)"""
+    return base64.urlsafe_b64encode(json.dumps([score, resource_id]).encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    try:
+        score, resource_id = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+        return float(score), int(resource_id)
+    except (ValueError, TypeError):
+        raise SearchQueryError('Invalid cursor')
+
+
+def parse_search_args(args) -> Dict:
+    """Validated search() keyword arguments from request query parameters"""
+    params = {'text': args.get('q', '')}
+
+    resource_type = args.get('type')
+    if resource_type:
+        if resource_type not in RESOURCE_TYPES:
+            raise SearchQueryError(f"'type' must be one of {', '.join(RESOURCE_TYPES)}")
+        params['resource_type'] = resource_type
+
+    difficulty = args.get('difficulty')
+    if difficulty:
+        if not difficulty.isdigit() or not 1 <= int(difficulty) <= 5:
+            raise SearchQueryError("'difficulty' must be an integer between 1 and 5")
+        params['difficulty'] = int(difficulty)
+
+    is_free = args.get('is_free')
+    if is_free:
+        if is_free.lower() not in _BOOLEANS:
+            raise SearchQueryError("'is_free' must be true or false")
+        params['is_free'] = _BOOLEANS[is_free.lower()]
+
+    limit = args.get('limit')
+    if limit:
+        if not limit.isdigit() or not 1 <= int(limit) <= MAX_LIMIT:
+            raise SearchQueryError(f"'limit' must be between 1 and {MAX_LIMIT}")
+        params['limit'] = int(limit)
+
+    if args.get('cursor'):
+        params['cursor'] = args['cursor']
+    return params
+
+
+def search(conn, text, resource_type=None, difficulty=None, is_free: Optional[bool] = None,
+           limit=DEFAULT_LIMIT, cursor=None) -> Dict:
+    """One page of resources matching `text`, best first"""
+    filters, params = [], [fts_query(text)]
+    if resource_type is not None:
+        filters.append('r.resource_type = ?')
+        params.append(resource_type)
+    if difficulty is not None:
+        filters.append('r.difficulty_level = ?')
+        params.append(difficulty)
+    if is_free is not None:
+        filters.append('r.is_free = ?')
+        params.append(int(is_free))
+
+    after = ''
+    if cursor:
+        score, resource_id = decode_cursor(cursor)
+        after = ' AND (score > ? OR (score = ? AND f.rowid > ?))'
+        params.extend([score, score, resource_id])
+    params.append(limit + 1)
+
+    # bm25() is lower-is-better and ranks every match that passes the filters;
+    # resources are only joined for filtering and for the rows of the page
+    join = 'JOIN learning_resources r ON r.id = f.rowid' if filters else ''
+    rows = conn.execute(f'''
+        WITH ranked AS (
+            SELECT f.rowid AS id, bm25(learning_resources_fts, {', '.join(map(str, COLUMN_WEIGHTS))}) AS score
+            FROM learning_resources_fts f {join}
+            WHERE learning_resources_fts MATCH ? {''.join(' AND ' + condition for condition in filters)}{after}
+            ORDER BY score, f.rowid
+            LIMIT ?
+        )
+        SELECT c.score, {', '.join('r.' + column for column in RESULT_COLUMNS)}
+        FROM ranked c
+        JOIN learning_resources r ON r.id = c.id
+        ORDER BY c.score, c.id
+    ''', params).fetchall()
+
+    page = rows[:limit]
+    results = []
+    for row in page:
+        record = dict(zip(RESULT_COLUMNS, row[1:]))
+        record['topic_tags'] = json.loads(record['topic_tags']) if record['topic_tags'] else []
+        record['is_free'] = bool(record['is_free'])
+        record['relevance'] = round(-row[0], 4)
+        results.append(record)
+
+    return {
+        'results': results,
+        'next_cursor': encode_cursor(page[-1][0], page[-1][1]) if len(rows) > limit else None
+    }
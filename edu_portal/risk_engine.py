@@ -0,0 +1,230 @@
+"""
+EduBoost Vectorized Risk Engine
+Column-oriented risk scoring for whole cohorts in one NumPy pass
+
+The rule tables below are the single definition of the threshold rules used by
+EnhancedEduBoostAI.calculate_module_risk and calculate_risk_score. Every rule
+chain is evaluated in the same order as the original if/elif code and weights
+are accumulated left to right, so scores are bit-identical to the scalar path.
+
+Inputs are mappings of field name -> array (any shape, e.g. N students x M
+modules); structured arrays and dicts of lists work as well.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+LEVEL_LOW = 0
+LEVEL_MEDIUM = 1
+LEVEL_HIGH = 2
+LEVEL_NAMES = ('low', 'medium', 'high')
+
+# Risk factor names in bitmask order (bit i <-> MODULE_RISK_FACTORS[i])
+MODULE_RISK_FACTORS = (
+    'Very Low Assessment Scores',
+    'Low Assessment Scores',
+    'Below Average Assessment Scores',
+    'Very Low GPA',
+    'Low GPA',
+    'Poor Attendance',
+    'Low Attendance',
+    'Poor Lab Completion',
+    'Low Participation',
+    'Frequent Late Submissions',
+    'Some Late Submissions',
+    'Multiple Submission Attempts',
+    'Very Low Engagement',
+    'Low Engagement',
+    'Previous Module Failure'
+)
+FACTOR_BITS = {name: bit for bit, name in enumerate(MODULE_RISK_FACTORS)}
+
+# Each chain is (field, tiers); tiers are (comparison, threshold, weight, factor)
+# and behave like an if/elif ladder: only the first matching tier applies.
+MODULE_RISK_RULES = (
+    # Academic performance factors
+    ('avg_assessment_score', (
+        ('<', 40, 0.3, 'Very Low Assessment Scores'),
+        ('<', 50, 0.2, 'Low Assessment Scores'),
+        ('<', 60, 0.1, 'Below Average Assessment Scores'))),
+    ('current_gpa', (
+        ('<', 2.0, 0.25, 'Very Low GPA'),
+        ('<', 2.5, 0.15, 'Low GPA'))),
+    # Behavioral factors
+    ('attendance_rate', (
+        ('<', 60, 0.2, 'Poor Attendance'),
+        ('<', 75, 0.1, 'Low Attendance'))),
+    ('lab_completion_rate', (
+        ('<', 50, 0.15, 'Poor Lab Completion'),)),
+    ('participation_score', (
+        ('<', 40, 0.1, 'Low Participation'),)),
+    # Submission patterns
+    ('assignments_late', (
+        ('>=', 3, 0.15, 'Frequent Late Submissions'),
+        ('>=', 1, 0.05, 'Some Late Submissions'))),
+    ('num_submission_attempts', (
+        ('>', 3, 0.1, 'Multiple Submission Attempts'),)),
+    # Engagement factors
+    ('login_frequency', (
+        ('<', 5, 0.15, 'Very Low Engagement'),
+        ('<', 10, 0.1, 'Low Engagement'))),
+    # Failed module history
+    ('failed_module', (
+        ('>', 0, 0.2, 'Previous Module Failure'),))
+)
+
+# Rules behind the stored per-module risk_score (calculate_risk_score)
+RISK_SCORE_RULES = (
+    # Academic factors (40% weight)
+    ('avg_assessment_score', (
+        ('<', 40, 0.25, None),
+        ('<', 50, 0.15, None),
+        ('<', 60, 0.10, None))),
+    ('current_gpa', (
+        ('<', 2.0, 0.15, None),
+        ('<', 2.5, 0.10, None))),
+    # Behavioral factors (35% weight)
+    ('attendance_rate', (
+        ('<', 60, 0.15, None),
+        ('<', 75, 0.10, None))),
+    ('lab_completion_rate', (
+        ('<', 50, 0.10, None),
+        ('<', 70, 0.05, None))),
+    ('participation_score', (
+        ('<', 40, 0.10, None),)),
+    # Submission patterns (15% weight)
+    ('assignments_late', (
+        ('>=', 3, 0.10, None),
+        ('>=', 1, 0.05, None))),
+    # Engagement (10% weight)
+    ('login_frequency', (
+        ('<', 5, 0.10, None),
+        ('<', 10, 0.05, None))),
+    # Failed module history (bonus factor)
+    ('failed_module', (
+        ('>', 0, 0.15, None),))
+)
+
+MODULE_RISK_FIELDS = tuple(field for field, _ in MODULE_RISK_RULES)
+RISK_SCORE_FIELDS = tuple(field for field, _ in RISK_SCORE_RULES)
+
+_COMPARISONS = {
+    '<': np.less,
+    '<=': np.less_equal,
+    '>': np.greater,
+    '>=': np.greater_equal
+}
+
+ModuleRiskResult = namedtuple('ModuleRiskResult', ['risk_scores', 'raw_scores', 'risk_levels', 'factor_masks'])
+CohortRiskResult = namedtuple('CohortRiskResult', ['modules', 'average_risk', 'overall_levels'])
+
+
+def _column(columns, field):
+    """Fetch one input column as a float64 array"""
+    return np.asarray(columns[field], dtype=np.float64)
+
+
+def _evaluate(columns, rules, with_factors):
+    """Run a rule table over the columns; returns (uncapped scores, factor masks)"""
+    values = {field: _column(columns, field) for field, _ in rules}
+    shape = np.broadcast_shapes(*(v.shape for v in values.values()))
+    scores = np.zeros(shape, dtype=np.float64)
+    masks = np.zeros(shape, dtype=np.uint16) if with_factors else None
+
+    for field, tiers in rules:
+        column = values[field]
+        conditions = []
+        weights = []
+        remaining = np.ones(shape, dtype=bool)
+        for comparison, threshold, weight, factor in tiers:
+            hit = remaining & _COMPARISONS[comparison](column, threshold)
+            remaining &= ~hit
+            conditions.append(hit)
+            weights.append(weight)
+            if with_factors and factor is not None:
+                masks |= np.where(hit, np.uint16(1 << FACTOR_BITS[factor]), np.uint16(0))
+
+        # Exactly one weight (or 0.0) per chain, added in rule order
+        scores += np.select(conditions, weights, default=0.0)
+
+    return scores, masks
+
+
+def risk_levels_from_scores(scores):
+    """Map risk scores to LEVEL_* codes using the > 0.6 / > 0.3 thresholds"""
+    scores = np.asarray(scores, dtype=np.float64)
+    return np.where(scores > 0.6, LEVEL_HIGH,
+                    np.where(scores > 0.3, LEVEL_MEDIUM, LEVEL_LOW)).astype(np.int8)
+
+
+def assess_module_risk(columns) -> ModuleRiskResult:
+    """Vectorized EnhancedEduBoostAI.calculate_module_risk.
+
+    Risk levels are taken from the uncapped score, the reported risk score is
+    capped at 1.0 -- exactly like the scalar implementation.
+    """
+    raw_scores, masks = _evaluate(columns, MODULE_RISK_RULES, with_factors=True)
+    return ModuleRiskResult(
+        risk_scores=np.minimum(raw_scores, 1.0),
+        raw_scores=raw_scores,
+        risk_levels=risk_levels_from_scores(raw_scores),
+        factor_masks=masks
+    )
+
+
+def calculate_risk_scores(columns):
+    """Vectorized calculate_risk_score: capped risk score for every element"""
+    scores, _ = _evaluate(columns, RISK_SCORE_RULES, with_factors=False)
+    return np.minimum(scores, 1.0)
+
+
+def assess_cohort(columns) -> CohortRiskResult:
+    """Score an N students x M modules cohort and aggregate per student.
+
+    The per-student average sums module scores left to right (not pairwise),
+    matching the running total in analyze_comprehensive_performance.
+    """
+    modules = assess_module_risk(columns)
+    scores = np.atleast_2d(modules.risk_scores)
+    module_count = scores.shape[-1]
+
+    total = np.zeros(scores.shape[:-1], dtype=np.float64)
+    for j in range(module_count):
+        total += scores[..., j]
+    average = total / module_count if module_count > 0 else total
+
+    return CohortRiskResult(
+        modules=modules,
+        average_risk=average,
+        overall_levels=risk_levels_from_scores(average)
+    )
+
+
+def decode_risk_factors(mask):
+    """Expand a factor bitmask into the list of factor names (in rule order)"""
+    mask = int(mask)
+    return [name for bit, name in enumerate(MODULE_RISK_FACTORS) if mask & (1 << bit)]
+
+
+def columns_from_records(records, fields=MODULE_RISK_FIELDS):
+    """Build a column mapping from a list of per-module dicts"""
+    return {field: np.array([record[field] for record in records], dtype=np.float64)
+            for field in fields}
+
+
+def module_risk_records(result: ModuleRiskResult):
+    """Convert a flat ModuleRiskResult into calculate_module_risk style dicts"""
+    # A row without risk factors scores int 0, like the scalar accumulator it replaces
+    return [
+        {
+            'risk_score': score or 0,
+            'risk_level': LEVEL_NAMES[level],
+            'risk_factors': decode_risk_factors(mask)
+        }
+        for score, level, mask in zip(
+            result.risk_scores.ravel().tolist(),
+            result.risk_levels.ravel().tolist(),
+            result.factor_masks.ravel().tolist()
+        )
+    ]
@@ -0,0 +1,110 @@
+"""
+EduBoost Production Server
+Runs app.py under gunicorn with pre-forked worker processes
+
+The application is created once in the master process (preload) and its
+services are warmed up: the database is migrated and seeded, the models
+are loaded and the heap is frozen before forking, so every worker shares
+those pages copy-on-write instead of loading its own copy. (The at-risk
+model artifact is memory-mapped, so even workers that reload it share one
+page-cache copy.)
+SQLite connections opened during preload are closed before the fork and
+each worker opens its own.
+
+Settings come from the command line or EDUBOOST_* environment variables:
+
+    EDUBOOST_BIND        address to listen on        (default 0.0.0.0:5000)
+    EDUBOOST_WORKERS     worker processes            (default 2 x CPUs + 1, at most 8)
+    EDUBOOST_THREADS     threads per worker          (default 4)
+    EDUBOOST_KEEPALIVE   keep-alive seconds          (default 5)
+    EDUBOOST_TIMEOUT     worker request timeout      (default 60)
+
+Usage:
+    python serve.py --workers 4 --threads 8
+"""
+
+import argparse
+import gc
+import os
+import sys
+
+DEFAULT_BIND = os.environ.get('EDUBOOST_BIND', '0.0.0.0:5000')
+DEFAULT_WORKERS = int(os.environ.get('EDUBOOST_WORKERS', min(2 * (os.cpu_count() or 1) + 1, 8)))
+DEFAULT_THREADS = int(os.environ.get('EDUBOOST_THREADS', 4))
+DEFAULT_KEEPALIVE = int(os.environ.get('EDUBOOST_KEEPALIVE', 5))
+DEFAULT_TIMEOUT = int(os.environ.get('EDUBOOST_TIMEOUT', 60))
+
+
+def preload():
+    """Import and warm up the application in the master process; returns the WSGI app"""
+    import app as eduboost
+
+    eduboost.services.warm_up()
+
+    # Connections must not cross fork(); workers open their own on first use
+    eduboost.get_db_pool().close()
+
+    # Move everything loaded so far out of the GC's reach, so collections in
+    # the workers do not touch (and un-share) those pages
+    gc.collect()
+    gc.freeze()
+    return eduboost.app
+
+
+def post_worker_init(worker):
+    """Start this worker's background job threads (threads do not survive fork)"""
+    import app as eduboost
+    eduboost.services.jobs.start()
+
+
+def build_options(args):
+    return {
+        'bind': args.bind,
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread' if args.threads > 1 else 'sync',
+        'keepalive': args.keepalive,
+        'timeout': args.timeout,
+        'preload_app': True,
+        'post_worker_init': post_worker_init,
+        'accesslog': '-' if args.access_log else None
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run EduBoost under gunicorn with preloaded workers')
+    parser.add_argument('--bind', default=DEFAULT_BIND, help='host:port to listen on')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Worker processes')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS, help='Threads per worker')
+    parser.add_argument('--keepalive', type=int, default=DEFAULT_KEEPALIVE, help='Keep-alive seconds')
+    parser.add_argument('--timeout', type=int, default=DEFAULT_TIMEOUT, help='Worker request timeout in seconds')
+    parser.add_argument('--access-log', action='store_true', help='Log every request to stdout')
+    args = parser.parse_args(argv)
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        print("❌ gunicorn is not installed. Install it with: pip install gunicorn")
+        return 1
+
+    class EduBoostApplication(BaseApplication):
+        def __init__(self, options):
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            return preload()
+
+    print(f"🚀 Serving EduBoost on http://{args.bind} "
+          f"({args.workers} workers x {args.threads} threads, keep-alive {args.keepalive}s)")
+    EduBoostApplication(build_options(args)).run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+EduBoost Startup Profile
+Per-module import cost and service start-up timings for a cold worker
+
+Every measurement runs in a fresh interpreter, like a newly forked or
+autoscaled worker:
+
+- `python -X importtime -c "import app"`, summarized per top-level package
+  (summed self time) and per module (cumulative time)
+- creating each lazy service after the import (database migration, AI
+  system, job queue) and warming up the registered models
+
+Optional heavy libraries that show up in the import profile are flagged,
+since nothing on the import path should need them.
+
+Usage:
+    python startup_profile.py
+    python startup_profile.py --top 25 --db eduboost.db
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from typing import Dict, Tuple
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Libraries only some code paths use; importing app must not load them
+HEAVY_OPTIONAL_PACKAGES = ('pandas', 'sklearn', 'xgboost', 'scipy', 'requests', 'urllib3', 'firebase_admin')
+
+SERVICE_TIMING_CODE = '''
+import json, sys, time
+started = time.perf_counter()
+import app
+timings = {'import app': time.perf_counter() - started}
+services = app.create_app({'DATABASE_PATH': sys.argv[1]}).extensions['eduboost']
+for name, start in (
+    ('database (migrations)', lambda: services.db_pool),
+    ('AI system (resource seeding)', lambda: services.ai),
+    ('job queue', lambda: services.jobs),
+    ('model warm-up', app.model_registry.warm_up),
+):
+    started = time.perf_counter()
+    start()
+    timings[name] = time.perf_counter() - started
+print(json.dumps({name: seconds * 1000 for name, seconds in timings.items()}))
+'''
+
+
+def import_profile(module='app') -> Dict[str, Tuple[float, float]]:
+    """Per-module (self_ms, cumulative_ms) for one `import module` in a fresh interpreter"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=APP_DIR, capture_output=True, text=True, check=True
+    )
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        profile.setdefault(name.strip(), (int(self_us) / 1000, int(cumulative_us) / 1000))
+    return profile
+
+
+def package_costs(profile) -> Dict[str, float]:
+    """Import time per top-level package: the sum of its modules' self times"""
+    costs = defaultdict(float)
+    for name, (self_ms, _) in profile.items():
+        costs[name.split('.')[0]] += self_ms
+    return dict(costs)
+
+
+def heavy_imports(profile):
+    """Optional heavy packages that the profiled import loaded"""
+    return sorted({name.split('.')[0] for name in profile} & set(HEAVY_OPTIONAL_PACKAGES))
+
+
+def service_timings(db_path=None) -> Dict[str, float]:
+    """Milliseconds to import app and start each lazy service (temporary database by default)"""
+    if db_path is None:
+        db_path = os.path.join(tempfile.mkdtemp(prefix='eduboost_startup_'), 'eduboost.db')
+    result = subprocess.run(
+        [sys.executable, '-c', SERVICE_TIMING_CODE, os.path.abspath(db_path)],
+        cwd=APP_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Profile the cold start of the EduBoost app')
+    parser.add_argument('--module', default='app', help='Module to import')
+    parser.add_argument('--top', type=int, default=15, help='Rows per table')
+    parser.add_argument('--db', help='Database for the service timings (default: a fresh temporary one)')
+    parser.add_argument('--json', action='store_true', help='Print the raw profile as JSON')
+    args = parser.parse_args(argv)
+
+    profile = import_profile(args.module)
+    packages = package_costs(profile)
+    services = service_timings(args.db) if args.module == 'app' else {}
+
+    if args.json:
+        print(json.dumps({'modules': profile, 'packages': packages, 'services': services}, indent=2))
+        return 0
+
+    print("=" * 60)
+    print(f"EduBoost Startup Profile (import {args.module})")
+    print("=" * 60)
+    print(f"⏱️ Total import time: {profile[args.module][1]:.1f} ms")
+
+    print("\n📦 Import cost by package (ms, self time summed):")
+    for name, cost in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"   {cost:8.1f}  {name}")
+
+    print("\n🐢 Slowest modules (ms, cumulative):")
+    slowest = sorted(((name, times) for name, times in profile.items() if name != args.module),
+                     key=lambda item: -item[1][1])
+    for name, (self_ms, cumulative_ms) in slowest[:args.top]:
+        print(f"   {cumulative_ms:8.1f}  {name}")
+
+    if services:
+        print("\n⚙️ Service start-up after import (ms):")
+        for name, elapsed_ms in services.items():
+            print(f"   {elapsed_ms:8.1f}  {name}")
+
+    heavy = heavy_imports(profile)
+    print()
+    if heavy:
+        print(f"⚠️ Optional heavy packages loaded at import: {', '.join(heavy)}")
+    else:
+        print("✅ No optional heavy packages loaded at import")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
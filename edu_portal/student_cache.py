@@ -0,0 +1,158 @@
+"""
+EduBoost Student Computation Cache
+Bounded TTL + LRU cache for per-student performance/goals/planner results
+
+Entries are keyed by (kind, student_id, data_version). The caller reads
+the student's data version from the database (goal_store.data_version)
+before computing, and every write that changes a student's results bumps
+it in the same transaction -- so a write handled by one worker process is
+seen by all of them on their next lookup, not when the TTL runs out.
+invalidate() only frees this process's now unreachable entries early.
+
+The cache is capped both by entry count and by an estimate of the memory
+held by the cached values; the least recently used entries are evicted
+first when either limit is reached.
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict
+
+DEFAULT_TTL_SECONDS = float(os.environ.get('EDUBOOST_CACHE_TTL', 300))
+DEFAULT_MAX_ENTRIES = int(os.environ.get('EDUBOOST_CACHE_MAX_ENTRIES', 5000))
+DEFAULT_MAX_BYTES = int(os.environ.get('EDUBOOST_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+
+
+def estimate_size(value, _seen=None) -> int:
+    """Approximate deep size in bytes of JSON-like values (dicts, lists, scalars)"""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    return size
+
+
+class StudentCache:
+    """Thread-safe TTL + LRU cache with per-student invalidation"""
+
+    def __init__(self, ttl=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES,
+                 max_bytes=DEFAULT_MAX_BYTES, sizer: Callable = estimate_size):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizer = sizer
+
+        self._entries = OrderedDict()      # key -> (expires_at, size, value)
+        self._student_keys = {}            # student_id -> set of keys
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+            'oversized': 0
+        }
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        keys = self._student_keys.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._student_keys[key[1]]
+
+    def get(self, kind, student_id, version=0, default=None):
+        """Return the value cached for this data version, or `default` on miss/expiry"""
+        with self._lock:
+            key = (kind, student_id, version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats['misses'] += 1
+                return default
+
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry[2]
+
+    def set(self, kind, student_id, value, version=0):
+        """Store a value computed from the data at `version`, replacing other versions of it"""
+        size = self.sizer(value)
+        with self._lock:
+            if size > self.max_bytes:
+                self._stats['oversized'] += 1
+                return
+
+            key = (kind, student_id, version)
+            for old_key in [k for k in self._student_keys.get(student_id, ()) if k[0] == kind]:
+                self._remove(old_key)
+
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._student_keys.setdefault(student_id, set()).add(key)
+            self._bytes += size
+
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats['evictions'] += 1
+
+    def get_or_compute(self, kind, student_id, compute: Callable, version=0):
+        """Return the cached value or compute, cache and return it.
+
+        `version` must be read before computing, so a write that lands while
+        computing leaves the result under a version nobody asks for again.
+        """
+        sentinel = object()
+        value = self.get(kind, student_id, version, sentinel)
+        if value is not sentinel:
+            return value
+
+        value = compute()
+        self.set(kind, student_id, value, version=version)
+        return value
+
+    def invalidate(self, student_id):
+        """Drop every cached entry for a student (they are unreachable once the data version moved)"""
+        with self._lock:
+            for key in list(self._student_keys.get(student_id, ())):
+                self._remove(key)
+            self._stats['invalidations'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._student_keys.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['hits'] + stats['misses']
+            stats.update({
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl,
+                'hit_rate': round(stats['hits'] / lookups, 4) if lookups else 0.0
+            })
+        return stats
+
@@ -0,0 +1,323 @@
+"""
+EduBoost Synthetic Cohort Generator
+Reproducible, vectorized synthetic student performance data
+
+Every student gets a private numpy.random.Generator stream whose PCG64
+state is taken from a BLAKE2b digest of the student id, so the same id
+always yields the same profile -- across processes, machines and threads,
+and regardless of which other students are generated in the same call.
+Each student's raw draws are taken in one shot; all the shaping into the
+14 performance fields happens on (N students x M modules) arrays.
+
+generate_accuracy_samples() builds the labelled feature sets used by the
+accuracy scripts the same way: every feature is one batched Generator call
+and the ground-truth rules are np.select/np.where over whole columns, so
+millions of rows take seconds.
+
+Usage:
+    python synthetic_cohort.py 100000 --output cohort.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+import risk_engine
+
+MODULES = (
+    "Introduction to Computer Science",
+    "Mathematics for Computing",
+    "Programming Fundamentals",
+    "Object Oriented Programming",
+    "Computer Networks",
+    "Operating System",
+    "Introduction to Machine Learning",
+    "Web Development",
+    "Electronics and Computer System Architecture",
+    "Database Management"
+)
+SEMESTERS = ('Fall2024', 'Spring2025', 'Summer2025')
+
+# Draws per student: one profile draw plus a fixed number per module
+_PROFILE_NORMALS = 1        # base ability
+_MODULE_NORMALS = 5         # score, attendance, lab, participation, login noise
+_PROFILE_UNIFORMS = 1       # semester
+_MODULE_UNIFORMS = 4        # difficulty, late, attempts, failed module
+
+# Poisson CDF tables used for inverse-transform sampling; 40 covers these means
+_POISSON_SUPPORT = np.arange(40)
+
+
+def _poisson_cdf(lam):
+    pmf = np.exp(-lam) * np.cumprod(np.concatenate(([1.0], lam / _POISSON_SUPPORT[1:])))
+    return np.cumsum(pmf)
+
+
+_POISSON_CDFS = {lam: _poisson_cdf(lam) for lam in (3.0, 2.5, 0.8, 1.2)}
+
+
+def _poisson(uniforms, lam):
+    return np.searchsorted(_POISSON_CDFS[lam], uniforms, side='right')
+
+
+def student_seed(student_id) -> bytes:
+    """Stable 32-byte digest of a student id (independent of PYTHONHASHSEED)"""
+    return hashlib.blake2b(str(student_id).encode('utf-8'), digest_size=32).digest()
+
+
+def _seed_generator(bit_generator, student_id):
+    digest = student_seed(student_id)
+    bit_generator.state = {
+        'bit_generator': 'PCG64',
+        'state': {
+            'state': int.from_bytes(digest[:16], 'little'),
+            'inc': int.from_bytes(digest[16:], 'little') | 1
+        },
+        'has_uint32': 0,
+        'uinteger': 0
+    }
+
+
+def generate_cohort(student_ids: Sequence, modules: Sequence[str] = MODULES) -> Dict[str, np.ndarray]:
+    """Generate performance columns for N students x M modules.
+
+    Returns a dict with 'student_id' and 'semester' arrays of shape (N,),
+    'module_name' of shape (M,) and every numeric field as an (N, M) array.
+    """
+    student_ids = list(student_ids)
+    n, m = len(student_ids), len(modules)
+    normal_count = _PROFILE_NORMALS + _MODULE_NORMALS * m
+    uniform_count = _PROFILE_UNIFORMS + _MODULE_UNIFORMS * m
+
+    normals = np.empty((n, normal_count))
+    uniforms = np.empty((n, uniform_count))
+
+    # One generator per call (never shared between threads), re-seeded per student
+    bit_generator = np.random.PCG64()
+    generator = np.random.Generator(bit_generator)
+    for i, student_id in enumerate(student_ids):
+        _seed_generator(bit_generator, student_id)
+        generator.standard_normal(out=normals[i])
+        generator.random(out=uniforms[i])
+
+    # Generate base student profile
+    base_ability = normals[:, 0]
+    noise = normals[:, 1:].reshape(n, _MODULE_NORMALS, m)
+    draws = uniforms[:, 1:].reshape(n, _MODULE_UNIFORMS, m)
+    ability = base_ability[:, None]
+
+    current_gpa = np.clip(2.5 + ability * 0.8, 0.0, 4.0) * np.ones((1, m))
+    semester_index = np.minimum((uniforms[:, 0] * len(SEMESTERS)).astype(np.int64), len(SEMESTERS) - 1)
+
+    # Module-specific difficulty
+    module_difficulty = 2.0 + 2.5 * draws[:, 0]
+
+    # Correlated performance metrics
+    base_score = np.clip(60 + ability * 20 + noise[:, 0] * 15, 0, 100)
+    avg_assessment_score = np.floor(base_score).astype(np.int64)
+
+    # Behavioral metrics correlated with performance
+    attendance_rate = np.clip(base_score + 10 + noise[:, 1] * 15, 30, 100)
+    lab_completion_rate = np.clip(base_score + 5 + noise[:, 2] * 20, 0, 100)
+    participation_score = np.clip(base_score - 5 + noise[:, 3] * 15, 0, 100)
+
+    # Submission patterns (struggling students submit late and retry more)
+    struggling = base_score < 50
+    assignments_late = np.where(struggling, _poisson(draws[:, 1], 3.0), _poisson(draws[:, 1], 0.8))
+    num_submission_attempts = np.where(struggling, _poisson(draws[:, 2], 2.5), _poisson(draws[:, 2], 1.2)) + 1
+
+    # Engagement metrics
+    login_frequency = np.maximum(1, np.trunc(10 + ability * 8 + noise[:, 4] * 5)).astype(np.int64)
+
+    # Risk indicators
+    failed_module = ((base_score < 40) & (draws[:, 3] < 0.7)).astype(np.int64)
+
+    risk_score = risk_engine.calculate_risk_scores({
+        'avg_assessment_score': avg_assessment_score,
+        'current_gpa': current_gpa,
+        'attendance_rate': attendance_rate,
+        'lab_completion_rate': lab_completion_rate,
+        'assignments_late': assignments_late,
+        'participation_score': participation_score,
+        'login_frequency': login_frequency,
+        'failed_module': failed_module
+    })
+
+    return {
+        'student_id': np.array(student_ids, dtype=object),
+        'semester': np.array(SEMESTERS, dtype=object)[semester_index],
+        'module_name': np.array(modules, dtype=object),
+        'module_difficulty': np.round(module_difficulty, 2),
+        'current_gpa': np.round(current_gpa, 2),
+        'avg_assessment_score': avg_assessment_score,
+        'assignments_late': np.minimum(assignments_late, 10),
+        'num_submission_attempts': np.minimum(num_submission_attempts, 8),
+        'login_frequency': login_frequency,
+        'attendance_rate': np.round(attendance_rate, 2),
+        'lab_completion_rate': np.round(lab_completion_rate, 2),
+        'participation_score': participation_score.astype(np.int64),
+        'failed_module': failed_module,
+        'risk_score': np.round(risk_score, 3)
+    }
+
+
+NUMERIC_FIELDS = (
+    'module_difficulty', 'current_gpa', 'avg_assessment_score', 'assignments_late',
+    'num_submission_attempts', 'login_frequency', 'attendance_rate', 'lab_completion_rate',
+    'participation_score', 'failed_module'
+)
+RECORD_FIELDS = ('student_id', 'module_name') + NUMERIC_FIELDS + ('semester', 'risk_score')
+
+
+def iter_records(cohort: Dict[str, np.ndarray]):
+    """Yield one performance dict per (student, module), in the app's field order"""
+    modules = cohort['module_name'].tolist()
+    numeric = {field: cohort[field].tolist() for field in NUMERIC_FIELDS + ('risk_score',)}
+    for i, (student_id, semester) in enumerate(zip(cohort['student_id'].tolist(), cohort['semester'].tolist())):
+        for j, module in enumerate(modules):
+            record = {'student_id': student_id, 'module_name': module}
+            for field in NUMERIC_FIELDS:
+                record[field] = numeric[field][i][j]
+            record['semester'] = semester
+            record['risk_score'] = numeric['risk_score'][i][j]
+            yield record
+
+
+def generate_student_records(student_id, modules: Sequence[str] = MODULES) -> List[Dict]:
+    """Performance records for one student (the N=1 case of generate_cohort)"""
+    return list(iter_records(generate_cohort([student_id], modules)))
+
+
+def write_csv(cohort: Dict[str, np.ndarray], output):
+    """Write a cohort as CSV accepted by performance_ingest.py"""
+    writer = csv.writer(output)
+    writer.writerow(RECORD_FIELDS)
+    for record in iter_records(cohort):
+        writer.writerow([record[field] for field in RECORD_FIELDS])
+
+
+# Feature columns of the accuracy test sets, in model input order
+ACCURACY_FEATURES = (
+    'Module_Difficulty', 'Current_GPA', 'Avg_Assessment_Score', 'Assignments_Late',
+    'Num_Submission_Attempts', 'Login_Frequency'
+)
+
+# 'basic': test_accuracy.py, 'enhanced': enhanced_accuracy_test.py (attempts
+# start at 1), 'realistic': final_accuracy_analysis.py (latent ability model)
+ACCURACY_PROFILES = ('basic', 'enhanced', 'realistic')
+
+# Students whose summed risk points reach this are labelled at risk
+AT_RISK_THRESHOLD = 4
+
+
+def _points(conditions, points):
+    """Risk points of the first matching if/elif branch, 0 when none matches"""
+    return np.select(conditions, points, default=0)
+
+
+def _grade_profile(rng, n):
+    """GPA-driven features: behaviour switches on GPA bands"""
+    current_gpa = np.clip(rng.normal(3.0, 0.8, n), 0.0, 4.0)
+    avg_assessment = np.clip(current_gpa * 20 + rng.normal(10, 15, n), 0, 100)
+    assignments_late = rng.poisson(np.where(current_gpa < 2.5, 2.0, 0.5))
+    login_frequency = rng.poisson(np.where(current_gpa > 3.0, 15.0, 8.0))
+    module_difficulty = rng.uniform(1, 5, n)
+    submission_attempts = rng.poisson(1.5, n)
+
+    risk_score = (
+        _points([current_gpa < 2.0, current_gpa < 2.5, current_gpa < 3.0], [3, 2, 1])
+        + _points([avg_assessment < 50, avg_assessment < 60, avg_assessment < 70], [3, 2, 1])
+        + _points([assignments_late >= 4, assignments_late >= 2], [2, 1])
+        + _points([login_frequency < 5, login_frequency < 10], [2, 1])
+    )
+    features = {
+        'Module_Difficulty': module_difficulty,
+        'Current_GPA': current_gpa,
+        'Avg_Assessment_Score': avg_assessment,
+        'Assignments_Late': assignments_late,
+        'Num_Submission_Attempts': submission_attempts,
+        'Login_Frequency': login_frequency
+    }
+    return features, risk_score
+
+
+def _ability_profile(rng, n):
+    """Features driven by a latent academic ability, with a difficulty interaction"""
+    base_ability = rng.standard_normal(n)
+    current_gpa = np.clip(2.5 + base_ability * 0.8 + rng.normal(0, 0.3, n), 0.0, 4.0)
+    avg_assessment = np.clip(current_gpa * 20 + rng.normal(0, 12, n), 0, 100)
+
+    stress_level = np.maximum(0, -base_ability + rng.normal(0, 0.5, n))
+    assignments_late = np.minimum(rng.poisson(stress_level * 2 + 0.5), 10)
+    login_frequency = np.clip(np.trunc(15 + base_ability * 5 + rng.normal(0, 3, n)), 1, 50).astype(np.int64)
+
+    module_difficulty = rng.uniform(1, 5, n)
+    submission_attempts = rng.poisson(1.2, n) + 1
+
+    factors = np.stack([
+        _points([current_gpa < 2.0, current_gpa < 2.5, current_gpa < 3.0], [4, 3, 1]),
+        _points([avg_assessment < 40, avg_assessment < 50, avg_assessment < 60, avg_assessment < 70], [4, 3, 2, 1]),
+        _points([assignments_late >= 5, assignments_late >= 3, assignments_late >= 1], [3, 2, 1]),
+        _points([login_frequency < 5, login_frequency < 10, login_frequency < 15], [3, 2, 1]),
+        np.where((module_difficulty > 4) & (current_gpa < 3.0), 2, 0)
+    ])
+    risk_score = factors.sum(axis=0)
+    features = {
+        'Module_Difficulty': module_difficulty,
+        'Current_GPA': current_gpa,
+        'Avg_Assessment_Score': avg_assessment,
+        'Assignments_Late': assignments_late,
+        'Num_Submission_Attempts': submission_attempts,
+        'Login_Frequency': login_frequency,
+        'Risk_Score': risk_score,
+        'Risk_Factors': np.count_nonzero(factors, axis=0)
+    }
+    return features, risk_score
+
+
+def generate_accuracy_samples(n_samples, profile='basic', seed=42) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """Labelled synthetic students for accuracy evaluation.
+
+    Returns (columns, labels): a dict of (n_samples,) feature arrays keyed by
+    column name (ACCURACY_FEATURES first; pass it to pandas.DataFrame) and an
+    int8 array of ground-truth labels (1 = at risk).
+    """
+    if profile not in ACCURACY_PROFILES:
+        raise ValueError(f"profile must be one of {', '.join(ACCURACY_PROFILES)}")
+
+    rng = np.random.default_rng(seed)
+    if profile == 'realistic':
+        features, risk_score = _ability_profile(rng, n_samples)
+    else:
+        features, risk_score = _grade_profile(rng, n_samples)
+        if profile == 'enhanced':
+            features['Num_Submission_Attempts'] += 1
+
+    labels = (risk_score >= AT_RISK_THRESHOLD).astype(np.int8)
+    return features, labels
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate a reproducible synthetic cohort as CSV')
+    parser.add_argument('students', type=int, help='Number of students')
+    parser.add_argument('--prefix', default='STU', help='Student id prefix')
+    parser.add_argument('--output', default='-', help="Output CSV path ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    student_ids = [f'{args.prefix}{i:06d}' for i in range(args.students)]
+    cohort = generate_cohort(student_ids)
+
+    if args.output == '-':
+        write_csv(cohort, sys.stdout)
+    else:
+        with open(args.output, 'w', newline='') as f:
+            write_csv(cohort, f)
+        print(f"✅ Wrote {args.students:,} students x {len(MODULES)} modules to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,19 +3,17 @@ EduBoost Model Accuracy Test
 Test the accuracy of the EduBoost model with sample data
 """
 
-import pickle
 import pandas as pd
 import numpy as np
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+import model_artifact
+from synthetic_cohort import generate_accuracy_samples
 import os
-import random
 
 def load_model():
     """Load the EduBoost model"""
     try:
-        model_path = os.path.join('model', 'eduboost_ultra_accuracy_model.pkl')
-        with open(model_path, 'rb') as f:
-            model = pickle.load(f)
+        model = model_artifact.load_model(os.path.join('model', 'eduboost_ultra_accuracy_model.pkl'))
         print("✅ Model loaded successfully")
         return model
     except Exception as e:
@@ -24,63 +22,8 @@ def load_model():
 
 def generate_test_data(n_samples=1000):
     """Generate realistic test data"""
-    np.random.seed(42)  # For reproducible results
-    
-    data = []
-    labels = []
-    
-    for i in range(n_samples):
-        # Generate correlated features that make educational sense
-        
-        # Basic academic performance
-        current_gpa = np.random.normal(3.0, 0.8)
-        current_gpa = np.clip(current_gpa, 0.0, 4.0)
-        
-        # Assessment scores correlated with GPA
-        avg_assessment = current_gpa * 20 + np.random.normal(10, 15)
-        avg_assessment = np.clip(avg_assessment, 0, 100)
-        
-        # Behavioral indicators
-        assignments_late = np.random.poisson(2) if current_gpa < 2.5 else np.random.poisson(0.5)
-        login_frequency = np.random.poisson(15) if current_gpa > 3.0 else np.random.poisson(8)
-        
-        # Other features
-        module_difficulty = np.random.uniform(1, 5)
-        submission_attempts = np.random.poisson(1.5)
-        
-        # Create ground truth based on realistic academic risk factors
-        risk_score = 0
-        if current_gpa < 2.0: risk_score += 3
-        elif current_gpa < 2.5: risk_score += 2
-        elif current_gpa < 3.0: risk_score += 1
-        
-        if avg_assessment < 50: risk_score += 3
-        elif avg_assessment < 60: risk_score += 2
-        elif avg_assessment < 70: risk_score += 1
-        
-        if assignments_late >= 4: risk_score += 2
-        elif assignments_late >= 2: risk_score += 1
-        
-        if login_frequency < 5: risk_score += 2
-        elif login_frequency < 10: risk_score += 1
-        
-        # Convert to binary classification
-        at_risk = 1 if risk_score >= 4 else 0
-        
-        # Store the data
-        sample = {
-            'Module_Difficulty': module_difficulty,
-            'Current_GPA': current_gpa,
-            'Avg_Assessment_Score': avg_assessment,
-            'Assignments_Late': assignments_late,
-            'Num_Submission_Attempts': submission_attempts,
-            'Login_Frequency': login_frequency
-        }
-        
-        data.append(sample)
-        labels.append(at_risk)
-    
-    return pd.DataFrame(data), np.array(labels)
+    features, labels = generate_accuracy_samples(n_samples, 'basic', seed=42)  # Reproducible results
+    return pd.DataFrame(features), labels
 
 def rule_based_predictions(df):
     """Generate predictions using rule-based system"""
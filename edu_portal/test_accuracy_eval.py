@@ -0,0 +1,91 @@
+"""
+EduBoost Sharded Accuracy Evaluation Checks
+Merged shard counts must not depend on the number of workers
+
+Also pins the vectorized rule-based system against hand-scored students.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+import numpy as np
+
+import accuracy_eval
+from migrations import apply_migrations
+from synthetic_cohort import MODULES
+
+SETTINGS = {'source': 'synthetic', 'scorer': 'rules', 'profile': 'realistic', 'seed': 7,
+            'bins': 10, 'modules': list(MODULES)}
+
+# (difficulty, gpa, assessment, late, attempts, logins) -> rule points
+STUDENTS = (
+    ((4.5, 2.7, 65, 3, 4, 10), 1.0 + 1.0 + 1.5 + 1.0 + 1.5 + 0.5),
+    ((2.0, 2.4, 49, 2, 1, 18), 2.5 + 3.0 + 1.5),
+    ((3.0, 3.5, 90, 0, 2, 25), 0.0)
+)
+
+
+def test_rule_points_match_hand_scores():
+    columns = {name: np.array([student[i] for student, _ in STUDENTS])
+               for i, name in enumerate(accuracy_eval.feature_transform.BASE_FEATURES)}
+    predictions, confidence = accuracy_eval.rule_based_predictions(columns)
+    points = np.array([points for _, points in STUDENTS])
+    assert np.allclose(confidence, np.minimum(points / 6, 1))
+    assert predictions.tolist() == (points >= 3).astype(int).tolist()
+
+
+def test_sharding_does_not_change_results():
+    inline = accuracy_eval.evaluate(SETTINGS, rows=30_000, shard_rows=7_000, workers=1)
+    pooled = accuracy_eval.evaluate(SETTINGS, rows=30_000, shard_rows=7_000, workers=2)
+    assert inline['samples'] == pooled['samples'] == 30_000 and inline['shards'] == 5
+    for key in ('confusion_matrix', 'modules', 'calibration'):
+        assert inline[key] == pooled[key], f"{key} differs between 1 and 2 workers"
+    assert sum(row['samples'] for row in inline['calibration']) == 30_000
+    assert set(inline['timings_seconds']['worker_total']) == {'load', 'score', 'reduce'}
+
+
+def test_database_source_skips_unusable_rows():
+    db_path = os.path.join(tempfile.mkdtemp(prefix='eduboost_accuracy_'), 'eduboost.db')
+    conn = sqlite3.connect(db_path)
+    apply_migrations(conn)
+    rows = [(f'S{i}', module, *features, label)
+            for i, ((features, _), module, label) in enumerate(zip(
+                STUDENTS, ('Web Development', 'Computer Networks', 'Web Development'), (1, 0, 0)))]
+    rows += [('S7', 'Web Development', 3.0, None, 55, 1, 2, 10, 1),   # NULL feature: skipped
+             ('S8', 'Computer Networks', 3.0, 2.0, 55, 1, 2, 10, None)]  # no outcome: not evaluable
+    with conn:
+        conn.executemany(f'''
+            INSERT INTO student_performance (student_id, module_name, {', '.join(accuracy_eval.PERFORMANCE_COLUMNS)},
+                                             failed_module)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+    conn.close()
+
+    settings = dict(SETTINGS, source='database', db_path=db_path,
+                    modules=accuracy_eval.database_modules(db_path))
+    results = accuracy_eval.evaluate(settings, shard_rows=2, workers=1)
+    assert results['samples'] == 3 and results['skipped_rows'] == 1, results
+    assert results['confusion_matrix'] == [[1, 1], [0, 1]]
+    assert results['modules']['Computer Networks']['confusion_matrix'] == [[0, 1], [0, 0]]
+    assert sum(row['samples'] for row in results['calibration']) == 3
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Sharded Accuracy Evaluation Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_rule_points_match_hand_scores, test_sharding_does_not_change_results,
+                 test_database_source_skips_unusable_rows):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
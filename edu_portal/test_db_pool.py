@@ -0,0 +1,92 @@
+"""
+EduBoost Connection Pool Checks
+Transaction nesting and connection reuse in db_pool.ConnectionPool
+
+A transaction opened inside another must never commit or roll back the
+outer one; it runs as a SAVEPOINT instead.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+from db_pool import ConnectionPool
+
+
+def make_pool():
+    pool = ConnectionPool(os.path.join(tempfile.mkdtemp(prefix='eduboost_pool_'), 'pool.db'))
+    with pool.connection() as conn:
+        conn.execute('CREATE TABLE items (name TEXT PRIMARY KEY)')
+    return pool
+
+
+def committed_names(pool):
+    """Rows visible to a separate connection, i.e. actually committed"""
+    conn = sqlite3.connect(pool.db_path)
+    try:
+        return sorted(row[0] for row in conn.execute('SELECT name FROM items'))
+    finally:
+        conn.close()
+
+
+def test_inner_success_commits_with_outer():
+    pool = make_pool()
+    with pool.transaction() as cursor:
+        cursor.execute("INSERT INTO items VALUES ('outer')")
+        with pool.transaction() as inner:
+            inner.execute("INSERT INTO items VALUES ('inner')")
+        assert committed_names(pool) == [], "inner block committed the outer transaction"
+    assert committed_names(pool) == ['inner', 'outer']
+
+
+def test_inner_failure_rolls_back_only_inner():
+    pool = make_pool()
+    with pool.transaction() as cursor:
+        cursor.execute("INSERT INTO items VALUES ('outer')")
+        try:
+            with pool.transaction() as inner:
+                inner.execute("INSERT INTO items VALUES ('inner')")
+                inner.execute("INSERT INTO items VALUES ('outer')")  # duplicate key
+        except sqlite3.IntegrityError:
+            pass
+        cursor.execute("INSERT INTO items VALUES ('after')")
+    assert committed_names(pool) == ['after', 'outer']
+
+
+def test_outer_failure_discards_inner_work():
+    pool = make_pool()
+    try:
+        with pool.transaction(immediate=True) as cursor:
+            with pool.transaction() as inner:
+                inner.execute("INSERT INTO items VALUES ('inner')")
+            cursor.execute("INSERT INTO items VALUES ('outer')")
+            raise RuntimeError('abort')
+    except RuntimeError:
+        pass
+    assert committed_names(pool) == []
+
+    # The pool is usable again afterwards
+    with pool.transaction() as cursor:
+        cursor.execute("INSERT INTO items VALUES ('next')")
+    assert committed_names(pool) == ['next']
+    assert pool.stats()['open_connections'] == 1
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Connection Pool Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_inner_success_commits_with_outer, test_inner_failure_rolls_back_only_inner,
+                 test_outer_failure_discards_inner_work):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,344 @@
+"""
+EduBoost Endpoint Checks
+Request/response contracts of app.py through Flask's test client
+
+Every check runs against its own migrated database in a temp directory,
+so eduboost.db is never touched.
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+
+import app as eduboost
+import feature_transform
+import feedback_ingest
+import performance_ingest
+from inference_service import InferenceService
+
+PREDICT_ROW = {
+    "Module_Difficulty": 3,
+    "Current_GPA": 2.8,
+    "Avg_Assessment_Score": 62,
+    "Assignments_Late": 1,
+    "Num_Submission_Attempts": 2,
+    "Login_Frequency": 12
+}
+
+PERFORMANCE_RECORD = {
+    "student_id": "S1", "module_name": "Bulk Module", "semester": "2024-S1",
+    "module_difficulty": 3, "current_gpa": 1.2, "attendance_rate": 70, "lab_completion_rate": 60,
+    "avg_assessment_score": 45, "assignments_late": 2, "num_submission_attempts": 3,
+    "login_frequency": 8, "participation_score": 50, "failed_module": 1
+}
+
+
+def make_client(**config):
+    """Test client of a fresh app on an empty temporary database"""
+    directory = tempfile.mkdtemp(prefix='eduboost_endpoints_')
+    flask_app = eduboost.create_app(dict(config, DATABASE_PATH=os.path.join(directory, 'eduboost.db')))
+    return flask_app.test_client()
+
+
+def test_predict_rejects_null_inputs():
+    client = make_client()
+    single = client.post('/predict', json=dict(PREDICT_ROW, Current_GPA=None))
+    assert single.status_code == 400, single.get_data(as_text=True)
+
+    batch = dict(PREDICT_ROW, Avg_Assessment_Score=[62, None, 70])
+    for path in ('/predict/batch', '/predict/batch?stream=1'):
+        response = client.post(path, json=batch)
+        assert response.status_code == 400, f"{path}: {response.status_code}"
+        assert 'Avg_Assessment_Score' in response.get_json()['error']
+
+
+def test_predict_batch_stream_is_valid_ndjson():
+    client = make_client()
+    batch = dict(PREDICT_ROW, Current_GPA=[1.5, 2.8, 3.9])
+    response = client.post('/predict/batch?stream=1', json=batch)
+    assert response.status_code == 200
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row['index'] for row in rows] == [0, 1, 2]
+    assert rows == client.post('/predict/batch', json=batch).get_json()['results']
+
+FEEDBACK_RECORD = {
+    "student_id": "S1", "module_name": "Web Development", "lecturer_id": "prof_smith",
+    "feedback_text": "Needs more practice with CSS layout", "urgency_level": 4
+}
+
+
+def ndjson_records(count, **fields):
+    return ''.join(json.dumps(dict(PERFORMANCE_RECORD, semester=f"S{i}", **fields)) + '\n'
+                   for i in range(count)).encode()
+
+
+def test_bulk_format_error_reports_committed_rows():
+    client = make_client()
+    before = client.get('/api/students/S1/performance').get_json()
+    assert 'Bulk Module' not in [m['module_name'] for m in before['performance_data']]
+
+    # The first batch commits before the malformed third line is read
+    body = ndjson_records(2) + b'{"student_id": "S1", broken\n' + ndjson_records(1)
+    response = client.post('/api/performance/bulk?format=ndjson&batch_size=2', data=body)
+    assert response.status_code == 400
+    result = response.get_json()
+    assert result['rows_written'] == 2 and result['batches'] == 1 and result['students'] == 1, result
+    assert 'student_ids' not in result
+
+    # The cached synthetic analysis of S1 must not outlive the committed rows
+    after = client.get('/api/students/S1/performance').get_json()
+    assert [m['module_name'] for m in after['performance_data']] == ['Bulk Module']
+
+
+def test_bulk_invalid_utf8_is_a_format_error():
+    client = make_client()
+    # Enough valid rows to span several decoder reads before the bad bytes
+    body = ndjson_records(400, student_id='S2') + b'\xff\xfe\n'
+    response = client.post('/api/performance/bulk?format=ndjson&batch_size=50', data=body)
+    assert response.status_code == 400, response.status_code
+    result = response.get_json()
+    assert 'UTF-8' in result['error']
+    assert 0 < result['rows_written'] < 400 and result['rows_written'] % 50 == 0, result
+
+
+def test_bulk_batch_size_and_body_are_capped():
+    client = make_client()
+    max_batch_size, max_bytes = performance_ingest.MAX_BATCH_SIZE, performance_ingest.MAX_BULK_BYTES
+    try:
+        performance_ingest.MAX_BATCH_SIZE = 3
+        response = client.post('/api/performance/bulk?format=ndjson&batch_size=100000000', data=ndjson_records(7))
+        assert response.get_json()['batches'] == 3, response.get_json()
+
+        # A declared length over the cap is refused before anything is read
+        performance_ingest.MAX_BULK_BYTES = 1000
+        response = client.post('/api/performance/bulk?format=ndjson', data=ndjson_records(7, student_id='S5'))
+        assert response.status_code == 413
+        assert client.get('/api/students/S5/performance').get_json()['performance_data'][0]['module_name'] != 'Bulk Module'
+    finally:
+        performance_ingest.MAX_BATCH_SIZE, performance_ingest.MAX_BULK_BYTES = max_batch_size, max_bytes
+
+    # Without a length, the stream stops at the cap; earlier batches stay written
+    pool = client.application.extensions['eduboost'].db_pool
+    body = ndjson_records(100, student_id='S6')
+    try:
+        performance_ingest.ingest_stream(pool, performance_ingest.text_lines(io.BytesIO(body), len(body) // 2),
+                                         fmt='ndjson', batch_size=10)
+    except performance_ingest.IngestTooLargeError as e:
+        assert 0 < e.result['rows_written'] < 100 and e.result['rows_written'] % 10 == 0, e.result
+    else:
+        raise AssertionError('the byte limit was not enforced')
+
+
+def test_apps_keep_their_own_database():
+    first, second = make_client(), make_client()
+    body = ndjson_records(1, student_id='S3')
+    assert first.post('/api/performance/bulk?format=ndjson', data=body).status_code == 200
+
+    # The second app neither sees the row nor repoints the first one
+    modules = [m['module_name'] for m in second.get('/api/students/S3/performance').get_json()['performance_data']]
+    assert 'Bulk Module' not in modules
+    assert first.get('/api/students/S3/performance').get_json()['performance_data'][0]['module_name'] == 'Bulk Module'
+    assert first.application.extensions['eduboost'].db_pool is not second.application.extensions['eduboost'].db_pool
+
+
+def test_single_feedback_uses_bulk_validation():
+    client = make_client()
+    for body in (dict(FEEDBACK_RECORD, urgency_level=9), dict(FEEDBACK_RECORD, weak_areas='CSS'),
+                 dict(FEEDBACK_RECORD, feedback_text='  '), ['not', 'an', 'object']):
+        response = client.post('/api/lecturer/feedback', json=body)
+        assert response.status_code == 400, body
+        assert response.get_json()['errors'], body
+
+    response = client.post('/api/lecturer/feedback', json=FEEDBACK_RECORD)
+    assert response.status_code == 200 and isinstance(response.get_json()['feedback_id'], int)
+
+
+def test_bulk_feedback_ids_point_at_their_rows():
+    client = make_client()
+    records = [dict(FEEDBACK_RECORD, student_id=f'S{i}', feedback_text=f'note {i}') for i in range(4)]
+    records.insert(2, dict(FEEDBACK_RECORD, urgency_level=0))
+    response = client.post('/api/lecturer/feedback/bulk', json=records)
+    result = response.get_json()
+    assert response.status_code == 200 and result['status'] == 'partial', result
+    assert [error['index'] for error in result['errors']] == [2]
+
+    pool = client.application.extensions['eduboost'].db_pool
+    with pool.connection() as conn:
+        for entry in result['results']:
+            row = conn.execute('SELECT student_id, feedback_text FROM lecturer_feedback WHERE id = ?',
+                               (entry['feedback_id'],)).fetchone()
+            assert row == (records[entry['index']]['student_id'], records[entry['index']]['feedback_text'])
+
+
+def test_bulk_feedback_body_is_capped():
+    client = make_client()
+    records = [dict(FEEDBACK_RECORD, feedback_text='x' * 200) for _ in range(20)]
+    limit = feedback_ingest.MAX_BULK_BYTES
+    feedback_ingest.MAX_BULK_BYTES = 2048
+    try:
+        response = client.post('/api/lecturer/feedback/bulk', json=records)
+        assert response.status_code == 413, response.status_code
+        response = client.post('/api/lecturer/feedback/bulk', data=b'{"student_id": "\xff"}\n',
+                               content_type='application/x-ndjson')
+        assert response.status_code == 400 and 'UTF-8' in response.get_json()['error']
+    finally:
+        feedback_ingest.MAX_BULK_BYTES = limit
+
+
+class ConstantModel:
+    """Stub at-risk model that gives every row the same probability"""
+
+    n_features_in_ = feature_transform.FEATURE_COUNT
+
+    def __init__(self, probability):
+        self.probability = probability
+
+    def predict_proba(self, features):
+        return [[1 - self.probability, self.probability]] * len(features)
+
+
+def test_model_scores_drive_risk_level():
+    client = make_client()
+    services = client.application.extensions['eduboost']
+    # A strong student by the rules, whom the model calls at risk
+    strong = dict(PREDICT_ROW, Current_GPA=3.9, Avg_Assessment_Score=95, Assignments_Late=0, Login_Frequency=30)
+    rules = client.post('/predict', json=strong).get_json()
+    assert rules['scored_by'] == 'rules' and rules['risk_level'] == 'low' and rules['prediction'] == [0]
+
+    services._inference = InferenceService(lambda: ConstantModel(0.9), max_wait_ms=0)
+    single = client.post('/predict', json=strong).get_json()
+    assert single['scored_by'] == 'model' and single['prediction'] == [1], single
+    assert single['risk_score'] == 0.9 and single['risk_level'] == 'high'
+    assert single['rule_risk_score'] == rules['risk_score']
+
+    batch = client.post('/predict/batch', json=dict(strong, Current_GPA=[3.9, 3.8])).get_json()
+    assert [(row['prediction'], row['risk_level']) for row in batch['results']] == [(1, 'high')] * 2
+    assert batch['summary']['high_risk'] == 2
+
+
+def test_planner_loads_inputs_once_and_follows_the_catalog():
+    client = make_client()
+    services = client.application.extensions['eduboost']
+    assert client.post('/api/performance/bulk?format=ndjson', data=ndjson_records(1, student_id='S4')).status_code == 200
+
+    loads = []
+    load_student_inputs = eduboost.load_student_inputs
+    eduboost.load_student_inputs = lambda student_id: loads.append(student_id) or load_student_inputs(student_id)
+    try:
+        # Goals are regenerated from the planner's own inputs, not loaded again
+        planner = client.get('/api/students/S4/planner').get_json()
+        assert loads == ['S4'], loads
+        general = [goal for goal in planner['goal_resources'] if goal['module_name'] == 'General']
+        assert general and all(goal['resources'] == [] for goal in general), planner['goal_resources']
+
+        # A new resource changes the catalog version, so the cached planner is not served
+        with services.db_pool.transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO learning_resources (module_name, resource_type, resource_title, resource_url, rating)
+                VALUES ('Learning Skills', 'book', 'Study Habits That Stick', 'https://example.org/habits', 4.5)
+            ''')
+        services.catalog.invalidate()
+        planner = client.get('/api/students/S4/planner').get_json()
+        titles = {resource['resource_title'] for goal in planner['goal_resources']
+                  if goal['module_name'] == 'General' for resource in goal['resources']}
+        assert titles == {'Study Habits That Stick'}, planner['goal_resources']
+        assert loads == ['S4', 'S4'], loads
+    finally:
+        eduboost.load_student_inputs = load_student_inputs
+
+
+def add_resources(client, *resources):
+    """Insert (title, type, difficulty, is_free, description) rows; returns their ids"""
+    with client.application.extensions['eduboost'].db_pool.transaction() as cursor:
+        return [cursor.execute('''
+            INSERT INTO learning_resources (module_name, resource_type, resource_title, difficulty_level,
+                                            is_free, description, rating)
+            VALUES ('Search Module', ?, ?, ?, ?, ?, 4.0) RETURNING id
+        ''', (resource_type, title, difficulty, is_free, description)).fetchone()[0]
+            for title, resource_type, difficulty, is_free, description in resources]
+
+
+def search_ids(client, query):
+    response = client.get(f'/api/resources/search?{query}')
+    assert response.status_code == 200, response.get_json()
+    return [result['id'] for result in response.get_json()['results']]
+
+
+def test_search_filters_and_cursor():
+    client = make_client()
+    ids = add_resources(
+        client,
+        ('Quasar Basics', 'book', 1, 1, 'An introduction'),
+        ('Quasar Video Course', 'video', 2, 0, 'Quasar quasar quasar'),
+        ('Stars and Quasars', 'video', 2, 1, 'Galaxies'),
+        ('Astronomy Practice', 'practice', 3, 1, 'Exercises on the quasar'),
+        ('Telescopes', 'book', 2, 0, 'Mentions a quasar once')
+    )
+    assert set(search_ids(client, 'q=quasar&type=video')) == {ids[1], ids[2]}
+    assert set(search_ids(client, 'q=quasar&difficulty=2')) == {ids[1], ids[2], ids[4]}
+    assert set(search_ids(client, 'q=quasar&is_free=false')) == {ids[1], ids[4]}
+
+    # Pages of two follow each other without gaps or repeats, best first
+    seen, relevances, cursor = [], [], ''
+    while True:
+        page = client.get(f'/api/resources/search?q=quasar&limit=2{cursor}').get_json()
+        seen += [result['id'] for result in page['results']]
+        relevances += [result['relevance'] for result in page['results']]
+        if not page['next_cursor']:
+            break
+        cursor = '&cursor=' + page['next_cursor']
+    assert sorted(seen) == sorted(ids) and len(seen) == 5
+    assert relevances == sorted(relevances, reverse=True)
+
+    for query in ('q=the', 'q=quasar&type=podcast', 'q=quasar&difficulty=9', 'q=quasar&cursor=bogus'):
+        assert client.get(f'/api/resources/search?{query}').status_code == 400, query
+
+
+def test_search_ranks_every_match():
+    client = make_client()
+    best, = add_resources(client, ('Pulsar Timing', 'book', 2, 1, 'Radio astronomy'))
+    # Many newer, weaker matches must not push the title match out of the ranking
+    add_resources(client, *[(f'Radio Notes {i}', 'book', 2, 1, 'A pulsar in passing') for i in range(300)])
+    assert search_ids(client, 'q=pulsar&limit=1') == [best]
+    assert search_ids(client, 'q=pulsar&limit=1&type=book&is_free=true') == [best]
+
+
+def test_search_index_follows_writes():
+    client = make_client()
+    resource_id, = add_resources(client, ('Nebula Guide', 'book', 1, 1, 'Clouds of gas'))
+    assert search_ids(client, 'q=nebula') == [resource_id]
+
+    pool = client.application.extensions['eduboost'].db_pool
+    with pool.transaction() as cursor:
+        cursor.execute("UPDATE learning_resources SET resource_title = 'Comet Guide' WHERE id = ?", (resource_id,))
+    assert search_ids(client, 'q=nebula') == [] and search_ids(client, 'q=comet') == [resource_id]
+
+    with pool.transaction() as cursor:
+        cursor.execute('DELETE FROM learning_resources WHERE id = ?', (resource_id,))
+    assert search_ids(client, 'q=comet') == []
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Endpoint Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_predict_rejects_null_inputs, test_predict_batch_stream_is_valid_ndjson,
+                 test_bulk_format_error_reports_committed_rows, test_bulk_invalid_utf8_is_a_format_error,
+                 test_bulk_batch_size_and_body_are_capped,
+                 test_apps_keep_their_own_database, test_single_feedback_uses_bulk_validation,
+                 test_bulk_feedback_ids_point_at_their_rows, test_bulk_feedback_body_is_capped,
+                 test_model_scores_drive_risk_level, test_planner_loads_inputs_once_and_follows_the_catalog,
+                 test_search_filters_and_cursor, test_search_ranks_every_match, test_search_index_follows_writes):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
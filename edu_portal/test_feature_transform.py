@@ -0,0 +1,79 @@
+"""
+EduBoost Feature Transform Checks
+Pins the 32-column model input layout and spot-checks the derived values
+
+A trained model depends on the exact order and meaning of its input
+columns, so any change here must come with a FEATURE_VERSION bump.
+"""
+
+import sys
+
+import numpy as np
+
+import feature_transform
+from feature_transform import FEATURE_NAMES, FeatureSchemaError, transform
+
+# Update together with FEATURE_VERSION when the layout is changed on purpose
+EXPECTED_SCHEMA_ID = 'v1-f7e49e4ead3b'
+
+STUDENT = {
+    'Module_Difficulty': 4.0, 'Current_GPA': 2.0, 'Avg_Assessment_Score': 50.0,
+    'Assignments_Late': 3, 'Num_Submission_Attempts': 2, 'Login_Frequency': 8
+}
+
+
+def test_layout_is_pinned():
+    assert len(FEATURE_NAMES) == 32 and len(set(FEATURE_NAMES)) == 32
+    assert feature_transform.FEATURE_SCHEMA_ID == EXPECTED_SCHEMA_ID, \
+        f"feature layout changed ({feature_transform.FEATURE_SCHEMA_ID}); bump FEATURE_VERSION and retrain"
+
+
+def test_single_row_values():
+    row = dict(zip(FEATURE_NAMES, transform(STUDENT)[0].tolist()))
+    expected = {
+        'GPA_Assessment_Ratio': 1.0, 'Late_Submission_Ratio': 1.5, 'Performance_Index': 50.0,
+        'Risk_Score_Basic': 8.0, 'Engagement_Level': 0.4, 'Academic_Stress': 12.0,
+        'GPA_Category': 4, 'Assessment_Category': 4, 'Late_Category': 2, 'Login_Category': 3,
+        'Late_GPA_Interaction': 6.0, 'Performance_Variance': 0.0,
+        'Binary_High_Risk_GPA': 1, 'Binary_Low_Assessment': 1, 'Binary_Late_Issues': 1,
+        'Binary_Low_Engagement': 1, 'Overall_Performance_Score': 1.14
+    }
+    for name, value in expected.items():
+        assert np.isclose(row[name], value, atol=1e-5), f"{name}: {row[name]} != {value}"
+
+
+def test_batch_matches_rows_and_edge_cases():
+    batch = {name: np.array([value, 0 if name == 'Avg_Assessment_Score' else value]) for name, value in STUDENT.items()}
+    matrix = transform(batch)
+    assert matrix.dtype == np.float32 and matrix.shape == (2, 32)
+    assert np.array_equal(matrix[0], transform(STUDENT)[0])
+    assert matrix[1, FEATURE_NAMES.index('GPA_Assessment_Ratio')] == 0
+
+
+def test_invalid_input_is_rejected():
+    for data in ({'Current_GPA': 3.0}, dict(STUDENT, Login_Frequency=[1, 2, 3], Current_GPA=[3.0, 2.0])):
+        try:
+            transform(data)
+        except FeatureSchemaError:
+            continue
+        raise AssertionError(f"accepted invalid input {data}")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Feature Transform Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_layout_is_pinned, test_single_row_values,
+                 test_batch_matches_rows_and_edge_cases, test_invalid_input_is_rejected):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    print(f"🧮 {len(FEATURE_NAMES)} features, schema {feature_transform.FEATURE_SCHEMA_ID}")
+    sys.exit(1 if failed else 0)
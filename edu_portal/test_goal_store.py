@@ -0,0 +1,139 @@
+"""
+EduBoost Goal Store Checks
+Stable goal ids and digest-based partial regeneration in sync_goals
+
+Regenerating one module must leave every other module's goals -- their
+ids, content and progress -- exactly as they were.
+"""
+
+import os
+import sys
+import tempfile
+
+import goal_store
+from db_pool import get_pool
+from migrations import apply_migrations
+
+DIGESTS = {'Web Development': 'web-1', 'Computer Networks': 'net-1', goal_store.GENERAL_MODULE: 'general-1'}
+
+
+def make_pool():
+    pool = get_pool(os.path.join(tempfile.mkdtemp(prefix='eduboost_goals_'), 'eduboost.db'))
+    with pool.connection() as conn:
+        apply_migrations(conn)
+    return pool
+
+
+def goal(module_name, goal_title, description='Initial plan'):
+    return {
+        'module_name': module_name, 'goal_title': goal_title, 'goal_description': description,
+        'goal_type': 'academic', 'priority_level': 'high', 'target_completion_date': '2026-12-01',
+        'success_criteria': ['Pass the next assessment']
+    }
+
+
+FIRST_GOALS = [
+    goal('Web Development', 'Master CSS layout'),
+    goal('Web Development', 'Finish the JavaScript labs'),
+    goal('Computer Networks', 'Subnetting drills'),
+    goal('Improve Study Habits', 'Weekly study plan')
+]
+
+
+def by_title(goals):
+    return {goal['goal_title']: goal for goal in goals}
+
+
+def set_progress(pool, goal_id, progress):
+    with pool.transaction() as cursor:
+        cursor.execute('UPDATE student_goals SET current_progress = ? WHERE goal_id = ?', (progress, goal_id))
+
+
+def test_goal_ids_are_stable():
+    goal_id = goal_store.goal_id_for('S1', 'Web Development', 'Master CSS layout')
+    assert goal_id == goal_store.goal_id_for('S1', 'Web Development', 'Master CSS layout')
+    assert len({goal_id, goal_store.goal_id_for('S2', 'Web Development', 'Master CSS layout'),
+                goal_store.goal_id_for('S1', 'Computer Networks', 'Master CSS layout'),
+                goal_store.goal_id_for('S1', 'Web Development', 'Master CSS grid')}) == 4
+
+    pool = make_pool()
+    stored = goal_store.sync_goals(pool, 'S1', FIRST_GOALS, DIGESTS, inputs_version=1)
+    assert by_title(stored['goals'])['Master CSS layout']['goal_id'] == goal_id
+    assert stored['regenerated_modules'] == sorted(DIGESTS)
+
+    # The same inputs again rewrite nothing
+    assert goal_store.sync_goals(pool, 'S1', FIRST_GOALS, DIGESTS, inputs_version=1)['regenerated_modules'] == []
+    with pool.connection() as conn:
+        assert goal_store.read_goals(conn, 'S1')[:2] == (True, 1)
+
+
+def test_regenerating_one_module_keeps_the_others():
+    pool = make_pool()
+    first = by_title(goal_store.sync_goals(pool, 'S1', FIRST_GOALS, DIGESTS, inputs_version=1)['goals'])
+    set_progress(pool, first['Subnetting drills']['goal_id'], 40)
+    set_progress(pool, first['Master CSS layout']['goal_id'], 25)
+    set_progress(pool, first['Weekly study plan']['goal_id'], 10)
+
+    # New Web Development inputs: one goal is reworded, one is replaced. The
+    # generator also rewords the other modules, which must be ignored.
+    regenerated = [
+        goal('Web Development', 'Master CSS layout', 'Revised plan'),
+        goal('Web Development', 'Build a REST client', 'Revised plan'),
+        goal('Computer Networks', 'Subnetting drills', 'Revised plan'),
+        goal('Improve Study Habits', 'Weekly study plan', 'Revised plan')
+    ]
+    result = goal_store.sync_goals(pool, 'S1', regenerated, dict(DIGESTS, **{'Web Development': 'web-2'}),
+                                   inputs_version=2)
+    assert result['regenerated_modules'] == ['Web Development']
+
+    goals = by_title(result['goals'])
+    assert set(goals) == {'Master CSS layout', 'Build a REST client', 'Subnetting drills', 'Weekly study plan'}
+    for title, progress in (('Subnetting drills', 40), ('Weekly study plan', 10)):
+        assert goals[title]['goal_id'] == first[title]['goal_id']
+        assert goals[title]['current_progress'] == progress
+        assert goals[title]['goal_description'] == 'Initial plan'
+
+    # A reworded goal of the regenerated module keeps its id and progress
+    css = goals['Master CSS layout']
+    assert css['goal_id'] == first['Master CSS layout']['goal_id']
+    assert css['current_progress'] == 25 and css['goal_description'] == 'Revised plan'
+    assert [goal['goal_title'] for goal in result['goals']] == [goal['goal_title'] for goal in regenerated]
+
+
+def test_stale_goals_and_dropped_modules_are_deleted():
+    pool = make_pool()
+    first = by_title(goal_store.sync_goals(pool, 'S1', FIRST_GOALS, DIGESTS, inputs_version=1)['goals'])
+    with pool.transaction() as cursor:
+        cursor.execute('INSERT INTO goal_resources (goal_id, resource_id, relevance_score) VALUES (?, 1, 0.5)',
+                       (first['Finish the JavaScript labs']['goal_id'],))
+
+    # Computer Networks has no inputs any more, Web Development changed
+    digests = {'Web Development': 'web-2', goal_store.GENERAL_MODULE: 'general-1'}
+    result = goal_store.sync_goals(pool, 'S1', [FIRST_GOALS[0], FIRST_GOALS[3]], digests, inputs_version=2)
+    assert result['regenerated_modules'] == ['Computer Networks', 'Web Development']
+    assert set(by_title(result['goals'])) == {'Master CSS layout', 'Weekly study plan'}
+
+    with pool.connection() as conn:
+        assert conn.execute('SELECT COUNT(*) FROM goal_resources').fetchone()[0] == 0
+        modules = {row[0] for row in conn.execute('SELECT module_name FROM goal_inputs WHERE student_id = ?',
+                                                  ('S1',))}
+    assert modules == set(digests)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Goal Store Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_goal_ids_are_stable, test_regenerating_one_module_keeps_the_others,
+                 test_stale_goals_and_dropped_modules_are_deleted):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
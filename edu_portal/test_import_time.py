@@ -0,0 +1,99 @@
+"""
+EduBoost Import Time Budget
+`python -X importtime` regression checks for importing app.py
+
+Scripts and workers import app.py on every start, so the import must stay
+cheap and free of side effects: no database, no model unpickling and no
+background threads until create_app()'s services are first used. Each check
+runs in a fresh interpreter so earlier imports cannot hide the cost.
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+from migrations import LATEST_VERSION
+from startup_profile import heavy_imports, import_profile
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Cumulative `import app` time allowed, in milliseconds (best of IMPORT_RUNS)
+IMPORT_BUDGET_MS = float(os.environ.get('EDUBOOST_IMPORT_BUDGET_MS', 600))
+IMPORT_RUNS = 3
+
+
+def run_python(code):
+    """Run `code` in a fresh interpreter inside edu_portal/; returns the completed process"""
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=APP_DIR, capture_output=True, text=True, check=True
+    )
+
+
+def best_import_ms(module='app', runs=IMPORT_RUNS):
+    return min(import_profile(module)[module][1] for _ in range(runs))
+
+
+def test_import_time_under_budget():
+    elapsed_ms = best_import_ms()
+    assert elapsed_ms <= IMPORT_BUDGET_MS, f"import app took {elapsed_ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
+
+
+def test_no_heavy_optional_imports():
+    heavy = heavy_imports(import_profile())
+    assert not heavy, f"import app loads optional heavy packages: {heavy}"
+
+
+def test_import_has_no_side_effects():
+    state = json.loads(run_python(
+        'import json, sys, threading, app\n'
+        'print(json.dumps({'
+        '"db_pool": app.services._db_pool is not None, '
+        '"ai": app.services._ai is not None, '
+        '"jobs": app.services._jobs is not None, '
+        '"health_model": "eduboost_health_model" in sys.modules, '
+        '"sys_path": app.HEALTH_MODEL_DIR in sys.path, '
+        '"threads": threading.active_count()}))'
+    ).stdout.strip().splitlines()[-1])
+    assert state == {
+        'db_pool': False, 'ai': False, 'jobs': False,
+        'health_model': False, 'sys_path': False, 'threads': 1
+    }, state
+
+
+def test_create_app_uses_configured_database():
+    db_path = os.path.join(tempfile.mkdtemp(prefix='eduboost_factory_'), 'eduboost.db')
+    run_python(
+        'import app\n'
+        f'flask_app = app.create_app({{"DATABASE_PATH": {db_path!r}}})\n'
+        'client = flask_app.test_client()\n'
+        'assert client.get("/").status_code == 200\n'
+        'assert not flask_app.extensions["eduboost"]._db_pool, "health check must not open the database"\n'
+        'assert client.get("/api/system/db-pool").status_code == 200\n'
+        'assert not app.services._db_pool, "the default app must stay on its own database"\n'
+    )
+    conn = sqlite3.connect(db_path)
+    assert conn.execute('PRAGMA user_version').fetchone()[0] == LATEST_VERSION
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Import Time Budget")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_import_time_under_budget, test_no_heavy_optional_imports,
+                 test_import_has_no_side_effects, test_create_app_uses_configured_database):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    print(f"⏱️ import app: {best_import_ms():.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,166 @@
+"""
+EduBoost Inference Service Checks
+Micro-batching, per-caller slicing, rule fallback and failed-load caching
+
+A stub model stands in for the trained one; it scores each row from its
+own features, so a caller that got another caller's slice would notice.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+import feature_transform
+from inference_service import InferenceService
+from model_registry import CachedModel, ModelNotAvailableError
+
+
+class StubModel:
+    """predict_proba from the rows' own features; records every batch it sees"""
+
+    n_features_in_ = feature_transform.FEATURE_COUNT
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+
+    def predict_proba(self, features):
+        if self.fail:
+            raise RuntimeError('model exploded')
+        self.batches.append(len(features))
+        positive = 1 / (1 + np.exp(-(features[:, 1].astype(np.float64) - 2.5)))
+        return np.column_stack([1 - positive, positive])
+
+
+def student_rows(gpas):
+    return {name: [2.0] * len(gpas) for name in feature_transform.BASE_FEATURES} | {'Current_GPA': list(gpas)}
+
+
+def expected(gpas):
+    return 1 / (1 + np.exp(-(np.array(gpas, dtype=np.float32).astype(np.float64) - 2.5)))
+
+
+def test_concurrent_requests_share_batches_and_get_their_own_rows():
+    model = StubModel()
+    service = InferenceService(lambda: model, max_batch_rows=64, max_wait_ms=50)
+    requests = [[1.0 + 0.1 * i + 0.01 * row for row in range(i % 3 + 1)] for i in range(12)]
+    results = [None] * len(requests)
+    start = threading.Barrier(len(requests))
+
+    def call(i):
+        start.wait()
+        results[i] = service.predict_proba(student_rows(requests[i]))
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(requests))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for gpas, result in zip(requests, results):
+        assert np.allclose(result, expected(gpas)), (gpas, result)
+    stats = service.stats()
+    assert stats['requests'] == 12 and stats['rows'] == sum(map(len, requests))
+    assert stats['batches'] == len(model.batches) < 12, model.batches
+
+
+def test_batches_are_capped_at_max_rows():
+    model = StubModel()
+    service = InferenceService(lambda: model, max_batch_rows=4, max_wait_ms=50)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.predict_proba(student_rows([3.0, 3.1]))))
+               for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 6 and max(model.batches) <= 4, model.batches
+
+
+def test_missing_or_failing_model_falls_back_to_rules():
+    service = InferenceService(lambda: None)
+    assert service.predict_proba(student_rows([2.0])) is None
+    assert service.stats()['fallbacks'] == 1 and not service.stats()['batcher_running']
+
+    service = InferenceService(lambda: StubModel(fail=True), max_wait_ms=0)
+    assert service.predict_proba(student_rows([2.0, 3.0])) is None
+    stats = service.stats()
+    assert stats['model_errors'] == 1 and stats['fallbacks'] == 1 and stats['last_error'] == 'model exploded'
+
+
+def test_failed_load_is_not_retried_until_the_file_changes():
+    path = os.path.join(tempfile.mkdtemp(prefix='eduboost_registry_'), 'model.ebm')
+    opened = []
+
+    def factory(model_path):
+        opened.append(model_path)
+        with open(model_path) as f:
+            if f.read() != 'good':
+                raise ValueError('not a model')
+        return StubModel()
+
+    entry = CachedModel('stub', path, factory, check_interval=0.0, retry_interval=60.0)
+    for _ in range(2001):
+        try:
+            entry.get()
+        except ModelNotAvailableError:
+            pass
+    stats = entry.stats()
+    assert stats['failures'] == 1 and stats['cached_failures'] == 2000, stats
+
+    # A bad file is a new attempt (the mtime changed), and so is the fix
+    with open(path, 'w') as f:
+        f.write('bad')
+    for _ in range(3):
+        try:
+            entry.get()
+        except ModelNotAvailableError:
+            pass
+    assert len(opened) == 1 and entry.stats()['failures'] == 2
+    time.sleep(0.01)
+    with open(path, 'w') as f:
+        f.write('good')
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10_000_000))
+    assert isinstance(entry.get(), StubModel) and len(opened) == 2
+
+
+def test_failed_load_is_retried_after_the_interval():
+    entry = CachedModel('stub', os.path.join(tempfile.mkdtemp(), 'missing.ebm'), StubModel,
+                        check_interval=60.0, retry_interval=0.05)
+    for _ in range(2):
+        try:
+            entry.get()
+        except ModelNotAvailableError:
+            pass
+    assert entry.stats()['failures'] == 1
+    time.sleep(0.06)
+    try:
+        entry.get()
+    except ModelNotAvailableError:
+        pass
+    assert entry.stats()['failures'] == 2
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Inference Service Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_concurrent_requests_share_batches_and_get_their_own_rows, test_batches_are_capped_at_max_rows,
+                 test_missing_or_failing_model_falls_back_to_rules,
+                 test_failed_load_is_not_retried_until_the_file_changes,
+                 test_failed_load_is_retried_after_the_interval):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,138 @@
+"""
+EduBoost Job Queue Checks
+Dedupe and debounce, the atomic claim, retries and lease requeue
+
+Queues are created with workers=0 so each check drives claims itself,
+except the last one, which runs a real worker thread.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from db_pool import get_pool
+from job_queue import JobQueue
+from migrations import apply_migrations
+
+
+def make_queue(**kwargs):
+    pool = get_pool(os.path.join(tempfile.mkdtemp(prefix='eduboost_jobs_'), 'eduboost.db'))
+    with pool.connection() as conn:
+        apply_migrations(conn)
+    settings = dict(workers=0, debounce=10.0, max_delay=15.0, poll_interval=0.05)
+    settings.update(kwargs)
+    queue = JobQueue(pool, **settings)
+    queue.register('echo', lambda payload: payload)
+    return queue
+
+
+def enqueue(queue, payload, **kwargs):
+    with queue.pool.transaction() as cursor:
+        return queue.enqueue(cursor, 'echo', payload, **kwargs)
+
+
+def test_dedupe_merges_and_rollback_is_not_counted():
+    queue = make_queue()
+    first = enqueue(queue, {'n': 1}, dedupe_key='echo:S1')
+    assert enqueue(queue, {'n': 2}, dedupe_key='echo:S1') == first
+    assert enqueue(queue, {'n': 3}, dedupe_key='echo:S2') != first
+
+    job = queue.get(first)
+    assert job['payload'] == {'n': 2} and job['merged'] == 1
+    # Debounced from the second request, but never past max_delay after the first
+    assert job['enqueued_at'] + 10.0 < job['run_after'] <= job['enqueued_at'] + 15.0
+
+    try:
+        with queue.pool.transaction() as cursor:
+            queue.enqueue(cursor, 'echo', {'n': 4}, dedupe_key='echo:S3')
+            queue.enqueue(cursor, 'echo', {'n': 5}, dedupe_key='echo:S1')
+            raise RuntimeError('caller failed after enqueueing')
+    except RuntimeError:
+        pass
+    stats = queue.stats()
+    assert stats['enqueued'] == 2 and stats['merged'] == 1, stats
+    assert queue.get(first)['merged'] == 1
+
+
+def test_concurrent_claims_take_each_job_once():
+    queue = make_queue()
+    job_ids = {enqueue(queue, {'n': i}, delay=0) for i in range(40)}
+    claimed, lock = [], threading.Lock()
+
+    def drain():
+        while True:
+            job = queue._claim()
+            if job is None:
+                return
+            with lock:
+                claimed.append(job[0])
+
+    threads = [threading.Thread(target=drain) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == sorted(job_ids), f"{len(claimed)} claims for {len(job_ids)} jobs"
+    assert queue.stats()['jobs_by_status'] == {'running': 40}
+
+
+def test_expired_lease_is_requeued_and_failures_retry():
+    queue = make_queue(lease_seconds=0.05, max_attempts=2)
+    queue.register('flaky', lambda payload: 1 / 0)
+    with queue.pool.transaction() as cursor:
+        job_id = queue.enqueue(cursor, 'flaky', {}, delay=0)
+
+    # A worker claimed it and died: the lease runs out and the job is queued again
+    assert queue._claim()[0] == job_id
+    queue._requeue_expired()
+    assert queue.get(job_id)['status'] == 'running'
+    time.sleep(0.1)
+    queue._requeue_expired()
+    assert queue.get(job_id)['status'] == 'queued' and queue.stats()['requeued_expired'] == 1
+
+    # Second attempt fails, and max_attempts=2 makes it final
+    queue._run(*queue._claim())
+    job = queue.get(job_id)
+    assert job['status'] == 'failed' and job['attempts'] == 2 and 'division' in job['error'], job
+
+    other = enqueue(queue, {}, delay=0)
+    queue.register('echo', lambda payload: 1 / 0)
+    queue._run(*queue._claim())
+    job = queue.get(other)
+    assert job['status'] == 'queued' and job['run_after'] > time.time(), job
+    assert queue.stats()['retried'] == 1 and queue.stats()['failed'] == 1
+
+
+def test_worker_runs_due_job():
+    queue = make_queue(workers=1)
+    try:
+        job_id = enqueue(queue, {'student_id': 'S1'}, dedupe_key='echo:S1', delay=0)
+        deadline = time.monotonic() + 5
+        while queue.get(job_id)['status'] != 'done' and time.monotonic() < deadline:
+            time.sleep(0.02)
+        job = queue.get(job_id)
+        assert job['status'] == 'done' and job['result'] == {'student_id': 'S1'}, job
+        assert queue.stats()['completed'] == 1
+    finally:
+        queue.stop()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Job Queue Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_dedupe_merges_and_rollback_is_not_counted, test_concurrent_claims_take_each_job_once,
+                 test_expired_lease_is_requeued_and_failures_retry, test_worker_runs_due_job):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,163 @@
+"""
+EduBoost Model Artifact Checks
+Round trips, tree traversal and integrity checks for .ebm model files
+
+Uses tiny hand-built models, so no ML library is needed; the parity checks
+against real XGBoost and scikit-learn models are skipped when those
+libraries are not installed.
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pytest
+
+import model_artifact
+from feature_transform import FEATURE_COUNT
+from model_artifact import ArtifactError, load_artifact, save_artifact
+
+# Two stumps on Current_GPA (column 1) and Avg_Assessment_Score (column 2);
+# a missing GPA goes right
+STUMPS = (
+    [(1, 2.5, 1, 2, 0, 0.0), (-1, 0.0, 0, 0, 1, 0.8), (-1, 0.0, 0, 0, 1, -0.4)],
+    [(2, 60.0, 1, 2, 1, 0.0), (-1, 0.0, 0, 0, 1, 0.5), (-1, 0.0, 0, 0, 1, -0.2)]
+)
+
+
+def artifact_path(name):
+    return os.path.join(tempfile.mkdtemp(prefix='eduboost_artifact_'), name + model_artifact.ARTIFACT_SUFFIX)
+
+
+def save_stumps(path):
+    kind, params, arrays = model_artifact._pack_trees(STUMPS, comparison='lt', aggregation='sum', link='logistic')
+    save_artifact(path, kind, params, arrays, FEATURE_COUNT)
+    return path
+
+
+def test_tree_ensemble_round_trip():
+    model = load_artifact(save_stumps(artifact_path('stumps')))
+    features = np.zeros((4, FEATURE_COUNT), dtype=np.float32)
+    features[:, 1] = [2.0, 3.0, 2.5, np.nan]
+    features[:, 2] = [50, 70, 60, 50]
+    margins = np.array([0.8 + 0.5, -0.4 - 0.2, -0.4 - 0.2, -0.4 + 0.5])
+    assert np.allclose(model.decision_function(features), margins)
+    assert np.allclose(model.predict_proba(features)[:, 1], 1 / (1 + np.exp(-margins)))
+    assert isinstance(model.arrays['value'], np.memmap)
+
+
+def test_linear_round_trip_with_scaler():
+    path = artifact_path('linear')
+    coef = np.linspace(-1, 1, FEATURE_COUNT)
+    mean, std = np.full(FEATURE_COUNT, 2.0), np.full(FEATURE_COUNT, 4.0)
+    save_artifact(path, model_artifact.KIND_LINEAR, {'intercept': 0.25, 'link': 'logistic'},
+                  {'coef': coef, 'scale_mean': mean, 'scale_std': std}, FEATURE_COUNT)
+    features = np.random.default_rng(1).normal(size=(10, FEATURE_COUNT))
+    expected = 1 / (1 + np.exp(-(((features - mean) / std) @ coef + 0.25)))
+    assert np.allclose(load_artifact(path).predict_proba(features)[:, 1], expected)
+
+
+def test_corruption_is_rejected():
+    path = save_stumps(artifact_path('corrupt'))
+    with open(path, 'r+b') as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 1]))
+
+    not_artifact = artifact_path('pickle')
+    with open(not_artifact, 'wb') as f:
+        f.write(b'\x80\x04\x95' + b'\x00' * 64)
+
+    for bad_path in (path, not_artifact):
+        try:
+            load_artifact(bad_path)
+        except ArtifactError:
+            continue
+        raise AssertionError(f"{bad_path} was accepted")
+
+
+def test_pickle_fallback_is_opt_in():
+    import pickle
+    pickle_path = os.path.join(tempfile.mkdtemp(prefix='eduboost_artifact_'), 'model.pkl')
+    with open(pickle_path, 'wb') as f:
+        pickle.dump({'trained': True}, f)
+
+    allowed = model_artifact.ALLOW_PICKLED_MODELS
+    try:
+        model_artifact.ALLOW_PICKLED_MODELS = False
+        with pytest.raises(ArtifactError, match='model_artifact.py export'):
+            model_artifact.load_model(pickle_path)
+
+        model_artifact.ALLOW_PICKLED_MODELS = True
+        assert model_artifact.load_model(pickle_path) == {'trained': True}
+
+        # Once exported, the artifact wins even when pickles are allowed
+        save_stumps(model_artifact.artifact_path_for(pickle_path))
+        assert isinstance(model_artifact.load_model(pickle_path), model_artifact.ArtifactModel)
+    finally:
+        model_artifact.ALLOW_PICKLED_MODELS = allowed
+
+
+def training_data(rows=400, columns=8, seed=3):
+    """Random features with a learnable label; wider than the basic fields so no transform applies"""
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(rows, columns)).astype(np.float32)
+    labels = (features[:, 0] + 0.5 * features[:, 1] - features[:, 2] * features[:, 3] > 0).astype(int)
+    return features, labels
+
+
+def exported(model, name):
+    """The model written as an artifact and loaded back"""
+    path = artifact_path(name)
+    save_artifact(path, *model_artifact.export_model(model))
+    return load_artifact(path)
+
+
+def test_xgboost_parity():
+    xgboost = pytest.importorskip('xgboost')
+    features, labels = training_data()
+    model = xgboost.XGBClassifier(n_estimators=25, max_depth=4, learning_rate=0.3)
+    model.fit(features, labels)
+
+    # Missing values must follow each split's learned default direction
+    probe = training_data(rows=200, seed=4)[0]
+    probe[::7, 0] = np.nan
+    probe[::5, 3] = np.nan
+    artifact = exported(model, 'xgboost')
+    assert np.allclose(artifact.predict_proba(probe)[:, 1], model.predict_proba(probe)[:, 1], atol=1e-5)
+
+
+def test_sklearn_parity():
+    ensemble = pytest.importorskip('sklearn.ensemble')
+    tree = pytest.importorskip('sklearn.tree')
+    features, labels = training_data()
+    probe = training_data(rows=200, seed=4)[0]
+    for name, model in (('decision_tree', tree.DecisionTreeClassifier(max_depth=6, random_state=0)),
+                        ('random_forest', ensemble.RandomForestClassifier(n_estimators=15, max_depth=5,
+                                                                          random_state=0))):
+        model.fit(features, labels)
+        artifact = exported(model, name)
+        assert np.allclose(artifact.predict_proba(probe), model.predict_proba(probe), atol=1e-9), name
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Model Artifact Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_tree_ensemble_round_trip, test_linear_round_trip_with_scaler, test_corruption_is_rejected,
+                 test_pickle_fallback_is_opt_in, test_xgboost_parity, test_sklearn_parity):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except pytest.skip.Exception as e:
+            print(f"⏭️ {test.__name__}: {e}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
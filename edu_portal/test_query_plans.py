@@ -0,0 +1,177 @@
+"""
+EduBoost Query Plan Audit
+EXPLAIN QUERY PLAN regression checks for the hot queries against eduboost.db
+
+Every query below is the SQL constant a request path or job worker runs,
+so a change to the real query is audited too. The audit fails if SQLite
+plans a full table scan or a temporary B-tree for ORDER BY for any of them,
+which means an index from migrations.py is missing or no longer usable.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+import app
+import goal_store
+import job_queue
+import resource_catalog
+import resource_index
+from migrations import LATEST_VERSION, apply_migrations, schema_version
+
+# name -> (sql, params); each SQL is the constant its request path or worker executes
+HOT_QUERIES = {
+    'performance_by_student': (
+        app.STUDENT_PERFORMANCE_SQL,
+        ('STUD001',)
+    ),
+    'feedback_by_student': (
+        app.STUDENT_FEEDBACK_SQL,
+        ('STUD001',)
+    ),
+    'goals_by_student': (
+        goal_store.READ_GOALS_SQL,
+        ('STUD001', goal_store.MAX_GOALS)
+    ),
+    'goal_ids_by_student': (
+        goal_store.READ_GOAL_IDS_SQL,
+        ('STUD001',)
+    ),
+    'student_data_version': (
+        goal_store.DATA_VERSION_SQL,
+        ('STUD001',)
+    ),
+    'goal_input_digests': (
+        goal_store.READ_INPUT_DIGESTS_SQL,
+        ('STUD001',)
+    ),
+    'goal_progress_update': (
+        app.UPDATE_GOAL_PROGRESS_SQL,
+        (50, False, 'goal-1')
+    ),
+    'goal_owner': (
+        app.GOAL_OWNER_SQL,
+        ('goal-1',)
+    ),
+    'goal_resources_by_student': (
+        resource_index.READ_GOAL_RESOURCES_SQL,
+        ('STUD001',)
+    ),
+    'goal_resources_replace': (
+        resource_index.DELETE_AI_GOAL_RESOURCES_SQL,
+        ('goal-1',)
+    ),
+    'catalog_version': (
+        resource_catalog.CATALOG_VERSION_SQL,
+        (resource_catalog.CATALOG_NAME,)
+    ),
+    'claim_next_job': (
+        job_queue.CLAIM_JOB_SQL,
+        (1000.0, 1000.0)
+    ),
+    'earliest_queued_job': (
+        job_queue.NEXT_RUN_SQL,
+        ()
+    ),
+    'requeue_expired_jobs': (
+        job_queue.REQUEUE_EXPIRED_SQL,
+        (1000.0,)
+    )
+}
+
+
+def create_test_database():
+    """Create a migrated, lightly populated database in a temp directory"""
+    directory = tempfile.mkdtemp(prefix='eduboost_plans_')
+    conn = sqlite3.connect(os.path.join(directory, 'eduboost.db'))
+    apply_migrations(conn)
+
+    modules = ['Database Management', 'Computer Networks', 'Web Development']
+    with conn:
+        conn.executemany(
+            'INSERT INTO student_performance (student_id, module_name, avg_assessment_score) VALUES (?, ?, ?)',
+            [(f'STUD{i:03d}', module, 60) for i in range(200) for module in modules]
+        )
+        conn.executemany(
+            'INSERT INTO lecturer_feedback (student_id, module_name, lecturer_id, urgency_level) VALUES (?, ?, ?, ?)',
+            [(f'STUD{i:03d}', module, 'LEC001', 3) for i in range(200) for module in modules]
+        )
+        conn.executemany(
+            'INSERT INTO student_goals (goal_id, student_id, module_name, goal_title) VALUES (?, ?, ?, ?)',
+            [(f'goal-{i}-{j}', f'STUD{i:03d}', module, 'Goal') for i in range(200) for j, module in enumerate(modules)]
+        )
+        conn.executemany(
+            'INSERT INTO goal_generation (student_id, inputs_version, generated_version) VALUES (?, 0, 0)',
+            [(f'STUD{i:03d}',) for i in range(200)]
+        )
+        conn.executemany(
+            'INSERT INTO learning_resources (module_name, resource_title, difficulty_level, rating) VALUES (?, ?, ?, ?)',
+            [(module, f'Resource {k}', k % 5 + 1, 3.5 + (k % 10) / 10) for module in modules for k in range(50)]
+        )
+        conn.executemany(
+            'INSERT INTO goal_resources (goal_id, resource_id, relevance_score) VALUES (?, ?, ?)',
+            [(f'goal-{i}-0', k, 0.5) for i in range(200) for k in range(1, 4)]
+        )
+        conn.executemany(
+            'INSERT INTO jobs (job_type, dedupe_key, status, enqueued_at, run_after) VALUES (?, ?, ?, ?, ?)',
+            [('regenerate_goals', f'regenerate_goals:STUD{i:03d}', 'queued' if i % 10 == 0 else 'done', i, i)
+             for i in range(200)]
+        )
+    conn.execute('ANALYZE')
+    return conn
+
+
+def explain(conn, sql, params):
+    """Return the detail column of EXPLAIN QUERY PLAN for one query"""
+    return [row[3] for row in conn.execute(f'EXPLAIN QUERY PLAN {sql}', params)]
+
+
+def plan_problems(plan):
+    """Plan steps that indicate a full table scan or a sort in a temp B-tree"""
+    problems = []
+    for detail in plan:
+        if detail.startswith('SCAN ') and 'USING' not in detail:
+            problems.append(detail)
+        elif 'USE TEMP B-TREE' in detail:
+            problems.append(detail)
+    return problems
+
+
+def test_migrations_reach_latest_version():
+    conn = create_test_database()
+    assert schema_version(conn) == LATEST_VERSION
+    # Re-running is a no-op
+    assert apply_migrations(conn) == []
+
+
+def test_hot_queries_use_indexes():
+    conn = create_test_database()
+    failures = {}
+    for name, (sql, params) in HOT_QUERIES.items():
+        problems = plan_problems(explain(conn, sql, params))
+        if problems:
+            failures[name] = problems
+    assert not failures, f"Queries falling back to scans/sorts: {failures}"
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Query Plan Audit")
+    print("=" * 60)
+
+    conn = create_test_database()
+    print(f"🗄️ Schema version: {schema_version(conn)}")
+    failed = 0
+    for name, (sql, params) in HOT_QUERIES.items():
+        plan = explain(conn, sql, params)
+        problems = plan_problems(plan)
+        status = "❌" if problems else "✅"
+        failed += bool(problems)
+        print(f"{status} {name}")
+        for detail in plan:
+            print(f"     {detail}")
+
+    print("=" * 60)
+    print("❌ Query plan regressions found" if failed else "✅ All hot queries use indexes")
+    sys.exit(1 if failed else 0)
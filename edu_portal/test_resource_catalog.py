@@ -0,0 +1,102 @@
+"""
+EduBoost Resource Catalog Checks
+In-memory lookups against the SQL ordering they replace, and rebuilds
+
+The fixture has NULL ratings and NULL difficulties, so the snapshot's sort
+key must agree with SQLite's NULL ordering (NULLs sort first, i.e. last for
+rating DESC and first for difficulty_level ASC), with id breaking ties.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+
+from db_pool import get_pool
+from migrations import apply_migrations
+from resource_catalog import ResourceCatalog
+
+ORDER_BY = 'ORDER BY rating DESC, difficulty_level ASC, id'
+MODULES = ('Web Development', 'Computer Networks')
+TYPES = ('book', 'video', 'practice')
+
+
+def make_pool():
+    pool = get_pool(os.path.join(tempfile.mkdtemp(prefix='eduboost_catalog_'), 'eduboost.db'))
+    with pool.connection() as conn:
+        apply_migrations(conn)
+    ratings = (4.5, None, 3.0, 4.5, None, 5.0, 3.0)
+    difficulties = (2, 3, None, 1, None, 2, 2)
+    with pool.transaction() as cursor:
+        cursor.executemany('''
+            INSERT INTO learning_resources (module_name, resource_type, resource_title, difficulty_level, rating)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [
+            (module, TYPES[k % len(TYPES)], f'{module} {k}', difficulties[k % 7], ratings[(k * 3) % 7])
+            for module in MODULES for k in range(21)
+        ])
+    return pool
+
+
+def sql_ids(conn, where, params, limit=-1):
+    return [row[0] for row in conn.execute(
+        f'SELECT id FROM learning_resources WHERE {where} {ORDER_BY} LIMIT ?', (*params, limit)
+    )]
+
+
+def test_lookups_match_the_sql_ordering():
+    pool = make_pool()
+    snapshot = ResourceCatalog(pool).snapshot()
+    with pool.connection() as conn:
+        for module in MODULES:
+            assert snapshot.ids[snapshot.lookup(module)].tolist() == sql_ids(conn, 'module_name = ?', (module,))
+            for difficulty in (1, 2, 3):
+                # Difficulty without a type filters the module bucket
+                assert snapshot.ids[snapshot.lookup(module, difficulty=difficulty)].tolist() == sql_ids(
+                    conn, 'module_name = ? AND difficulty_level = ?', (module, difficulty))
+            for resource_type in TYPES:
+                assert snapshot.ids[snapshot.lookup(module, resource_type)].tolist() == sql_ids(
+                    conn, 'module_name = ? AND resource_type = ?', (module, resource_type))
+                assert snapshot.ids[snapshot.lookup(module, resource_type, 2)].tolist() == sql_ids(
+                    conn, 'module_name = ? AND resource_type = ? AND difficulty_level = 2', (module, resource_type))
+
+        top = [record['id'] for record in snapshot.top(MODULES, ('book', 'video'), limit=9)]
+        assert top == sql_ids(conn, "module_name IN (?, ?) AND resource_type IN ('book', 'video')", MODULES, 9)
+        top = [record['id'] for record in snapshot.top(MODULES[:1], difficulty=2, limit=4)]
+        assert top == sql_ids(conn, 'module_name = ? AND difficulty_level = 2', MODULES[:1], 4)
+
+
+def test_version_bump_rebuilds_the_snapshot():
+    pool = make_pool()
+    catalog = ResourceCatalog(pool, check_interval=0.0)
+    first = catalog.snapshot()
+    assert catalog.snapshot() is first and catalog.stats()['builds'] == 1
+
+    with pool.transaction() as cursor:
+        cursor.execute("UPDATE catalog_versions SET version = version + 1 WHERE name = 'learning_resources'")
+    second = catalog.snapshot()
+    assert second is not first and second.version == first.version + 1 and catalog.stats()['builds'] == 2
+
+    # A resource write bumps the version through the triggers
+    with pool.transaction() as cursor:
+        cursor.execute("UPDATE learning_resources SET rating = 1.0 WHERE id = 1")
+    third = catalog.snapshot()
+    assert third.version > second.version and third.record(third.row_by_id[1])['rating'] == 1.0
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Resource Catalog Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_lookups_match_the_sql_ordering, test_version_bump_rebuilds_the_snapshot):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
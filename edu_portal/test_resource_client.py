@@ -0,0 +1,142 @@
+"""
+EduBoost Resource Client Checks
+Circuit breaker, deadline and queue-bound behaviour against a local stub API
+
+The stub is a ThreadingHTTPServer on 127.0.0.1 whose delay, status and
+body every test sets; no Next.js server is needed.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from resource_client import CircuitBreaker, CircuitOpenError, ResourceClient, ResourceFetchError
+
+GOOD_BODY = {'success': True, 'data': {'books': [{'id': 'b1', 'resource_title': 'Stub Book'}]}}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        server.calls += 1
+        time.sleep(server.delay)
+        body = server.body if isinstance(server.body, bytes) else json.dumps(server.body).encode()
+        self.send_response(server.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(delay=0.0, status=200, body=GOOD_BODY):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.delay, server.status, server.body, server.calls = delay, status, body, 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_client(server, **kwargs):
+    settings = dict(deadline=0.5, failure_threshold=2, reset_timeout=0.2, pool_size=4)
+    settings.update(kwargs)
+    return ResourceClient(f'http://127.0.0.1:{server.server_port}/api/resources', **settings)
+
+
+def fails(call):
+    try:
+        call()
+    except ResourceFetchError as e:
+        return e
+    raise AssertionError('expected ResourceFetchError')
+
+
+def test_deadline_misses_trip_the_breaker():
+    server = start_stub(delay=0.3)
+    client = make_client(server, deadline=0.05)
+    try:
+        for i in range(2):
+            fails(lambda: client.get_resources(f'S{i}', ['Web Development']))
+        assert client.breaker.state == CircuitBreaker.OPEN
+        assert isinstance(fails(lambda: client.get_resources('S9', ['Web Development'])), CircuitOpenError)
+
+        # The late answers must not close the breaker again
+        time.sleep(0.4)
+        stats = client.stats()
+        assert stats['late_responses'] == 2 and stats['successes'] == 0, stats
+        assert stats['failures'] == 2 and stats['deadline_exceeded'] == 2, stats
+    finally:
+        client.close()
+        server.shutdown()
+
+
+def test_malformed_body_never_wedges_half_open():
+    server = start_stub(body=[1, 2, 3])
+    client = make_client(server, failure_threshold=1)
+    try:
+        fails(lambda: client.get_resources('S1', ['Web Development']))
+        assert client.breaker.state == CircuitBreaker.OPEN
+
+        # The half-open trial gets a malformed body too and must reopen the breaker
+        time.sleep(0.25)
+        server.body = b'not json'
+        fails(lambda: client.get_resources('S1', ['Web Development']))
+        assert client.breaker.state == CircuitBreaker.OPEN
+
+        time.sleep(0.25)
+        server.body = GOOD_BODY
+        assert client.get_resources('S1', ['Web Development']) == GOOD_BODY['data']
+        assert client.breaker.state == CircuitBreaker.CLOSED
+    finally:
+        client.close()
+        server.shutdown()
+
+
+def test_pending_calls_are_bounded_and_coalesced():
+    server = start_stub(delay=0.2)
+    client = make_client(server, max_pending=1, failure_threshold=5)
+    try:
+        results = []
+        waiters = [threading.Thread(target=lambda: results.append(client.get_resources('S1', ['Web Development'])))
+                   for _ in range(3)]
+        for waiter in waiters:
+            waiter.start()
+        time.sleep(0.05)
+
+        started = time.perf_counter()
+        error = fails(lambda: client.get_resources('S2', ['Web Development']))
+        assert time.perf_counter() - started < 0.05 and 'in flight' in str(error)
+
+        for waiter in waiters:
+            waiter.join()
+        stats = client.stats()
+        assert results == [GOOD_BODY['data']] * 3 and server.calls == 1
+        assert stats['rejected'] == 1 and stats['coalesced'] == 2, stats
+        assert client.breaker.state == CircuitBreaker.CLOSED
+    finally:
+        client.close()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Resource Client Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_deadline_misses_trip_the_breaker, test_malformed_body_never_wedges_half_open,
+                 test_pending_calls_are_bounded_and_coalesced):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,135 @@
+"""
+EduBoost Resource Index Checks
+Goal-to-resource ranking and the persisted rankings in goal_resources
+
+A six-resource catalog is small enough to know the right answer: tags
+outweigh titles, titles outweigh descriptions, and a ranking (even an
+empty one) is computed once per catalog version.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+import goal_store
+import resource_index
+from db_pool import get_pool
+from migrations import apply_migrations
+from resource_catalog import CatalogSnapshot
+
+
+def resource(resource_id, module, title, tags=(), description='', rating=4.0):
+    return (resource_id, module, 'book', title, f'https://example.org/{resource_id}', 'Author',
+            2, json.dumps(list(tags)), rating, 10, description, 1)
+
+
+CATALOG_ROWS = [
+    resource(1, 'Web Development', 'Responsive Design', tags=['css', 'flexbox']),
+    resource(2, 'Web Development', 'CSS in Depth', description='Selectors and the cascade'),
+    resource(3, 'Web Development', 'Modern JavaScript', description='Covers css-in-js briefly', rating=5.0),
+    resource(4, 'Web Development', 'HTTP Servers', tags=['backend']),
+    resource(5, 'Computer Networks', 'Subnetting Workbook', tags=['subnetting', 'ipv4']),
+    resource(6, 'Databases', 'SQL Joins', tags=['sql'])
+]
+
+
+def goal(goal_id, module_name, goal_title):
+    return {'goal_id': goal_id, 'module_name': module_name, 'goal_title': goal_title}
+
+
+def make_pool():
+    pool = get_pool(os.path.join(tempfile.mkdtemp(prefix='eduboost_resources_'), 'eduboost.db'))
+    with pool.connection() as conn:
+        apply_migrations(conn)
+    return pool
+
+
+def persisted_goals(pool, student_id='S1'):
+    """Goals stored through goal_store, so goal_resources rows join to them"""
+    candidates = [
+        {'module_name': module, 'goal_title': title, 'goal_description': '', 'goal_type': 'academic',
+         'priority_level': 'high', 'target_completion_date': '2026-12-01', 'success_criteria': []}
+        for module, title in (('Web Development', 'Master CSS layout'), ('Operating Systems', 'Scheduling'))
+    ]
+    digests = {'Web Development': 'web-1', 'Operating Systems': 'os-1'}
+    return goal_store.sync_goals(pool, student_id, candidates, digests, inputs_version=1)['goals']
+
+
+def test_tokenize_and_goal_query():
+    assert resource_index.tokenize('Master the CSS-Grid, a layout!') == ['master', 'css', 'grid', 'layout']
+    assert resource_index.tokenize(None) == []
+
+    query = resource_index.goal_query(goal('g', 'Web Development', 'Master CSS layout'), ['CSS selectors'])
+    # Generic goal words are dropped; weak areas outweigh the title
+    assert query == {'css': 2.0, 'layout': 1.0, 'selectors': 2.0}
+
+
+def test_field_weights_order_the_ranking():
+    snapshot = CatalogSnapshot(CATALOG_ROWS, version=1)
+    index = resource_index.ResourceIndex(snapshot)
+    ranked = index.top_k({'css': 1.0}, k=3)
+    assert [int(snapshot.ids[row]) for row, _ in ranked] == [1, 2, 3]
+    assert ranked[0][1] > ranked[1][1] > ranked[2][1]
+    assert all(0 < relevance <= 1 for _, relevance in ranked)
+
+    ranked = resource_index.rank_goal_resources(snapshot, [
+        goal('web', 'Web Development', 'Master CSS layout'),
+        goal('general', goal_store.GENERAL_MODULE, 'Subnetting practice'),
+        goal('none', 'Operating Systems', 'Scheduling')
+    ], k=2)
+    # Module goals draw from their module; general goals from any matching resource
+    assert [resource_id for resource_id, _ in ranked['web']] == [1, 2]
+    assert [resource_id for resource_id, _ in ranked['general']] == [5]
+    assert ranked['none'] == []
+
+
+def test_rankings_are_stored_once_per_catalog_version():
+    pool = make_pool()
+    goals = persisted_goals(pool)
+    snapshot = CatalogSnapshot(CATALOG_ROWS, version=1)
+    loads = []
+
+    def load_feedback():
+        loads.append(1)
+        return [{'module_name': 'Web Development', 'weak_areas': '["selectors"]'}]
+
+    first = resource_index.goal_resources(pool, snapshot, 'S1', goals, load_feedback)
+    web, empty = (goal['goal_id'] for goal in goals)
+    assert first[web][0][0] == 2 and first[empty] == [] and len(loads) == 1
+
+    # Both rankings, the empty one included, are read back without ranking again
+    assert resource_index.goal_resources(pool, snapshot, 'S1', goals, load_feedback) == first
+    assert len(loads) == 1
+    with pool.connection() as conn:
+        stored = resource_index.read_goal_resources(conn, 'S1')
+    assert stored[empty] == {'version': 1, 'resources': []}
+
+    # A catalog change, or a regenerated goal, ranks again
+    resource_index.goal_resources(pool, CatalogSnapshot(CATALOG_ROWS, version=2), 'S1', goals, load_feedback)
+    assert len(loads) == 2
+    resource_index.goal_resources(pool, CatalogSnapshot(CATALOG_ROWS, version=2), 'S1', goals, load_feedback,
+                                  stale_goal_ids=[web])
+    assert len(loads) == 3
+    with pool.connection() as conn:
+        rows = conn.execute('SELECT COUNT(*) FROM goal_resources WHERE goal_id = ?', (empty,)).fetchone()[0]
+    assert rows == 1
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Resource Index Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_tokenize_and_goal_query, test_field_weights_order_the_ranking,
+                 test_rankings_are_stored_once_per_catalog_version):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,225 @@
+"""
+EduBoost Risk Engine Parity Checks
+The vectorized rule tables must score exactly like the scalar code they replaced
+
+The two reference functions below are the original if/elif implementations,
+kept verbatim. Inputs sit on and around every threshold, and scores are
+compared bit for bit (float.hex), including the int 0 of a row without any
+risk factor.
+"""
+
+import sys
+
+import numpy as np
+
+import risk_engine
+
+ROWS = 50_000
+
+# Values on, just below and just above every rule threshold
+BOUNDARY_VALUES = {
+    'avg_assessment_score': [0, 39, 39.99, 40, 49, 50, 55.5, 59, 60, 61, 100],
+    'current_gpa': [0.0, 1.9, 2.0, 2.1, 2.4999, 2.5, 3.0, 4.0],
+    'attendance_rate': [30, 59.99, 60, 74.9, 75, 90],
+    'lab_completion_rate': [0, 49, 50, 69, 70, 90],
+    'participation_score': [0, 39, 40, 80],
+    'assignments_late': [0, 1, 2, 3, 5],
+    'num_submission_attempts': [1, 3, 4, 6],
+    'login_frequency': [1, 4, 5, 9, 10, 20],
+    'failed_module': [0, 1]
+}
+
+
+def scalar_module_risk(module_data):
+    """EnhancedEduBoostAI.calculate_module_risk before risk_engine (reference)"""
+    risk_factors = []
+    risk_score = 0
+
+    # Academic performance factors
+    if module_data['avg_assessment_score'] < 40:
+        risk_factors.append('Very Low Assessment Scores')
+        risk_score += 0.3
+    elif module_data['avg_assessment_score'] < 50:
+        risk_factors.append('Low Assessment Scores')
+        risk_score += 0.2
+    elif module_data['avg_assessment_score'] < 60:
+        risk_factors.append('Below Average Assessment Scores')
+        risk_score += 0.1
+
+    # GPA factors
+    if module_data['current_gpa'] < 2.0:
+        risk_factors.append('Very Low GPA')
+        risk_score += 0.25
+    elif module_data['current_gpa'] < 2.5:
+        risk_factors.append('Low GPA')
+        risk_score += 0.15
+
+    # Behavioral factors
+    if module_data['attendance_rate'] < 60:
+        risk_factors.append('Poor Attendance')
+        risk_score += 0.2
+    elif module_data['attendance_rate'] < 75:
+        risk_factors.append('Low Attendance')
+        risk_score += 0.1
+
+    if module_data['lab_completion_rate'] < 50:
+        risk_factors.append('Poor Lab Completion')
+        risk_score += 0.15
+
+    if module_data['participation_score'] < 40:
+        risk_factors.append('Low Participation')
+        risk_score += 0.1
+
+    # Submission patterns
+    if module_data['assignments_late'] >= 3:
+        risk_factors.append('Frequent Late Submissions')
+        risk_score += 0.15
+    elif module_data['assignments_late'] >= 1:
+        risk_factors.append('Some Late Submissions')
+        risk_score += 0.05
+
+    if module_data['num_submission_attempts'] > 3:
+        risk_factors.append('Multiple Submission Attempts')
+        risk_score += 0.1
+
+    # Engagement factors
+    if module_data['login_frequency'] < 5:
+        risk_factors.append('Very Low Engagement')
+        risk_score += 0.15
+    elif module_data['login_frequency'] < 10:
+        risk_factors.append('Low Engagement')
+        risk_score += 0.1
+
+    # Failed module history
+    if module_data['failed_module'] > 0:
+        risk_factors.append('Previous Module Failure')
+        risk_score += 0.2
+
+    # Determine risk level
+    if risk_score > 0.6:
+        risk_level = 'high'
+    elif risk_score > 0.3:
+        risk_level = 'medium'
+    else:
+        risk_level = 'low'
+
+    return {
+        'risk_score': min(risk_score, 1.0),
+        'risk_level': risk_level,
+        'risk_factors': risk_factors
+    }
+
+
+def scalar_risk_score(data):
+    """calculate_risk_score before risk_engine (reference)"""
+    risk = 0
+
+    # Academic factors (40% weight)
+    if data['avg_assessment_score'] < 40:
+        risk += 0.25
+    elif data['avg_assessment_score'] < 50:
+        risk += 0.15
+    elif data['avg_assessment_score'] < 60:
+        risk += 0.10
+
+    if data['current_gpa'] < 2.0:
+        risk += 0.15
+    elif data['current_gpa'] < 2.5:
+        risk += 0.10
+
+    # Behavioral factors (35% weight)
+    if data['attendance_rate'] < 60:
+        risk += 0.15
+    elif data['attendance_rate'] < 75:
+        risk += 0.10
+
+    if data['lab_completion_rate'] < 50:
+        risk += 0.10
+    elif data['lab_completion_rate'] < 70:
+        risk += 0.05
+
+    if data['participation_score'] < 40:
+        risk += 0.10
+
+    # Submission patterns (15% weight)
+    if data['assignments_late'] >= 3:
+        risk += 0.10
+    elif data['assignments_late'] >= 1:
+        risk += 0.05
+
+    # Engagement (10% weight)
+    if data['login_frequency'] < 5:
+        risk += 0.10
+    elif data['login_frequency'] < 10:
+        risk += 0.05
+
+    # Failed module history (bonus factor)
+    if data['failed_module'] > 0:
+        risk += 0.15
+
+    return min(risk, 1.0)
+
+
+def boundary_rows(rows=ROWS, seed=0):
+    rng = np.random.default_rng(seed)
+    return {field: rng.choice(np.array(values, dtype=np.float64), rows) for field, values in BOUNDARY_VALUES.items()}
+
+
+def record(columns, i):
+    return {field: values[i].item() for field, values in columns.items()}
+
+
+def same(a, b):
+    """Equal value and type, with floats compared bit for bit"""
+    if isinstance(a, float) or isinstance(b, float):
+        return type(a) is type(b) and a.hex() == b.hex()
+    return type(a) is type(b) and a == b
+
+
+def test_module_risk_matches_scalar():
+    columns = boundary_rows()
+    records = risk_engine.module_risk_records(risk_engine.assess_module_risk(columns))
+    mismatches = []
+    for i in range(ROWS):
+        expected = scalar_module_risk(record(columns, i))
+        if records[i] != expected or not same(records[i]['risk_score'], expected['risk_score']):
+            mismatches.append(i)
+    assert not mismatches, f"{len(mismatches)} mismatches, first: {record(columns, mismatches[0])}"
+
+
+def test_risk_score_matches_scalar():
+    columns = boundary_rows(seed=1)
+    scores = risk_engine.calculate_risk_scores(columns).tolist()
+    mismatches = [i for i in range(ROWS)
+                  if float(scalar_risk_score(record(columns, i))).hex() != scores[i].hex()]
+    assert not mismatches, f"{len(mismatches)} mismatches, first: {record(columns, mismatches[0])}"
+
+
+def test_cohort_average_sums_left_to_right():
+    columns = {field: values.reshape(-1, 10) for field, values in boundary_rows(seed=2).items()}
+    cohort = risk_engine.assess_cohort(columns)
+    for student in range(0, ROWS // 10, 7):
+        total = 0
+        for score in cohort.modules.risk_scores[student].tolist():
+            total += score
+        assert (total / 10).hex() == cohort.average_risk[student].item().hex()
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Risk Engine Parity Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_module_risk_matches_scalar, test_risk_score_matches_scalar,
+                 test_cohort_average_sums_left_to_right):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    print(f"🧮 {ROWS:,} boundary-heavy rows per check")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,93 @@
+"""
+EduBoost Student Cache Checks
+Versioned lookups, expiry, eviction and cross-process invalidation
+
+Two StudentCache instances over one database stand in for two gunicorn
+workers: a write handled by one must be visible to the other on its next
+lookup, because the cache key's version is read from goal_generation.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import goal_store
+from migrations import apply_migrations
+from student_cache import StudentCache
+
+
+def make_database():
+    conn = sqlite3.connect(os.path.join(tempfile.mkdtemp(prefix='eduboost_cache_'), 'eduboost.db'))
+    apply_migrations(conn)
+    return conn
+
+
+def test_new_version_misses_and_replaces_old_entry():
+    cache = StudentCache()
+    cache.set('goals', 'S1', ['old'], version=(1, 1, 0))
+    assert cache.get('goals', 'S1', (1, 1, 0)) == ['old']
+    assert cache.get('goals', 'S1', (2, 1, 0)) is None
+
+    assert cache.get_or_compute('goals', 'S1', lambda: ['new'], version=(2, 1, 0)) == ['new']
+    stats = cache.stats()
+    assert stats['entries'] == 1 and stats['hits'] == 1 and stats['misses'] == 2, stats
+
+    # invalidate() frees the entries and keeps no per-student bookkeeping behind
+    cache.invalidate('S1')
+    assert cache.stats()['entries'] == 0 and not cache._student_keys
+
+
+def test_entries_expire_and_evict():
+    cache = StudentCache(ttl=0.05, max_entries=2)
+    cache.set('performance', 'S1', {'gpa': 3.1})
+    time.sleep(0.06)
+    assert cache.get('performance', 'S1') is None
+    assert cache.stats()['expirations'] == 1
+
+    for student in ('S1', 'S2', 'S3'):
+        cache.set('performance', student, {'gpa': 2.0})
+    assert cache.get('performance', 'S1') is None and cache.get('performance', 'S3') == {'gpa': 2.0}
+    assert cache.stats()['evictions'] == 1
+
+
+def test_write_in_one_worker_reaches_the_other():
+    conn = make_database()
+    workers = (StudentCache(), StudentCache())
+    computed = []
+
+    def lookup(worker):
+        return worker.get_or_compute('goals', 'S1', lambda: computed.append(1) or len(computed),
+                                     version=goal_store.data_version(conn, 'S1'))
+
+    assert lookup(workers[0]) == 1 and lookup(workers[1]) == 2 and lookup(workers[1]) == 2
+
+    # Feedback handled by worker 0; worker 1 never hears about it directly
+    with conn:
+        goal_store.mark_inputs_changed(conn.cursor(), ['S1'])
+    assert lookup(workers[1]) == 3
+
+    with conn:
+        goal_store.mark_progress_changed(conn.cursor(), 'S1')
+    assert lookup(workers[0]) == 4 and lookup(workers[1]) == 5
+    assert goal_store.data_version(conn, 'S1') == (1, None, 1)
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Student Cache Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_new_version_misses_and_replaces_old_entry, test_entries_expire_and_evict,
+                 test_write_in_one_worker_reaches_the_other):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,89 @@
+"""
+EduBoost Synthetic Cohort Checks
+Per-student determinism across processes, hash seeds, batches and threads
+
+A student's rows depend only on the student id: the check runs the same
+ids in a fresh interpreter with a different PYTHONHASHSEED, in other
+batches, and from several threads at once, and expects identical records.
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+
+from synthetic_cohort import generate_cohort, generate_student_records, iter_records
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+STUDENT_IDS = [f'STUD{i:04d}' for i in range(120)] + ['Ünïcode-7', 42]
+
+
+def records_by_student(cohort):
+    rows = {}
+    for record in iter_records(cohort):
+        rows.setdefault(record['student_id'], []).append(record)
+    return rows
+
+
+def test_cohort_is_identical_in_another_process():
+    code = (
+        'import json, sys\n'
+        'from synthetic_cohort import generate_cohort, iter_records\n'
+        'ids = json.loads(sys.stdin.read())\n'
+        'print(json.dumps(list(iter_records(generate_cohort(ids)))))\n'
+    )
+    hash_seed = '1' if os.environ.get('PYTHONHASHSEED') != '1' else '2'
+    output = subprocess.run(
+        [sys.executable, '-c', code], input=json.dumps(STUDENT_IDS), cwd=APP_DIR,
+        env=dict(os.environ, PYTHONHASHSEED=hash_seed), capture_output=True, text=True, check=True
+    ).stdout
+    expected = json.loads(json.dumps(list(iter_records(generate_cohort(STUDENT_IDS)))))
+    assert json.loads(output) == expected
+
+
+def test_threads_match_a_sequential_run():
+    sequential = {student_id: generate_student_records(student_id) for student_id in STUDENT_IDS}
+    results, errors = [], []
+    start = threading.Barrier(8)
+
+    def generate(seed):
+        # Each thread takes its own subset in its own order
+        ids = random.Random(seed).sample(STUDENT_IDS, 40)
+        start.wait()
+        try:
+            for _ in range(5):
+                results.append(records_by_student(generate_cohort(ids)))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=generate, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, errors
+    assert len(results) == 40
+    for rows in results:
+        for student_id, records in rows.items():
+            assert records == sequential[student_id], student_id
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("EduBoost Synthetic Cohort Checks")
+    print("=" * 60)
+
+    failed = 0
+    for test in (test_cohort_is_identical_in_another_process, test_threads_match_a_sequential_run):
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+
+    print("=" * 60)
+    sys.exit(1 if failed else 0)